@@ -1,9 +1,13 @@
 import json
+import math
 from abc import ABC, abstractmethod
 from typing import Union, List, Dict
 
 from fastapi_core.utils.app_dependencies_abc import AppDependenciesABC
 
+# The time_budget_seconds of dump_prefix and flush_for_namespace that remove all keys, whatever the driver default
+NO_TIME_BUDGET = math.inf
+
 
 class CacheDriverABC(AppDependenciesABC, ABC):
     def __init__(self, namespace_prefix: str = ""):
@@ -54,9 +58,9 @@ class CacheDriverABC(AppDependenciesABC, ABC):
         """Not Implemented"""
 
     @abstractmethod
-    async def dump_prefix(self, key_prefix: str) -> None:
+    async def dump_prefix(self, key_prefix: str, time_budget_seconds: float | None = None) -> None:
         """Not Implemented"""
 
     @abstractmethod
-    async def flush_for_namespace(self) -> None:
+    async def flush_for_namespace(self, time_budget_seconds: float | None = None) -> None:
         """Not Implemented"""
@@ -64,7 +64,7 @@ class InMemoryCacheDriver(CacheDriverABC, AppDependenciesABC):
 
         return None
 
-    async def dump_prefix(self, key_prefix: str) -> None:
+    async def dump_prefix(self, key_prefix: str, time_budget_seconds: float | None = None) -> None:
         key_prefix = self.get_key_for_namespace(key_prefix)
 
         for key in list(self._memory.keys()):
@@ -73,7 +73,7 @@ class InMemoryCacheDriver(CacheDriverABC, AppDependenciesABC):
 
         return None
 
-    async def flush_for_namespace(self) -> None:
+    async def flush_for_namespace(self, time_budget_seconds: float | None = None) -> None:
         self._memory = {}
 
     def __str__(self):
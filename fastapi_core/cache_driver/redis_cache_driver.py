@@ -1,29 +1,94 @@
-from typing import List, Dict
+import re
+import time
+from typing import AsyncIterator, List, Dict
 
-import redis
+import redis.asyncio as redis
 from loguru import logger
 
-from fastapi_core.cache_driver.cache_driver_abc import CacheDriverABC
+from fastapi_core.cache_driver.cache_driver_abc import NO_TIME_BUDGET, CacheDriverABC
 from fastapi_core.utils.app_dependencies_abc import AppDependenciesABC
 
+# The small UNLINK commands let Redis serve the other clients between them
+UNLINK_KEYS_PER_COMMAND = 100
+
 
 class RedisCacheDriver(CacheDriverABC, AppDependenciesABC):
     def __init__(
-        self, host: str = "localhost", port: int = 6379, password: str | None = None, namespace_prefix: str = ""
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        password: str | None = None,
+        namespace_prefix: str = "",
+        max_connections: int = 50,
+        pool_timeout: float | None = 5,
+        socket_timeout: float | None = 5,
+        socket_connect_timeout: float | None = 5,
+        health_check_interval: int = 30,
+        scan_count: int = 1000,
+        unlink_batch_size: int = 1000,
+        invalidation_time_budget_seconds: float | None = None,
     ):
+        """
+        Cache driver on the asyncio client of Redis, the commands do not block the event loop
+        :param max_connections: The max number of connections of pool, shared by all requests of the worker
+        :param pool_timeout: The seconds that a command wait a free connection when the pool is full, None wait forever
+        :param socket_timeout: The seconds that a command wait the response of Redis
+        :param socket_connect_timeout: The seconds to open a connection
+        :param health_check_interval: The seconds without use after which a connection is checked (PING) before use
+        :param scan_count: The COUNT hint of each SCAN, the number of keys inspected per round-trip
+        :param unlink_batch_size: The number of keys removed per pipeline by dump_prefix and flush_for_namespace
+        :param invalidation_time_budget_seconds: The default max seconds of dump_prefix and flush_for_namespace, the
+                                                 keys not removed in time expire by TTL, None remove all keys. The
+                                                 invalidations of CachedRepository always remove all keys
+        """
         super().__init__(namespace_prefix=namespace_prefix)
-        self.redis = redis.Redis(host=host, port=port, password=password)
+        self.connection_pool = redis.BlockingConnectionPool(
+            host=host,
+            port=port,
+            password=password,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout,
+            health_check_interval=health_check_interval,
+        )
+        self.redis = redis.Redis(connection_pool=self.connection_pool)
+        self.scan_count = scan_count
+        self.unlink_batch_size = unlink_batch_size
+        self.invalidation_time_budget_seconds = invalidation_time_budget_seconds
 
     async def is_ready(self) -> bool:
         try:
-            self.redis.ping()
+            await self.redis.ping()
             return True
         except Exception:
             return False
 
+    async def close(self) -> None:
+        """
+        Close the connections of pool, example: in the shutdown of app
+        """
+        await self.redis.aclose()
+        await self.connection_pool.disconnect()
+
+    def _key_pattern(self, key_prefix: str) -> str:
+        """
+        :return: The SCAN pattern of keys with prefix, the glob characters of prefix are escaped
+        """
+        return re.sub(r"([\\*?\[\]])", r"\\\1", self.get_key_for_namespace(key_prefix)) + "*"
+
+    async def iter_keys(self, key_prefix: str = "") -> AsyncIterator[bytes]:
+        """
+        Iterate the keys of namespace with SCAN, each round-trip inspect scan_count keys without block Redis
+        :param key_prefix: Only the keys with this prefix, after the namespace
+        :return: AsyncIterator of keys with namespace
+        """
+        async for key in self.redis.scan_iter(match=self._key_pattern(key_prefix), count=self.scan_count):
+            yield key
+
     async def keys(self) -> List[str]:
         try:
-            return self.redis.keys(pattern=self.namespace_prefix + ":*")
+            return [key async for key in self.iter_keys()]
 
         except Exception as exc:
             logger.error(f"Error in RedisCacheDriver - Error in get keys - Exception = {exc}")
@@ -31,7 +96,7 @@ class RedisCacheDriver(CacheDriverABC, AppDependenciesABC):
 
     async def get(self, key: str) -> bytes | None:
         try:
-            return self.redis.get(name=self.get_key_for_namespace(key))
+            return await self.redis.get(name=self.get_key_for_namespace(key))
         except Exception as exc:
             logger.error(f"Error in RedisCacheDriver - Error in get value for key={key} - Exception = {exc}")
             return None
@@ -39,7 +104,7 @@ class RedisCacheDriver(CacheDriverABC, AppDependenciesABC):
     async def get_many(self, keys: List[str]) -> Dict[str, bytes]:
         result_dict = dict()
         try:
-            result_list = self.redis.mget(keys=self.get_keys_for_namespace(keys))
+            result_list = await self.redis.mget(keys=self.get_keys_for_namespace(keys))
             for key, result in zip(keys, result_list):
                 if result is not None:
                     result_dict[key] = result
@@ -50,16 +115,16 @@ class RedisCacheDriver(CacheDriverABC, AppDependenciesABC):
 
     async def set(self, key: str, value, seconds_for_expire: int = 600):
         try:
-            self.redis.set(name=self.get_key_for_namespace(key), value=value, ex=seconds_for_expire)
+            await self.redis.set(name=self.get_key_for_namespace(key), value=value, ex=seconds_for_expire)
         except Exception as exc:
             logger.error(f"Error in RedisCacheDriver - Error in set key={key} - Exception = {exc}")
 
     async def set_many(self, mapped_data: Dict[str, str], seconds_for_expire: int = 600) -> None:
         try:
-            pipeline = self.redis.pipeline()
-            for key, value in mapped_data.items():
-                pipeline.set(name=self.get_key_for_namespace(key), value=value, ex=seconds_for_expire)
-            pipeline.execute()
+            async with self.redis.pipeline(transaction=False) as pipeline:
+                for key, value in mapped_data.items():
+                    pipeline.set(name=self.get_key_for_namespace(key), value=value, ex=seconds_for_expire)
+                await pipeline.execute()
         except Exception as exc:
             logger.error(f"Error in RedisCacheDriver - Error in set multiple - Exception = {exc}")
 
@@ -69,24 +134,72 @@ class RedisCacheDriver(CacheDriverABC, AppDependenciesABC):
         except Exception as exc:
             logger.error(f"Error in RedisCacheDriver - Error in dump value for key={key} - Exception = {exc}")
 
-    async def dump_prefix(self, key_prefix: str):
+    async def dump_prefix(self, key_prefix: str, time_budget_seconds: float | None = None):
+        """
+        Remove the keys with prefix with SCAN and UNLINK in batches
+        :param key_prefix: The prefix of keys, after the namespace
+        :param time_budget_seconds: The max seconds of call, default is invalidation_time_budget_seconds,
+                                    NO_TIME_BUDGET remove all keys
+        """
         try:
-            keys_for_namespace = self.redis.keys(pattern=self.get_key_for_namespace(key_prefix + "*"))
-
-            await self.redis.delete(*keys_for_namespace)
+            await self.__unlink_keys(key_prefix=key_prefix, time_budget_seconds=time_budget_seconds)
         except Exception as exc:
             logger.error(
                 f"Error in RedisCacheDriver - Error in dump values for key_prefix={key_prefix} - Exception = {exc}"
             )
 
-    async def flush_for_namespace(self) -> None:
+    async def flush_for_namespace(self, time_budget_seconds: float | None = None) -> None:
+        """
+        Remove all keys of namespace with SCAN and UNLINK in batches
+        :param time_budget_seconds: The max seconds of call, default is invalidation_time_budget_seconds,
+                                    NO_TIME_BUDGET remove all keys
+        """
         try:
-            keys_for_namespace = self.redis.keys(pattern=self.namespace_prefix + ":*")
-
-            await self.redis.delete(*keys_for_namespace)
+            await self.__unlink_keys(key_prefix="", time_budget_seconds=time_budget_seconds)
 
         except Exception as exc:
             logger.error(f"Error in RedisCacheDriver - Error in flush_for_namespace - Exception = {exc}")
 
+    async def __unlink_keys(self, key_prefix: str, time_budget_seconds: float | None) -> int:
+        """
+        The deadline is checked after each SCAN, so the pages without keys of prefix also consume the time budget
+        :return: The number of keys removed
+        """
+        if time_budget_seconds is None:
+            time_budget_seconds = self.invalidation_time_budget_seconds
+
+        if time_budget_seconds is None or time_budget_seconds == NO_TIME_BUDGET:
+            deadline = None
+        else:
+            deadline = time.monotonic() + time_budget_seconds
+        pattern = self._key_pattern(key_prefix)
+        cursor, batch, removed = 0, [], 0
+
+        while True:
+            cursor, keys = await self.redis.scan(cursor=cursor, match=pattern, count=self.scan_count)
+            batch.extend(keys)
+            out_of_time = deadline is not None and time.monotonic() > deadline
+
+            if batch and (len(batch) >= self.unlink_batch_size or cursor == 0 or out_of_time):
+                removed += await self.__unlink(batch)
+                batch = []
+
+            if cursor == 0:
+                return removed
+
+            if out_of_time:
+                logger.warning(
+                    f"RedisCacheDriver - The time budget of {time_budget_seconds}s finished removing the keys with "
+                    f"key_prefix={key_prefix}, removed = {removed}, the others expire by TTL"
+                )
+                return removed
+
+    async def __unlink(self, keys: list[bytes]) -> int:
+        async with self.redis.pipeline(transaction=False) as pipeline:
+            for index in range(0, len(keys), UNLINK_KEYS_PER_COMMAND):
+                pipeline.unlink(*keys[index : index + UNLINK_KEYS_PER_COMMAND])
+
+            return sum(await pipeline.execute())
+
     def __str__(self):
         return "RedisCacheDriver"
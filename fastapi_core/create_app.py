@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from dependency_injector.containers import Container
 from fastapi import APIRouter, FastAPI
@@ -18,6 +19,9 @@ from fastapi_core.settings import AppSettings
 from fastapi_core.utils.app_dependencies_abc import AppDependenciesABC
 from fastapi_core.utils.exceptions import InternalErrorSchema
 
+if TYPE_CHECKING:
+    from fastapi_core.database import Database
+
 
 class HelperRoutersEnum(Enum):
     migration = run_migrations_router
@@ -33,6 +37,7 @@ def fast_api_create_app(
     helper_routers: tuple[HelperRoutersEnum, ...] = (),
     context_plugins: tuple[Plugin, ...] = (),
     dependencies: tuple[AppDependenciesABC, ...] = (),
+    unit_of_work_database: "Database" = None,
 ) -> FastAPI:
     logger.info(f"Creating FastAPI app ...")
     # Create FastAPI
@@ -64,6 +69,13 @@ def fast_api_create_app(
     # Add AppMiddleware
     app.add_middleware(AppMiddleware, is_environment_local=AppSettings().is_local())
 
+    # Add UnitOfWorkMiddleware (one session per request shared by repositories and committed once in the end)
+    # Inside RawContextMiddleware to store the UnitOfWork in context
+    if unit_of_work_database:
+        from fastapi_core.middleware.unit_of_work_middleware import UnitOfWorkMiddleware
+
+        app.add_middleware(UnitOfWorkMiddleware, database=unit_of_work_database)
+
     # Add AppMiddleware
     app.add_middleware(
         RawContextMiddleware,
@@ -99,4 +111,17 @@ def fast_api_create_app(
     for dependency in dependencies:
         readiness_service.add_dependency(dependency)
 
+    # Close the dependencies that have close (example: the pool of RedisCacheDriver) in the shutdown of app
+    async def close_dependencies():
+        for dependency in dependencies:
+            if not hasattr(dependency, "close"):
+                continue
+
+            try:
+                await dependency.close()
+            except Exception as exc:
+                logger.error(f"Error closing dependency {dependency} - Exception = {exc}")
+
+    app.add_event_handler("shutdown", close_dependencies)
+
     return app
@@ -1 +1,3 @@
 from .database import Database, AsyncSessionManager
+from .pool import PoolOptions, PoolStatus
+from .replicas import BalanceStrategy, ReplicaStatus
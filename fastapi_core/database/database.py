@@ -5,8 +5,16 @@ from enum import Enum
 from loguru import logger
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.pool import NullPool
 
+from fastapi_core.database.pool import PoolOptions, PoolStatus
+from fastapi_core.database.replicas import (
+    POSTGRES_REPLICATION_LAG_STATEMENT,
+    BalanceStrategy,
+    ReadReplica,
+    ReplicaSet,
+    ReplicaStatus,
+)
+from fastapi_core.database.unit_of_work import get_unit_of_work
 from fastapi_core.utils.app_dependencies_abc import AppDependenciesABC
 
 
@@ -30,33 +38,79 @@ class Database(AppDependenciesABC):
     def __init__(
         self,
         db_url: str,
-        db_url_read_only: str = None,
+        db_url_read_only: str | list[str] = None,
         echo_queries: bool = False,
+        pool_options: PoolOptions | dict = None,
+        read_only_pool_options: PoolOptions | dict = None,
+        replica_strategy: BalanceStrategy = BalanceStrategy.ROUND_ROBIN,
+        max_replication_lag_seconds: float = None,
+        replication_lag_statement: str = POSTGRES_REPLICATION_LAG_STATEMENT,
+        replica_health_check_interval_seconds: float = 30.0,
         *args,
         **kwargs,
     ) -> None:
+        """
+        :param db_url: The url of master database
+        :param db_url_read_only: The url or the list of urls of read only databases
+        :param echo_queries: Log all queries executed
+        :param pool_options: The PoolOptions of master engine, use PoolOptions(use_null_pool=True) behind PgBouncer
+        :param read_only_pool_options: The PoolOptions of read only engines, when None use pool_options
+        :param replica_strategy: The BalanceStrategy used to balance the sessions between read only databases
+        :param max_replication_lag_seconds: Eject the read only database with lag greater than it, None do not check
+        :param replication_lag_statement: The statement that return the replication lag in seconds
+        :param replica_health_check_interval_seconds: The interval between health checks of read only databases
+        """
+        pool_options = self.__to_pool_options(pool_options)
+        read_only_pool_options = (
+            self.__to_pool_options(read_only_pool_options) if read_only_pool_options else pool_options
+        )
+
+        self._connections = defaultdict(lambda: {})
+
         logger.info("Starting database...")
         logger.info(f"Connecting in {DatabaseRole.MASTER}...")
         self._connections[DatabaseRole.MASTER] = self.__init_engine(
-            *args, db_url=db_url, echo_queries=echo_queries, **kwargs
+            *args, db_url=db_url, echo_queries=echo_queries, pool_options=pool_options, **kwargs
         )
 
-        if db_url_read_only:
+        if isinstance(db_url_read_only, str):
+            db_url_read_only = [db_url_read_only]
+
+        read_only_engines = []
+        for url in db_url_read_only or []:
             logger.info(f"Connecting in {DatabaseRole.REAL_ONLY}...")
-            self._connections[DatabaseRole.REAL_ONLY] = self.__init_engine(
-                *args, db_url=db_url_read_only, echo_queries=echo_queries, **kwargs
+            read_only_engines.append(
+                self.__init_engine(
+                    *args, db_url=url, echo_queries=echo_queries, pool_options=read_only_pool_options, **kwargs
+                )
             )
 
+        if read_only_engines:
+            self._connections[DatabaseRole.REAL_ONLY] = read_only_engines[0]
+
+        self._replicas = ReplicaSet(
+            engines=read_only_engines,
+            strategy=replica_strategy,
+            max_replication_lag_seconds=max_replication_lag_seconds,
+            replication_lag_statement=replication_lag_statement,
+            health_check_interval_seconds=replica_health_check_interval_seconds,
+        )
+
     @classmethod
-    def __init_engine(cls, db_url: str, echo_queries: bool, *args, **kwargs) -> AsyncEngine:
+    def __to_pool_options(cls, pool_options: PoolOptions | dict | None) -> PoolOptions:
+        if isinstance(pool_options, PoolOptions):
+            return pool_options
+
+        return PoolOptions(**(pool_options or {}))
+
+    @classmethod
+    def __init_engine(cls, db_url: str, echo_queries: bool, pool_options: PoolOptions, *args, **kwargs) -> AsyncEngine:
         return create_async_engine(
             *args,
             db_url,
             echo=echo_queries,
             future=True,
-            pool_pre_ping=True,
-            poolclass=NullPool,
-            **kwargs,
+            **{**pool_options.to_engine_kwargs(), **kwargs},
         )
 
     @classmethod
@@ -67,7 +121,7 @@ class Database(AppDependenciesABC):
         )
 
     def __has_read_only(self) -> bool:
-        if self._connections.get(DatabaseRole.REAL_ONLY):
+        if self._replicas:
             return True
         return False
 
@@ -75,10 +129,36 @@ class Database(AppDependenciesABC):
         return self.__init_async_session(self._connections[DatabaseRole.MASTER])
 
     def get_read_only_session(self) -> AsyncSession | None:
+        """
+        The session is outstanding in the replica until it is closed, close it (async with) after use
+        """
         if self.__has_read_only():
-            return self.__init_async_session(self._connections[DatabaseRole.REAL_ONLY])
+            replica = self._replicas.choose()
+            if replica:
+                async_session = self.__init_async_session(replica.engine)
+                replica.checkout()
+                self.__checkin_on_close(async_session=async_session, replica=replica)
+                return async_session
+            return self.get_master_session()
         return None
 
+    @classmethod
+    def __checkin_on_close(cls, async_session: AsyncSession, replica: ReadReplica) -> None:
+        close = async_session.close
+        checked_in = False
+
+        async def close_and_checkin() -> None:
+            nonlocal checked_in
+            try:
+                await close()
+            finally:
+                # The session can be closed more than once, the replica is checked in only in the first
+                if not checked_in:
+                    checked_in = True
+                    replica.checkin()
+
+        async_session.close = close_and_checkin
+
     @asynccontextmanager
     async def factory_async_session_manager(self, read_only: bool = False) -> type[AsyncSessionManager]:
         # """
@@ -86,14 +166,20 @@ class Database(AppDependenciesABC):
         # :param read_only:
         # :return:  AsyncSession
         # """
+        if unit_of_work := get_unit_of_work(database=self):
+            # Inside a request with UnitOfWork all sessions are the same, commit and rollback are made in the end
+            async with unit_of_work.use_session() as session:
+                yield session
+            return
+
+        replica: ReadReplica | None = self._replicas.choose() if read_only and self.__has_read_only() else None
         async_session = self.__init_async_session(
-            bind=(
-                self._connections[DatabaseRole.REAL_ONLY]
-                if read_only and self.__has_read_only()
-                else self._connections[DatabaseRole.MASTER]
-            )
+            bind=replica.engine if replica else self._connections[DatabaseRole.MASTER]
         )
 
+        if replica:
+            replica.checkout()
+
         try:
             yield async_session
         except Exception:
@@ -101,15 +187,48 @@ class Database(AppDependenciesABC):
             await async_session.rollback()
             raise
         finally:
-            await async_session.close()
+            try:
+                await async_session.close()
+            finally:
+                if replica:
+                    replica.checkin()
+
+    def get_pool_status(self, read_only: bool = False) -> PoolStatus | None:
+        """
+        Return the utilization and the checkout wait time of the engine pool
+        :param read_only: When True return the status of the first read only engine, see get_replicas_status
+        :return: PoolStatus | None when the engine do not exist
+        """
+        engine = self._connections.get(DatabaseRole.REAL_ONLY if read_only else DatabaseRole.MASTER)
+
+        if not engine:
+            return None
+
+        return PoolStatus.from_pool(engine.pool)
+
+    def get_replicas_status(self) -> list[ReplicaStatus]:
+        """
+        Return the health, the replication lag and the counters of sessions of each read only database
+        """
+        return self._replicas.status()
+
+    async def dispose(self) -> None:
+        await self._connections[DatabaseRole.MASTER].dispose()
+
+        for replica in self._replicas.replicas:
+            await replica.engine.dispose()
 
     async def is_ready(self) -> bool:
+        """
+        Check master and the read only databases, the unhealthy read only databases are ejected until the next check
+        and the reads fall back to master, so only master makes the database not ready
+        """
         try:
             async with self.factory_async_session_manager() as session:
                 await session.scalar(self.IS_READY_STATEMENT)
 
-            async with self.factory_async_session_manager(read_only=True) as session:
-                await session.scalar(self.IS_READY_STATEMENT)
+            if self.__has_read_only() and not await self._replicas.check_health():
+                logger.warning("Database | None read only database is healthy, reads are using master")
 
             return True
 
@@ -0,0 +1,117 @@
+import dataclasses
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+
+
+@dataclasses.dataclass
+class PoolOptions:
+    """
+    Options of the connection pool of one engine
+    :param use_null_pool: Open and close one connection per session, use it behind PgBouncer
+    :param pool_size: The number of connections kept open in the pool
+    :param max_overflow: The number of connections allowed beyond pool_size
+    :param pool_recycle: Seconds after which a connection is recycled
+    :param pool_timeout: Seconds waiting for a connection before raising TimeoutError
+    :param pool_pre_ping: Test the connection on checkout
+    """
+
+    use_null_pool: bool = False
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_recycle: int = 1800
+    pool_timeout: float = 30.0
+    pool_pre_ping: bool = True
+
+    def to_engine_kwargs(self) -> dict:
+        if self.use_null_pool:
+            return {"poolclass": NullPool, "pool_pre_ping": self.pool_pre_ping}
+
+        return {
+            "poolclass": MonitoredAsyncAdaptedQueuePool,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_recycle": self.pool_recycle,
+            "pool_timeout": self.pool_timeout,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+
+
+@dataclasses.dataclass
+class PoolCheckoutStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        self.checkouts += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+
+
+class MonitoredAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that measures how long each checkout waits for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = PoolCheckoutStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.checkout_stats.record_timeout()
+            raise
+
+        self.checkout_stats.record_checkout(time.perf_counter() - start)
+        return connection
+
+
+@dataclasses.dataclass
+class PoolStatus:
+    pooled: bool
+    size: int = 0
+    max_overflow: int = 0
+    checked_out: int = 0
+    checked_in: int = 0
+    overflow: int = 0
+    utilization: float = 0.0
+    checkouts: int = 0
+    timeouts: int = 0
+    avg_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @classmethod
+    def from_pool(cls, pool: Pool) -> "PoolStatus":
+        if not isinstance(pool, QueuePool):
+            return cls(pooled=False)
+
+        max_overflow = max(pool._max_overflow, 0)
+        capacity = pool.size() + max_overflow
+        checked_out = pool.checkedout()
+        stats: PoolCheckoutStats = getattr(pool, "checkout_stats", PoolCheckoutStats())
+
+        return cls(
+            pooled=True,
+            size=pool.size(),
+            max_overflow=max_overflow,
+            checked_out=checked_out,
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            utilization=checked_out / capacity if capacity else 0.0,
+            checkouts=stats.checkouts,
+            timeouts=stats.timeouts,
+            avg_wait_seconds=stats.avg_wait_seconds,
+            max_wait_seconds=stats.max_wait_seconds,
+        )
@@ -0,0 +1,171 @@
+import asyncio
+import dataclasses
+import itertools
+import time
+from enum import Enum
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from fastapi_core.database.pool import PoolStatus
+
+# The time since the last transaction replayed only is lag while the replica has WAL to replay, otherwise a replica
+# caught up of a primary without writes would be ejected
+POSTGRES_REPLICATION_LAG_STATEMENT = (
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM (NOW() - pg_last_xact_replay_timestamp())), 0) END"
+)
+
+
+class BalanceStrategy(str, Enum):
+    ROUND_ROBIN = "round_robin"
+    LEAST_OUTSTANDING = "least_outstanding"
+
+
+@dataclasses.dataclass
+class ReplicaStatus:
+    name: str
+    healthy: bool
+    replication_lag_seconds: float | None
+    sessions: int
+    outstanding: int
+    failed_health_checks: int
+    pool: PoolStatus
+
+
+class ReadReplica:
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.name = engine.url.render_as_string(hide_password=True)
+        self.healthy = True
+        self.replication_lag_seconds: float | None = None
+        self.sessions = 0
+        self.outstanding = 0
+        self.failed_health_checks = 0
+
+    def checkout(self) -> None:
+        self.sessions += 1
+        self.outstanding += 1
+
+    def checkin(self) -> None:
+        self.outstanding -= 1
+
+    def status(self) -> ReplicaStatus:
+        return ReplicaStatus(
+            name=self.name,
+            healthy=self.healthy,
+            replication_lag_seconds=self.replication_lag_seconds,
+            sessions=self.sessions,
+            outstanding=self.outstanding,
+            failed_health_checks=self.failed_health_checks,
+            pool=PoolStatus.from_pool(self.engine.pool),
+        )
+
+
+class ReplicaSet:
+    IS_READY_STATEMENT = text("SELECT 1")
+
+    def __init__(
+        self,
+        engines: list[AsyncEngine],
+        strategy: BalanceStrategy = BalanceStrategy.ROUND_ROBIN,
+        max_replication_lag_seconds: float = None,
+        replication_lag_statement: str = POSTGRES_REPLICATION_LAG_STATEMENT,
+        health_check_interval_seconds: float = 30.0,
+    ):
+        """
+        Balance the read only sessions between the replicas and eject the unhealthy ones
+        :param engines: The engines of each replica
+        :param strategy: The BalanceStrategy used to choose the replica of each session
+        :param max_replication_lag_seconds: Eject the replica with lag greater than it, when None do not check lag
+        :param replication_lag_statement: The statement that return the replication lag in seconds
+        :param health_check_interval_seconds: The interval between the health checks made in background
+        """
+        self.replicas = [ReadReplica(engine=engine) for engine in engines]
+        self.strategy = strategy
+        self.max_replication_lag_seconds = max_replication_lag_seconds
+        self.replication_lag_statement = text(replication_lag_statement)
+        self.health_check_interval_seconds = health_check_interval_seconds
+
+        self._round_robin = itertools.count()
+        self._using_master = False
+        self._last_health_check = time.monotonic()
+        self._health_check_task: asyncio.Task | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self) -> ReadReplica | None:
+        """
+        Choose the replica of the next session, when none is healthy return None to fall back to master
+        """
+        self.__schedule_health_check()
+
+        healthy_replicas = [replica for replica in self.replicas if replica.healthy]
+
+        # The fall back is logged only when it starts and ends, not in each read
+        if not healthy_replicas:
+            if self.replicas and not self._using_master:
+                logger.warning("ReplicaSet | None read only database is healthy, using master")
+                self._using_master = True
+            return None
+
+        if self._using_master:
+            logger.info("ReplicaSet | A read only database is healthy again, using read only databases")
+            self._using_master = False
+
+        if self.strategy == BalanceStrategy.LEAST_OUTSTANDING:
+            return min(healthy_replicas, key=lambda replica: (replica.outstanding, replica.sessions))
+
+        return healthy_replicas[next(self._round_robin) % len(healthy_replicas)]
+
+    async def __check_replica(self, replica: ReadReplica) -> None:
+        try:
+            async with replica.engine.connect() as connection:
+                await connection.scalar(self.IS_READY_STATEMENT)
+
+                if self.max_replication_lag_seconds is not None:
+                    replica.replication_lag_seconds = float(await connection.scalar(self.replication_lag_statement))
+
+            healthy = (
+                self.max_replication_lag_seconds is None
+                or replica.replication_lag_seconds <= self.max_replication_lag_seconds
+            )
+
+        except Exception as exc:
+            logger.error(f"ReplicaSet | Error in health check of {replica.name} - Exception = {exc}")
+            healthy = False
+
+        if not healthy:
+            replica.failed_health_checks += 1
+
+        if replica.healthy != healthy:
+            logger.warning(f"ReplicaSet | {replica.name} is {'healthy' if healthy else 'ejected'}")
+
+        replica.healthy = healthy
+
+    async def check_health(self) -> bool:
+        """
+        Check all replicas and eject the ones that are not ready or exceed the replication lag
+        :return: True when at least one replica is healthy
+        """
+        self._last_health_check = time.monotonic()
+        await asyncio.gather(*[self.__check_replica(replica) for replica in self.replicas])
+        return any(replica.healthy for replica in self.replicas)
+
+    def __schedule_health_check(self) -> None:
+        if self._health_check_task and not self._health_check_task.done():
+            return
+
+        if time.monotonic() - self._last_health_check < self.health_check_interval_seconds:
+            return
+
+        try:
+            self._health_check_task = asyncio.get_running_loop().create_task(self.check_health())
+        except RuntimeError:
+            # Out of event loop, the health check runs in the next choose inside the loop
+            return
+
+    def status(self) -> list[ReplicaStatus]:
+        return [replica.status() for replica in self.replicas]
@@ -0,0 +1,27 @@
+from starlette_context import context
+
+WROTE_IN_MASTER_CONTEXT_KEY = "database_wrote_in_master"
+WRITES_IN_MASTER_CONTEXT_KEY = "database_writes_in_master"
+
+
+def mark_wrote_in_master() -> None:
+    """
+    Mark that the current request wrote in master, so the next reads of this request use master (read-after-write)
+    """
+    if context.exists():
+        context[WROTE_IN_MASTER_CONTEXT_KEY] = True
+        context[WRITES_IN_MASTER_CONTEXT_KEY] = context.get(WRITES_IN_MASTER_CONTEXT_KEY, 0) + 1
+
+
+def wrote_in_master() -> bool:
+    """
+    :return: True when the current request already wrote in master
+    """
+    return context.exists() and context.get(WROTE_IN_MASTER_CONTEXT_KEY, False)
+
+
+def writes_in_master() -> int:
+    """
+    :return: The number of writes in master of the current request, example: to forget the reads made before a write
+    """
+    return context.get(WRITES_IN_MASTER_CONTEXT_KEY, 0) if context.exists() else 0
@@ -0,0 +1,135 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette_context import context
+
+if TYPE_CHECKING:
+    from fastapi_core.database.database import Database
+
+UNIT_OF_WORK_CONTEXT_KEY = "database_unit_of_work"
+UNIT_OF_WORK_SESSION_INFO_KEY = "unit_of_work"
+
+
+class UnitOfWork:
+    def __init__(self, database: "Database"):
+        """
+        Share one master session between all repositories of a request and commit once in the end.
+        All reads of the request use this master session, including the read_only ones, so they see the writes not
+        committed yet and the read replicas are not used while the UnitOfWork is open.
+        After commit, rollback or close the UnitOfWork is finished, the sessions opened after it (example: the writes
+        of BackgroundTasks, that run after the commit of response) are the sessions of Database with one commit per
+        call
+        :param database: The Database of the session, the session is only opened in the first use
+        """
+        self.database = database
+        self.finished = False
+        self._session: AsyncSession | None = None
+        self._lock = asyncio.Lock()
+        self._owner: asyncio.Task | None = None
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self.database.get_master_session()
+            self._session.info[UNIT_OF_WORK_SESSION_INFO_KEY] = True
+
+        return self._session
+
+    @asynccontextmanager
+    async def use_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Use the session alone, AsyncSession do not support concurrent operations, so the tasks of request that use
+        the session at the same time (example: asyncio.gather of repository calls) wait their turn.
+        The task that is using the session can use it again (nested)
+        """
+        task = asyncio.current_task()
+
+        if self._owner is task:
+            yield self.session
+            return
+
+        async with self._lock:
+            self._owner = task
+            try:
+                yield self.session
+            finally:
+                self._owner = None
+
+    def add_after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """
+        Run the callback after the commit of UnitOfWork, example: invalidate a cache when the writes are visible
+        The callbacks are discarded by rollback and close
+        """
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        self.finished = True
+        if self._session is not None:
+            await self._session.commit()
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception:
+                # The commit is done, the error of a callback do not fail the request
+                logger.exception("UnitOfWork | Error in callback after commit")
+
+    async def rollback(self) -> None:
+        self.finished = True
+        self._after_commit = []
+        if self._session is not None:
+            logger.info("UnitOfWork | Executing rollback ...")
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        self.finished = True
+        self._after_commit = []
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def begin_in_request(self) -> None:
+        context[UNIT_OF_WORK_CONTEXT_KEY] = self
+
+
+def get_unit_of_work(database: "Database") -> UnitOfWork | None:
+    """
+    :return: The UnitOfWork of current request for the database or None when it do not exist or is finished
+    """
+    unit_of_work = get_current_unit_of_work()
+
+    if unit_of_work and unit_of_work.database is database:
+        return unit_of_work
+
+    return None
+
+
+def is_unit_of_work_session(session: AsyncSession) -> bool:
+    return session.info.get(UNIT_OF_WORK_SESSION_INFO_KEY, False)
+
+
+def get_current_unit_of_work() -> UnitOfWork | None:
+    """
+    :return: The UnitOfWork of current request, of any database, or None when it do not exist or is finished
+    """
+    if not context.exists():
+        return None
+
+    unit_of_work: UnitOfWork | None = context.get(UNIT_OF_WORK_CONTEXT_KEY)
+
+    if unit_of_work and not unit_of_work.finished:
+        return unit_of_work
+
+    return None
+
+
+def in_unit_of_work() -> bool:
+    """
+    :return: True when the current request has a UnitOfWork, of any database
+    """
+    return get_current_unit_of_work() is not None
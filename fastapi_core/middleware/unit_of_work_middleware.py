@@ -0,0 +1,58 @@
+from http import HTTPStatus
+
+from loguru import logger
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from fastapi_core.database import Database
+from fastapi_core.database.unit_of_work import UnitOfWork
+from fastapi_core.utils.exceptions import InternalErrorSchema
+
+
+class UnitOfWorkMiddleware(BaseHTTPMiddleware):
+    def __init__(self, database: Database, *args, **kwargs):
+        """
+        Open a UnitOfWork per request, commit when the response is success and rollback when is error
+        The reads of request use the master session of UnitOfWork, the read replicas are not used in the request
+        Should be inside RawContextMiddleware, because the UnitOfWork is stored in the request context
+        :param database: The Database shared by repositories in the request
+        """
+        super().__init__(*args, **kwargs)
+        self.database = database
+
+    async def dispatch(self, request: Request, call_next):
+        unit_of_work = UnitOfWork(database=self.database)
+        unit_of_work.begin_in_request()
+
+        try:
+            response = await call_next(request)
+
+            if response.status_code < HTTPStatus.BAD_REQUEST:
+                await unit_of_work.commit()
+            else:
+                await unit_of_work.rollback()
+
+        except Exception:
+            logger.exception("Error in UnitOfWork")
+            await unit_of_work.rollback()
+            await unit_of_work.close()
+
+            return JSONResponse(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                content=InternalErrorSchema().dict(),
+            )
+
+        # The session is closed only after the body, because a StreamingResponse can still read with it.
+        # The UnitOfWork is finished, so the background tasks commit their own writes
+        body_iterator = response.body_iterator
+
+        async def close_after_body():
+            try:
+                async for chunk in body_iterator:
+                    yield chunk
+            finally:
+                await unit_of_work.close()
+
+        response.body_iterator = close_after_body()
+        return response
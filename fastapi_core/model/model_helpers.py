@@ -1,19 +1,19 @@
+from sqlalchemy import inspect
 from sqlmodel import SQLModel
 
 
 class ModelHelpers(SQLModel):
     def update_values(self, ignore_fields_not_exist: bool = False, **kwargs):
-        for key, value in kwargs.items():
-            try:
-                setattr(self, key, value)
-            except ValueError:
-                if ignore_fields_not_exist:
-                    continue
-                else:
-                    raise
+        self.update_values_from_dict(update=kwargs, ignore_fields_not_exist=ignore_fields_not_exist)
 
     def update_values_from_dict(self, update: dict, ignore_fields_not_exist: bool = False):
+        """
+        Set only the values different of current, so the unchanged fields are not written in the update
+        """
         for key, value in update.items():
+            if key in self.__fields__ and getattr(self, key) == value:
+                continue
+
             try:
                 setattr(self, key, value)
             except ValueError:
@@ -21,3 +21,19 @@ class ModelHelpers(SQLModel):
                     continue
                 else:
                     raise
+
+    def get_changed_fields(self) -> set[str]:
+        """
+        :return: The columns changed since the model was loaded or saved, all fields set when it is not saved yet
+        """
+        state = inspect(self, raiseerr=False)
+
+        if state is None or state.transient or state.pending:
+            return set(self.__fields_set__)
+
+        return {
+            attribute.key for attribute in state.mapper.column_attrs if state.attrs[attribute.key].history.has_changes()
+        }
+
+    def has_changes(self) -> bool:
+        return bool(self.get_changed_fields())
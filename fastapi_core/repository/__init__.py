@@ -1,2 +1,10 @@
+from .aggregation import AggregateFunction
+from .batches import BatchCheckpointABC, CacheBatchCheckpoint
+from .cached_repository import CachedRepository
+from .create_coalescer import CreateCoalescer
+from .cursor_pagination import CursorPage, CursorParams
+from .filters import FilterOperator
+from .loading import LoadStrategy
+from .offset_pagination import CountMode, OffsetPage
 from .repository import Repository
 from .repository_abc import RepositoryABC
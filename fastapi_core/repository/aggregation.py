@@ -0,0 +1,28 @@
+from enum import Enum
+
+from sqlalchemy import Column, func
+from sqlalchemy.sql.elements import ColumnElement
+
+
+class AggregateFunction(str, Enum):
+    COUNT = "count"
+    SUM = "sum"
+    AVG = "avg"
+    MIN = "min"
+    MAX = "max"
+
+
+def build_aggregate(function: AggregateFunction, column: Column | None) -> ColumnElement:
+    """
+    Build the aggregate expression, COUNT without column is COUNT(*) and with column count the values not null
+    :param function: The AggregateFunction
+    :param column: The column aggregated, None only with COUNT
+    :return: The aggregate expression to use in select
+    """
+    if column is None:
+        if function != AggregateFunction.COUNT:
+            raise ValueError(f"The aggregate {function.value} should have a column")
+
+        return func.count()
+
+    return getattr(func, function.value)(column)
@@ -0,0 +1,49 @@
+import json
+from abc import ABC, abstractmethod
+
+from fastapi_core.cache_driver.cache_driver_abc import CacheDriverABC
+
+
+class BatchCheckpointABC(ABC):
+    """
+    Store the last primary key processed by Repository.process_in_batches, so a job can restart where it stopped
+    """
+
+    @abstractmethod
+    async def load(self) -> any:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def save(self, last_pk: any) -> None:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Not Implemented"""
+
+
+class CacheBatchCheckpoint(BatchCheckpointABC):
+    def __init__(self, cache_driver: CacheDriverABC, key: str, seconds_for_expire: int = 7 * 24 * 60 * 60):
+        """
+        Checkpoint stored in the cache
+        :param cache_driver: The CacheDriverABC where the checkpoint is stored
+        :param key: The key of job, example: 'jobs:reindex-heroes'
+        :param seconds_for_expire: The TTL of checkpoint, the job start again from the first item after it
+        """
+        self.cache_driver = cache_driver
+        self.key = key
+        self.seconds_for_expire = seconds_for_expire
+
+    async def load(self) -> any:
+        data = await self.cache_driver.get_dict(key=self.key)
+        return data["last_pk"] if data else None
+
+    async def save(self, last_pk: any) -> None:
+        await self.cache_driver.set(
+            key=self.key,
+            value=json.dumps({"last_pk": last_pk}, default=str),
+            seconds_for_expire=self.seconds_for_expire,
+        )
+
+    async def clear(self) -> None:
+        await self.cache_driver.dump(key=self.key)
@@ -0,0 +1,353 @@
+import functools
+import hashlib
+import json
+import math
+
+from fastapi_pagination import Params
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import SQLModel
+
+from fastapi_core.cache_driver.cache_driver_abc import NO_TIME_BUDGET, CacheDriverABC
+from fastapi_core.database import AsyncSessionManager
+from fastapi_core.database.routing import wrote_in_master
+from fastapi_core.database.unit_of_work import get_current_unit_of_work
+from fastapi_core.model import ModelBase
+from fastapi_core.repository.loading import RelationshipToLoad
+from fastapi_core.repository.offset_pagination import CountMode, OffsetPage
+from fastapi_core.repository.repository import Repository
+from fastapi_core.repository.repository_abc import Model
+
+
+class CachedRepository(Repository):
+    def __init__(
+        self,
+        async_session_manager: type[AsyncSessionManager],
+        model: type[SQLModel],
+        cache_driver: CacheDriverABC,
+        seconds_for_expire: int = 600,
+        list_seconds_for_expire: int = None,
+        key_prefix: str = None,
+        read_from_replica: bool = True,
+        replica_lag_seconds: float = 5,
+    ):
+        """
+        Repository that read through the cache the find_one by primary key, find_paginated and count
+        and invalidate the keys of model in all writes
+        :param async_session_manager: The session of SQLModel or sqlalchemy
+        :param model: The model of repository, example: UserModel, ItemModel
+        :param cache_driver: The CacheDriverABC where the results are stored
+        :param seconds_for_expire: The TTL of objects cached by primary key
+        :param list_seconds_for_expire: The TTL of pages and counts, when None use seconds_for_expire
+        :param key_prefix: The prefix of keys of model, when None use the table name
+        :param read_from_replica: When True the reads use the read only database, except after a write in the request
+        :param replica_lag_seconds: The seconds after a write in which the reads of read only database do not populate
+                                    the cache, because they can return the old rows, should be greater than the lag
+                                    of replication
+        """
+        super().__init__(async_session_manager, model=model, read_from_replica=read_from_replica)
+        self.cache_driver = cache_driver
+        self.seconds_for_expire = seconds_for_expire
+        self.list_seconds_for_expire = (
+            seconds_for_expire if list_seconds_for_expire is None else list_seconds_for_expire
+        )
+        self.key_prefix = key_prefix or model.__tablename__
+        self.replica_lag_seconds = replica_lag_seconds
+
+    def _use_cache(self, read_only: bool | None, relationship_to_load: RelationshipToLoad | None = None) -> bool:
+        """
+        The cache is skipped when the read force master, load relationships (they are not cached)
+        or the request wrote in master, because the write can be not committed yet (UnitOfWork)
+        """
+        return read_only is not False and not relationship_to_load and not wrote_in_master()
+
+    def _pk_key(self, pk: any) -> str:
+        return f"{self.key_prefix}:pk:{pk}"
+
+    def _written_key(self) -> str:
+        return f"{self.key_prefix}:written"
+
+    async def _can_populate(self, read_only: bool | None) -> bool:
+        """
+        The rows read from the read only database after a write of model (of any request or worker) are not cached
+        until replica_lag_seconds, so the old rows of a replica behind master do not stay in cache
+        """
+        if not self._use_read_only(read_only) or self.replica_lag_seconds <= 0:
+            return True
+
+        return await self.cache_driver.get(key=self._written_key()) is None
+
+    def _list_key(self, name: str, **arguments) -> str:
+        digest = hashlib.sha1(json.dumps(arguments, sort_keys=True, default=str).encode()).hexdigest()
+        return f"{self.key_prefix}:list:{name}:{digest}"
+
+    def _serialize(self, obj: SQLModel) -> dict:
+        return {column_name: getattr(obj, column_name) for column_name in self._metadata.columns}
+
+    def _deserialize(self, data: dict) -> Model:
+        """
+        Build the model from cached columns, detached with identity key as the objects returned by Repository
+        """
+        obj = self.model(
+            **{
+                column_name: self._metadata.coerce(column_name=column_name, value=data.get(column_name))
+                for column_name in self._metadata.columns
+            }
+        )
+        make_transient_to_detached(obj)
+        return obj
+
+    async def _get_cached(self, key: str) -> dict | None:
+        return await self.cache_driver.get_dict(key=key)
+
+    async def _set_cached(self, key: str, data: dict, seconds_for_expire: int) -> None:
+        await self.cache_driver.set(key=key, value=json.dumps(data, default=str), seconds_for_expire=seconds_for_expire)
+
+    async def invalidate(self, objs: list[SQLModel] = None) -> None:
+        """
+        Remove the pages and counts of model and the objects informed, when objs is None remove all keys of model
+        Inside a UnitOfWork the keys are removed again after the commit, because the reads of other requests before
+        the commit can cache the old rows
+        :param objs: The models written
+        """
+        primary_key_name = self._get_primary_key_name()
+        pks = None if objs is None else [pk for obj in objs if (pk := getattr(obj, primary_key_name)) is not None]
+        await self._invalidate_pks(pks=pks)
+
+    async def _invalidate_pks(self, pks: list[any] | None) -> None:
+        await self.__remove_keys(pks=pks)
+
+        if unit_of_work := get_current_unit_of_work():
+            unit_of_work.add_after_commit(functools.partial(self.__remove_keys, pks=pks))
+
+    async def __remove_keys(self, pks: list[any] | None) -> None:
+        # A time budget would leave stale entries after the write, so the invalidation remove all keys
+        if pks is None:
+            await self.cache_driver.dump_prefix(key_prefix=f"{self.key_prefix}:", time_budget_seconds=NO_TIME_BUDGET)
+        else:
+            for pk in pks:
+                await self.cache_driver.dump(key=self._pk_key(pk))
+
+            await self.cache_driver.dump_prefix(
+                key_prefix=f"{self.key_prefix}:list:", time_budget_seconds=NO_TIME_BUDGET
+            )
+
+        if self.replica_lag_seconds > 0:
+            await self.cache_driver.set(
+                key=self._written_key(), value="1", seconds_for_expire=math.ceil(self.replica_lag_seconds)
+            )
+
+    async def find_one(
+        self,
+        filters: dict[str, any] = None,
+        order_by: str = None,
+        desc: bool = False,
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+        columns: list[str] = None,
+        raw: bool = False,
+    ) -> Model | dict[str, any] | None:
+        primary_key_name = self._get_primary_key_name()
+
+        if (
+            not filters
+            or list(filters.keys()) != [primary_key_name]
+            or columns
+            or raw
+            or not self._use_cache(read_only, relationship_to_load)
+        ):
+            return await super().find_one(
+                filters=filters,
+                order_by=order_by,
+                desc=desc,
+                relationship_to_load=relationship_to_load,
+                read_only=read_only,
+                columns=columns,
+                raw=raw,
+            )
+
+        key = self._pk_key(filters[primary_key_name])
+
+        if data := await self._get_cached(key=key):
+            return self._deserialize(data)
+
+        obj = await super().find_one(filters=filters, read_only=read_only)
+
+        if obj is not None and await self._can_populate(read_only):
+            await self._set_cached(key=key, data=self._serialize(obj), seconds_for_expire=self.seconds_for_expire)
+
+        return obj
+
+    async def get_many_by_pks(
+        self, pks: list[any], pk_field: str = None, chunk_size: int = 1000, read_only: bool = None
+    ) -> dict[any, Model]:
+        if (pk_field and pk_field != self._get_primary_key_name()) or not self._use_cache(read_only):
+            return await super().get_many_by_pks(pks=pks, pk_field=pk_field, chunk_size=chunk_size, read_only=read_only)
+
+        keys = {self._pk_key(pk): pk for pk in pks}
+        cached = await self.cache_driver.get_many(keys=list(keys))
+        items = {keys[key]: self._deserialize(json.loads(value)) for key, value in cached.items()}
+
+        missing_pks = [pk for pk in keys.values() if pk not in items]
+        if not missing_pks:
+            return items
+
+        found = await super().get_many_by_pks(pks=missing_pks, chunk_size=chunk_size, read_only=read_only)
+        if not await self._can_populate(read_only):
+            return {**items, **found}
+
+        await self.cache_driver.set_many(
+            mapped_data={self._pk_key(pk): json.dumps(self._serialize(obj), default=str) for pk, obj in found.items()},
+            seconds_for_expire=self.seconds_for_expire,
+        )
+        return {**items, **found}
+
+    async def find_paginated(
+        self,
+        params: Params = Params(),
+        filters: dict = None,
+        order_by: str = None,
+        desc: bool = False,
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+        columns: list[str] = None,
+        raw: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> OffsetPage[Model] | OffsetPage[dict]:
+        if not isinstance(params, Params) or columns or raw or not self._use_cache(read_only, relationship_to_load):
+            # The partial Models and the rows are not cached
+            return await super().find_paginated(
+                params=params,
+                filters=filters,
+                order_by=order_by,
+                desc=desc,
+                relationship_to_load=relationship_to_load,
+                read_only=read_only,
+                columns=columns,
+                raw=raw,
+                count_mode=count_mode,
+            )
+
+        key = self._list_key(
+            "page", params=params.dict(), filters=filters, order_by=order_by, desc=desc, count_mode=count_mode
+        )
+
+        if data := await self._get_cached(key=key):
+            return OffsetPage.create(
+                items=[self._deserialize(item) for item in data["items"]],
+                params=params,
+                total=data["total"],
+                total_kind=data["total_kind"],
+                has_next=data["has_next"],
+            )
+
+        page = await super().find_paginated(
+            params=params, filters=filters, order_by=order_by, desc=desc, read_only=read_only, count_mode=count_mode
+        )
+        if not await self._can_populate(read_only):
+            return page
+
+        await self._set_cached(
+            key=key,
+            data={
+                "items": [self._serialize(item) for item in page.items],
+                "total": page.total,
+                "total_kind": page.total_kind,
+                "has_next": page.has_next,
+            },
+            seconds_for_expire=self.list_seconds_for_expire,
+        )
+        return page
+
+    async def count(self, filters: dict = None, read_only: bool = None) -> int:
+        if not self._use_cache(read_only):
+            return await super().count(filters=filters, read_only=read_only)
+
+        key = self._list_key("count", filters=filters)
+
+        if data := await self._get_cached(key=key):
+            return data["count"]
+
+        count = await super().count(filters=filters, read_only=read_only)
+        if await self._can_populate(read_only):
+            await self._set_cached(key=key, data={"count": count}, seconds_for_expire=self.list_seconds_for_expire)
+
+        return count
+
+    async def create(self, obj: dict[str, any] | SQLModel) -> Model:
+        new_obj = await super().create(obj=obj)
+        await self.invalidate(objs=[new_obj])
+        return new_obj
+
+    async def bulk_create(self, objs: list[dict[str, any] | SQLModel], chunk_size: int = 1000) -> list[Model]:
+        new_objs = await super().bulk_create(objs=objs, chunk_size=chunk_size)
+        await self.invalidate(objs=new_objs)
+        return new_objs
+
+    async def bulk_upsert(
+        self,
+        objs: list[dict[str, any] | SQLModel],
+        conflict_target: list[str] = None,
+        update_columns: list[str] = None,
+        chunk_size: int = 1000,
+        returning: bool = False,
+    ) -> list[Model] | int:
+        result = await super().bulk_upsert(
+            objs=objs,
+            conflict_target=conflict_target,
+            update_columns=update_columns,
+            chunk_size=chunk_size,
+            returning=returning,
+        )
+        # The primary keys of rows updated by other conflict target are unknown
+        await self.invalidate()
+        return result
+
+    async def update(self, obj: SQLModel, update_values: dict[str, any] | SQLModel = None) -> Model:
+        updated_obj = await super().update(obj=obj, update_values=update_values)
+        await self.invalidate(objs=[updated_obj])
+        return updated_obj
+
+    async def bulk_update(self, objs: list[SQLModel], chunk_size: int = 1000) -> list[Model]:
+        updated_objs = await super().bulk_update(objs=objs, chunk_size=chunk_size)
+        await self.invalidate(objs=objs)
+        return updated_objs
+
+    async def update_by_filters(self, filters: dict, values: dict[str, any]) -> int:
+        updated = await super().update_by_filters(filters=filters, values=values)
+        await self.invalidate()
+        return updated
+
+    async def update_by_pk(self, pk: any, values: dict[str, any] | SQLModel, pk_field: str = None) -> Model | None:
+        updated_obj = await super().update_by_pk(pk=pk, values=values, pk_field=pk_field)
+        await self.invalidate(objs=[updated_obj] if updated_obj else [])
+        return updated_obj
+
+    async def delete_by_pk(self, pk: any, pk_field: str = None) -> bool:
+        deleted = await super().delete_by_pk(pk=pk, pk_field=pk_field)
+
+        if pk_field and pk_field != self._get_primary_key_name():
+            # The primary key of row is unknown
+            await self.invalidate()
+        else:
+            await self._invalidate_pks(pks=[pk])
+
+        return deleted
+
+    async def delete(self, obj: SQLModel) -> None:
+        await super().delete(obj=obj)
+        await self.invalidate(objs=[obj])
+
+    async def bulk_delete(self, objs: list[SQLModel], chunk_size: int = 1000) -> int:
+        deleted = await super().bulk_delete(objs=objs, chunk_size=chunk_size)
+        await self.invalidate(objs=objs)
+        return deleted
+
+    async def delete_by_filters(self, filters: dict) -> int:
+        deleted = await super().delete_by_filters(filters=filters)
+        await self.invalidate()
+        return deleted
+
+    async def bulk_soft_delete(self, objs: list[ModelBase], chunk_size: int = 1000) -> int:
+        deleted = await super().bulk_soft_delete(objs=objs, chunk_size=chunk_size)
+        await self.invalidate(objs=objs)
+        return deleted
@@ -0,0 +1,50 @@
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+
+class CountCache:
+    def __init__(self, max_size: int = 1000, seconds_for_expire: float = 60):
+        """
+        LRU of the totals of find_paginated with CountMode.CACHED, each total expire after seconds_for_expire
+        :param max_size: The max number of totals (one per filters), the least recently used is removed
+        :param seconds_for_expire: The TTL of each total
+        """
+        self.max_size = max_size
+        self.seconds_for_expire = seconds_for_expire
+        self._totals: OrderedDict[Hashable, tuple[float, int]] = OrderedDict()
+
+    def get(self, key: Hashable) -> int | None:
+        """
+        :return: The total or None when it do not exist or is expired, the expired total is removed
+        """
+        if (cached := self._totals.get(key)) is None:
+            return None
+
+        expires_at, total = cached
+        if expires_at <= time.monotonic():
+            del self._totals[key]
+            return None
+
+        self._totals.move_to_end(key)
+        return total
+
+    def set(self, key: Hashable, total: int) -> None:
+        self._totals[key] = (time.monotonic() + self.seconds_for_expire, total)
+        self._totals.move_to_end(key)
+        self.__remove_expired()
+
+        while len(self._totals) > self.max_size:
+            self._totals.popitem(last=False)
+
+    def clear(self) -> None:
+        self._totals.clear()
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def __remove_expired(self) -> None:
+        now = time.monotonic()
+
+        for key in [key for key, (expires_at, _) in self._totals.items() if expires_at <= now]:
+            del self._totals[key]
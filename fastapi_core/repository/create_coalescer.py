@@ -0,0 +1,120 @@
+import asyncio
+import contextvars
+
+from sqlmodel import SQLModel
+
+from fastapi_core.database.routing import mark_wrote_in_master
+from fastapi_core.database.unit_of_work import in_unit_of_work
+from fastapi_core.repository.repository_abc import Model, RepositoryABC
+
+
+class CreateCoalescer:
+    def __init__(self, repository: RepositoryABC, max_batch_size: int = 100, max_wait_seconds: float = 0.005):
+        """
+        Coalesce the creates of concurrent requests made in max_wait_seconds in one bulk_create (one multi-row INSERT
+        in one transaction), each caller receive its own Model or its own error
+        :param repository: The repository of model
+        :param max_batch_size: The batch is created when it has this number of objects
+        :param max_wait_seconds: The max time that the first object of batch wait the others
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size should be greater than 0, received {max_batch_size}")
+
+        self.repository = repository
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._pending: list[tuple[dict[str, any] | SQLModel, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task] = set()
+
+    async def create(self, obj: dict[str, any] | SQLModel) -> Model:
+        """
+        Create the object in the next batch, inside a UnitOfWork the object is created in the request transaction
+        :param obj: The BaseModel with field and data or dict of data
+        :return: The Model created
+        """
+        if in_unit_of_work():
+            return await self.repository.create(obj=obj)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((obj, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self.__dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self.__dispatch)
+
+        new_obj = await future
+        # The batch run outside the request, the read-after-write is marked in the request of caller
+        mark_wrote_in_master()
+        return new_obj
+
+    async def flush(self) -> None:
+        """
+        Create the pending objects now and wait the batches in progress, example: in the shutdown of app
+        """
+        self.__dispatch()
+
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+    def __dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        items, self._pending = self._pending, []
+
+        if not items:
+            return
+
+        # The batch has objects of many requests, so it do not use the context (UnitOfWork) of any of them
+        task = contextvars.Context().run(asyncio.ensure_future, self.__create_batch(items))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def __create_batch(self, items: list[tuple[dict[str, any] | SQLModel, asyncio.Future]]) -> None:
+        items = [(obj, future) for obj, future in items if not future.done()]
+
+        if not items:
+            return
+
+        try:
+            try:
+                new_objs = await self.repository.bulk_create(objs=[obj for obj, _ in items])
+            except Exception:
+                # One invalid object fail the batch, each object is created alone to isolate the error
+                for obj, future in items:
+                    try:
+                        self.__set_result(future, await self.repository.create(obj=obj))
+                    except Exception as exc:
+                        if not future.done():
+                            future.set_exception(exc)
+                return
+
+            for (_, future), new_obj in zip(items, new_objs, strict=True):
+                self.__set_result(future, new_obj)
+        except Exception as exc:
+            self.__fail(items, exc)
+        except BaseException:
+            # The batch cancelled (example: in the shutdown of loop) do not leave the callers waiting forever
+            self.__fail(items, None)
+            raise
+
+    @classmethod
+    def __fail(cls, items: list[tuple[dict[str, any] | SQLModel, asyncio.Future]], exc: Exception | None) -> None:
+        for _, future in items:
+            if future.done():
+                continue
+
+            if exc is None:
+                future.cancel()
+            else:
+                future.set_exception(exc)
+
+    @classmethod
+    def __set_result(cls, future: asyncio.Future, new_obj: Model) -> None:
+        # The caller can be cancelled while the batch is created
+        if not future.done():
+            future.set_result(new_obj)
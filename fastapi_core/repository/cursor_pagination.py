@@ -0,0 +1,71 @@
+import base64
+import binascii
+import datetime
+import json
+from typing import Generic, Sequence, TypeVar
+
+from fastapi import Query
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from pydantic.generics import GenericModel
+from sqlalchemy import Column
+
+from fastapi_core.utils.exceptions import InvalidCursorException
+
+T = TypeVar("T")
+
+
+class CursorParams(BaseModel):
+    size: int = Query(50, ge=1, le=100, description="Page size")
+    cursor: str | None = Query(None, description="The next_cursor of previous page")
+    include_total: bool = Query(False, description="Count the total of items, it is slow in big tables")
+
+
+class CursorPage(GenericModel, Generic[T]):
+    items: Sequence[T]
+    size: int
+    next_cursor: str | None = None
+    total: int | None = None
+
+
+def encode_cursor(values: list) -> str:
+    """
+    Encode the values of the ordered key of last item in an opaque cursor
+    """
+    return base64.urlsafe_b64encode(json.dumps(jsonable_encoder(values)).encode()).decode()
+
+
+def decode_cursor(cursor: str, columns: list[Column]) -> list:
+    """
+    Decode the cursor and convert the values to the python type of each column of the ordered key
+    :raise: InvalidCursorException
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, binascii.Error) as exc:
+        raise InvalidCursorException from exc
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise InvalidCursorException
+
+    try:
+        return [
+            _coerce_to_column_type(column=column, value=value) for column, value in zip(columns, values, strict=True)
+        ]
+    except (TypeError, ValueError) as exc:
+        raise InvalidCursorException from exc
+
+
+def _coerce_to_column_type(column: Column, value):
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    if value is None or isinstance(value, python_type):
+        return value
+
+    if python_type in (datetime.datetime, datetime.date, datetime.time):
+        return python_type.fromisoformat(value)
+
+    return python_type(value)
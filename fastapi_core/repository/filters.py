@@ -0,0 +1,101 @@
+from enum import Enum
+
+from sqlalchemy import Column, bindparam
+from sqlalchemy.sql.elements import ColumnElement
+
+from fastapi_core.utils.model_metadata import ModelMetadata
+
+FILTER_OPERATOR_SEPARATOR = "__"
+LIKE_ESCAPE_CHAR = "/"
+
+
+class FilterOperator(str, Enum):
+    EQ = "eq"
+    NE = "ne"
+    IN = "in"
+    GT = "gt"
+    GTE = "gte"
+    LT = "lt"
+    LTE = "lte"
+    STARTSWITH = "startswith"
+    ISNULL = "isnull"
+
+
+def parse_filter_key(key: str, metadata: ModelMetadata) -> tuple[str, FilterOperator] | None:
+    """
+    Split the filter key in field and operator, example: 'age__gte' -> ('age', FilterOperator.GTE)
+    :return: The field and the FilterOperator or None when the field or the operator do not exist
+    """
+    if metadata.is_filterable(key):
+        return key, FilterOperator.EQ
+
+    field, separator, operator = key.rpartition(FILTER_OPERATOR_SEPARATOR)
+
+    if separator and field in metadata.columns and operator in FilterOperator._value2member_map_:
+        return field, FilterOperator(operator)
+
+    return None
+
+
+def filter_needs_parameter(operator: FilterOperator, value: any) -> bool:
+    """
+    IS NULL and IS NOT NULL do not have parameter, so the value None is part of the statement
+    """
+    if operator == FilterOperator.ISNULL:
+        return False
+
+    return value is not None or operator not in (FilterOperator.EQ, FilterOperator.NE)
+
+
+def filter_parameter_value(operator: FilterOperator, value: any) -> any:
+    if operator == FilterOperator.STARTSWITH:
+        if not isinstance(value, str):
+            raise ValueError(f"The value of startswith filter should be a str, received {value!r}")
+
+        # The pattern is computed here, a constant prefix can use the index (LIKE 'foo%')
+        escaped = value.replace(LIKE_ESCAPE_CHAR, LIKE_ESCAPE_CHAR * 2)
+        escaped = escaped.replace("%", LIKE_ESCAPE_CHAR + "%").replace("_", LIKE_ESCAPE_CHAR + "_")
+        return escaped + "%"
+
+    if operator == FilterOperator.IN:
+        return list(value)
+
+    return value
+
+
+def build_filter_clause(column: Column, operator: FilterOperator, value: any, bind_name: str = None) -> ColumnElement:
+    """
+    Build the predicate of the filter
+    :param column: The column filtered
+    :param operator: The FilterOperator
+    :param value: The value of filter, for ISNULL True is IS NULL and False IS NOT NULL
+    :param bind_name: When informed the value is a bound parameter with this name, used by the cached statements
+    :return: The predicate to use in where
+    """
+    if operator == FilterOperator.ISNULL:
+        return column.is_(None) if value else column.isnot(None)
+
+    if not filter_needs_parameter(operator=operator, value=value):
+        return column.is_(None) if operator == FilterOperator.EQ else column.isnot(None)
+
+    if bind_name:
+        parameter = bindparam(bind_name, expanding=operator == FilterOperator.IN)
+    else:
+        parameter = filter_parameter_value(operator=operator, value=value)
+
+    if operator == FilterOperator.EQ:
+        return column == parameter
+    if operator == FilterOperator.NE:
+        return column != parameter
+    if operator == FilterOperator.IN:
+        return column.in_(parameter)
+    if operator == FilterOperator.GT:
+        return column > parameter
+    if operator == FilterOperator.GTE:
+        return column >= parameter
+    if operator == FilterOperator.LT:
+        return column < parameter
+    if operator == FilterOperator.LTE:
+        return column <= parameter
+
+    return column.like(parameter, escape=LIKE_ESCAPE_CHAR)
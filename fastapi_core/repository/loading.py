@@ -0,0 +1,105 @@
+from enum import Enum
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, raiseload, selectinload, subqueryload
+from sqlalchemy.orm.strategy_options import Load
+from sqlmodel import SQLModel
+
+RELATIONSHIP_PATH_SEPARATOR = "."
+
+
+class LoadStrategy(str, Enum):
+    SELECTIN = "selectin"
+    JOINED = "joined"
+    SUBQUERY = "subquery"
+    RAISE = "raise"
+
+
+RelationshipToLoad = list[str] | dict[str, LoadStrategy | str]
+
+_LOADERS = {
+    LoadStrategy.SELECTIN: selectinload,
+    LoadStrategy.JOINED: joinedload,
+    LoadStrategy.SUBQUERY: subqueryload,
+    LoadStrategy.RAISE: raiseload,
+}
+
+
+def build_load_plan(
+    relationship_to_load: RelationshipToLoad | None,
+    default_strategy: LoadStrategy,
+    model_strategies: dict[str, LoadStrategy | str] = None,
+) -> dict[str, LoadStrategy]:
+    """
+    Resolve the LoadStrategy of each relationship path, example: ['powers', 'powers.hero'] or {'powers': 'joined'}
+    The relationships in a list use the strategy of model (__load_strategies__) or the default strategy,
+    and the relationships with RAISE in the model that are not requested raise on lazy load
+    :param relationship_to_load: A list of paths or a dict of path and LoadStrategy
+    :param default_strategy: The LoadStrategy of the paths without strategy
+    :param model_strategies: The LoadStrategy declared in model by path
+    :return: A dict of path and LoadStrategy
+    :raise: ValueError when a strategy is invalid
+    """
+    model_strategies = {path: LoadStrategy(strategy) for path, strategy in (model_strategies or {}).items()}
+
+    if isinstance(relationship_to_load, dict):
+        plan = {path: LoadStrategy(strategy) for path, strategy in relationship_to_load.items()}
+    else:
+        plan = {
+            path: (
+                default_strategy
+                if model_strategies.get(path, LoadStrategy.RAISE) == LoadStrategy.RAISE
+                else model_strategies[path]
+            )
+            for path in relationship_to_load or []
+        }
+
+    loaded_paths = {
+        RELATIONSHIP_PATH_SEPARATOR.join(segments[:depth])
+        for segments in (path.split(RELATIONSHIP_PATH_SEPARATOR) for path in plan)
+        for depth in range(1, len(segments) + 1)
+    }
+    for path, strategy in model_strategies.items():
+        if strategy == LoadStrategy.RAISE and path not in loaded_paths:
+            plan[path] = strategy
+
+    return plan
+
+
+def build_load_options(
+    model: type[SQLModel], load_plan: dict[str, LoadStrategy], default_strategy: LoadStrategy
+) -> list[Load]:
+    """
+    Build the loader options of plan, the parents of a nested path use their strategy in plan or the default strategy
+    :param model: The model of query
+    :param load_plan: The dict of path and LoadStrategy
+    :param default_strategy: The LoadStrategy of the parents not in plan
+    :return: The options to use in query
+    :raise: ValueError when a path is not a relationship
+    """
+    options = []
+
+    for path, strategy in load_plan.items():
+        option, current_model = None, model
+        segments = path.split(RELATIONSHIP_PATH_SEPARATOR)
+
+        for depth, segment in enumerate(segments, start=1):
+            relationship = inspect(current_model).relationships.get(segment)
+
+            if relationship is None:
+                raise ValueError(f"{segment} should be a relationship of {current_model.__name__}, received {path}")
+
+            if depth == len(segments):
+                segment_strategy = strategy
+            else:
+                parent_strategy = load_plan.get(RELATIONSHIP_PATH_SEPARATOR.join(segments[:depth]), default_strategy)
+                segment_strategy = default_strategy if parent_strategy == LoadStrategy.RAISE else parent_strategy
+
+            loader = _LOADERS[segment_strategy]
+            attribute = getattr(current_model, segment)
+            option = loader(attribute) if option is None else getattr(option, loader.__name__)(attribute)
+            current_model = relationship.mapper.class_
+
+        options.append(option)
+
+    return options
@@ -0,0 +1,27 @@
+from enum import Enum
+from typing import Generic, TypeVar
+
+from fastapi_pagination import Page
+from pydantic import conint
+
+T = TypeVar("T")
+
+POSTGRES_ESTIMATED_COUNT_STATEMENT = "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table_name AS regclass)"
+
+
+class CountMode(str, Enum):
+    EXACT = "exact"
+    NONE = "none"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
+
+
+class OffsetPage(Page[T], Generic[T]):
+    """
+    The Page of find_paginated, total_kind is the CountMode really used to compute the total
+    (ESTIMATED and CACHED fall back to EXACT when they can not be used) and total is None with CountMode.NONE
+    """
+
+    total: conint(ge=0) | None = None
+    total_kind: CountMode = CountMode.EXACT
+    has_next: bool | None = None
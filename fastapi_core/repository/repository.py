@@ -1,85 +1,333 @@
 import asyncio
+import functools
+import json
+import weakref
 from abc import ABC
+from collections import deque
+from collections.abc import Hashable
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable
 
 from fastapi.encoders import jsonable_encoder
-from fastapi_pagination import Page, Params
-from fastapi_pagination.ext.sqlmodel import paginate
-from sqlalchemy.orm import joinedload, subqueryload
+from fastapi_pagination import Params
+from sqlalchemy import (
+    ARRAY,
+    JSON,
+    Column,
+    Integer,
+    PickleType,
+    bindparam,
+    delete,
+    insert,
+    inspect,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import Select
+from sqlalchemy.future import select as select_columns
+from sqlalchemy.orm import load_only, make_transient_to_detached
+from sqlalchemy.orm.attributes import flag_modified, set_committed_value
+from sqlalchemy.pool import AssertionPool, Pool, QueuePool, SingletonThreadPool, StaticPool
+from sqlalchemy.sql.elements import ColumnElement
 from sqlmodel import SQLModel, func, select
 from sqlmodel import desc as descending
 from sqlmodel.sql.expression import SelectOfScalar
 
 from fastapi_core.database import AsyncSessionManager
+from fastapi_core.database.routing import mark_wrote_in_master, wrote_in_master
+from fastapi_core.database.unit_of_work import is_unit_of_work_session
+from fastapi_core.model import ModelBase
+from fastapi_core.repository.aggregation import AggregateFunction, build_aggregate
+from fastapi_core.repository.batches import BatchCheckpointABC
+from fastapi_core.repository.count_cache import CountCache
+from fastapi_core.repository.cursor_pagination import CursorPage, CursorParams, decode_cursor, encode_cursor
+from fastapi_core.repository.filters import (
+    FilterOperator,
+    build_filter_clause,
+    filter_needs_parameter,
+    filter_parameter_value,
+    parse_filter_key,
+)
+from fastapi_core.repository.loading import LoadStrategy, RelationshipToLoad, build_load_options, build_load_plan
+from fastapi_core.repository.offset_pagination import POSTGRES_ESTIMATED_COUNT_STATEMENT, CountMode, OffsetPage
 from fastapi_core.repository.repository_abc import Model, RepositoryABC
+from fastapi_core.repository.statement_cache import StatementCache, StatementCacheStats
+from fastapi_core.utils.model_metadata import get_model_metadata
+
+# The page and the count of find_paginated run at the same time
+CONNECTIONS_PER_CONCURRENT_PAGE = 2
+# The joined and subquery loads need all rows of the result, they can not be used with yield_per
+STREAMLESS_LOAD_STRATEGIES = (LoadStrategy.JOINED, LoadStrategy.SUBQUERY)
+# The values of these types can be changed in place, without history in the model
+MUTABLE_COLUMN_TYPES = (JSON, ARRAY, PickleType)
+# The connections reserved by the find_paginated in progress, per engine pool of the process
+_CONCURRENT_CONNECTIONS: "weakref.WeakKeyDictionary[Pool, int]" = weakref.WeakKeyDictionary()
 
 
 class Repository(RepositoryABC, ABC):
-    def __init__(self, async_session_manager: type[AsyncSessionManager], model: type[SQLModel]):
+    def __init__(
+        self,
+        async_session_manager: type[AsyncSessionManager],
+        model: type[SQLModel],
+        read_from_replica: bool = True,
+        count_cache_seconds: float = 60,
+        count_cache_size: int = 1000,
+        statement_cache_size: int = 500,
+        default_load_strategy: LoadStrategy = LoadStrategy.SELECTIN,
+    ):
         """
         The constructor received the session and the model of repository
         :param async_session_manager: The session of SQLModel or sqlalchemy
         :param model: The model of repository, example: UserModel, ItemModel
+        :param read_from_replica: When True the reads use the read only database, except after a write in the request
+        :param count_cache_seconds: The TTL of totals of find_paginated with CountMode.CACHED, the totals are also
+                                    forgotten by the writes of this repository
+        :param count_cache_size: The max number of totals cached (one per filters)
+        :param statement_cache_size: The max number of query shapes with the statement cached
+        :param default_load_strategy: The LoadStrategy of relationship_to_load without strategy in call or in model
         """
         self.async_session_manager = async_session_manager
         self.model = model
+        self.read_from_replica = read_from_replica
+        self._metadata = get_model_metadata(model)
+        self._statement_cache = StatementCache(max_size=statement_cache_size)
+        self._count_cache = CountCache(max_size=count_cache_size, seconds_for_expire=count_cache_seconds)
+        self.default_load_strategy = LoadStrategy(default_load_strategy)
+        self._mutable_columns = [
+            name for name, column in self._metadata.columns.items() if isinstance(column.type, MUTABLE_COLUMN_TYPES)
+        ]
 
-    def _add_subquery_load(self, query: SelectOfScalar, keys_subquery_load: list[str]) -> SelectOfScalar:
-        for key in keys_subquery_load:
-            query = query.options(subqueryload(getattr(self.model, key)))
+    def _use_read_only(self, read_only: bool | None) -> bool:
+        """
+        Resolve the database used by a read
+        :param read_only: The override of call, when None use the read only database unless the request wrote in master
+        :return: True when the read should use the read only database
+        """
+        if read_only is not None:
+            return read_only
 
-        return query
+        return self.read_from_replica and not wrote_in_master()
 
-    def _add_joined_load(self, query: SelectOfScalar, keys_joined_load: list[str]) -> SelectOfScalar:
-        for key in keys_joined_load:
-            query = query.options(joinedload(getattr(self.model, key)))
+    async def _commit(self, session: AsyncSession) -> None:
+        """
+        Commit the session, inside a UnitOfWork only flush because the commit is made in the end of request
+        The totals cached of model are forgotten, they changed with the write
+        """
+        if is_unit_of_work_session(session):
+            await session.flush()
+        else:
+            await session.commit()
 
-        return query
+        self._count_cache.clear()
+        mark_wrote_in_master()
+
+    def _load_plan(self, relationship_to_load: RelationshipToLoad | None, raw: bool = False) -> dict[str, LoadStrategy]:
+        """
+        Resolve the LoadStrategy of each relationship path, the rows (raw) do not load relationships
+        """
+        if raw:
+            return {}
+
+        return build_load_plan(
+            relationship_to_load=relationship_to_load,
+            default_strategy=self.default_load_strategy,
+            model_strategies=self._metadata.load_strategies,
+        )
+
+    def _add_relationship_load(self, query: SelectOfScalar, load_plan: dict[str, LoadStrategy]) -> SelectOfScalar:
+        if not load_plan:
+            return query
+
+        return query.options(
+            *build_load_options(model=self.model, load_plan=load_plan, default_strategy=self.default_load_strategy)
+        )
 
     def _sanitize_filters_from_model(self, filters: dict) -> dict:
         """
         This method received the filters for query and check if field have in model passed in constructor
-        and if you do not exist in model remove
-        :param filters: A dict with filters, example {'id': 1, 'name': 'foo'}
-        :return: return the filters dict with only correct filters
+        and if you do not exist in model remove, the filters received are not changed
+        The field can have an operator: __in, __ne, __gt, __gte, __lt, __lte, __startswith and __isnull
+        :param filters: A dict with filters, example {'id': 1, 'name': 'foo', 'age__gte': 18, 'id__in': [1, 2]}
+        :return: return a new filters dict with only correct filters
         """
         if not isinstance(filters, dict):
             raise ValueError(f"filters should be a dict, received {type(filters)}")
 
-        keys = list(filters.keys())
-        for key in keys:
-            try:
-                getattr(self.model, key)
-            except AttributeError:
-                del filters[key]
+        return {key: value for key, value in filters.items() if parse_filter_key(key, self._metadata)}
+
+    def _filter_clauses(self, filters: dict) -> list[ColumnElement]:
+        """
+        Build the predicates of the sanitized filters, with the values in the statement
+        """
+        clauses = []
+
+        for key, value in filters.items():
+            field, operator = parse_filter_key(key, self._metadata)
+
+            if field in self._metadata.relationships:
+                clauses.append(getattr(self.model, field) == value)
+            else:
+                clauses.append(
+                    build_filter_clause(column=self._metadata.columns[field], operator=operator, value=value)
+                )
+
+        return clauses
+
+    def _get_columns(self, columns: list[str] | None) -> dict[str, Column]:
+        """
+        :param columns: The names of fields, when None all columns of table
+        :return: The columns by name of field
+        :raise: ValueError when a column do not exist in table
+        """
+        table_columns = self._metadata.columns
+
+        if not columns:
+            return dict(table_columns)
+
+        invalid_columns = [column for column in columns if column not in table_columns]
+        if invalid_columns:
+            raise ValueError(f"{self.model.__name__} do not have the columns {invalid_columns}")
+
+        return {column: table_columns[column] for column in columns}
+
+    def _labeled_column(self, name: str) -> ColumnElement:
+        """
+        The column of field with the name of field in the rows, when the column has other name
+        """
+        column = self._metadata.columns[name]
+        return column if column.name == name else column.label(name)
+
+    def _order_by(self, query: Select | SelectOfScalar, order_by: str, desc: bool) -> Select | SelectOfScalar:
+        column = self._metadata.columns[order_by]
+        return query.order_by(descending(column)) if desc else query.order_by(column)
+
+    def _get_primary_key_name(self) -> str:
+        return self._metadata.attribute_name(self._get_primary_key_column())
+
+    def _select(
+        self, columns: list[str] = None, raw: bool = False, relationship_to_load: RelationshipToLoad = None
+    ) -> Select | SelectOfScalar:
+        """
+        Build the select of model, with raw the columns are selected without ORM objects (rows as dicts)
+        and with columns only they are loaded in the ORM objects (the primary key is always loaded)
+        """
+        if raw:
+            if relationship_to_load:
+                raise ValueError("relationship_to_load can not be used with raw")
+
+            return select_columns(*(self._labeled_column(name) for name in self._get_columns(columns)))
+
+        query = select(self.model)
+
+        if columns:
+            query = query.options(load_only(*[getattr(self.model, name) for name in self._get_columns(columns)]))
+
+        return query
+
+    def _cached_statement(
+        self, shape: tuple, filters: dict, build: Callable[[], Select | SelectOfScalar]
+    ) -> tuple[Select | SelectOfScalar, dict[str, any]]:
+        """
+        Get the statement of query shape from the StatementCache, the filters are added as bound parameters
+        (IS NULL for None), the filters by relationship are not cached because the value is an object
+        :param shape: The arguments that change the statement, example: method, columns, order_by
+        :param filters: The sanitized filters
+        :param build: Build the statement without the filters
+        :return: The statement and the parameters to execute it
+        """
+        parsed_filters = {key: parse_filter_key(key, self._metadata) for key in filters}
+
+        if any(field in self._metadata.relationships for field, _ in parsed_filters.values()):
+            return build().where(*self._filter_clauses(filters)), {}
+
+        # The None (IS NULL) and the __isnull value change the statement, the other values are parameters
+        filters_shape = tuple(
+            sorted(
+                (key, bool(value) if parsed_filters[key][1] == FilterOperator.ISNULL else value is None)
+                for key, value in filters.items()
+            )
+        )
+
+        def build_with_filters() -> Select | SelectOfScalar:
+            query = build()
 
-        return filters
+            for key, value in filters.items():
+                field, operator = parsed_filters[key]
+                query = query.where(
+                    build_filter_clause(
+                        column=self._metadata.columns[field], operator=operator, value=value, bind_name=f"filter_{key}"
+                    )
+                )
+
+            return query
+
+        key = (*(tuple(value) if isinstance(value, list) else value for value in shape), filters_shape)
+        statement = self._statement_cache.get_or_build(key=key, build=build_with_filters)
+
+        return statement, {
+            f"filter_{key}": filter_parameter_value(operator=operator, value=filters[key])
+            for key, (_, operator) in parsed_filters.items()
+            if filter_needs_parameter(operator=operator, value=filters[key])
+        }
+
+    def get_statement_cache_stats(self) -> StatementCacheStats:
+        """
+        :return: The hits, misses and size of the statement cache of repository
+        """
+        return self._statement_cache.stats()
 
     async def find_one(
         self,
         filters: dict[str, any] = None,
         order_by: str = None,
         desc: bool = False,
-        relationship_to_load: list[str] = None,
-    ) -> Model | None:
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+        columns: list[str] = None,
+        raw: bool = False,
+    ) -> Model | dict[str, any] | None:
         """
         This method make query using params, filters
         :param filters:
         :param order_by:
         :param desc:
-        :param relationship_to_load:
-        :return: The object ModelType | None
+        :param relationship_to_load: The relationship paths, example ['powers', 'powers.hero'], or a dict of path and
+                                     LoadStrategy, example {'powers': 'joined'}
+        :param read_only: When None the repository choose the database, True force read only and False force master
+        :param columns: Select only these columns, the others are not loaded in the Model
+        :param raw: Return the row as dict without create the Model, faster to only serialize
+        :return: The object ModelType | dict | None
         """
-        async with self.async_session_manager() as session:
-            filters = self._sanitize_filters_from_model(filters=filters) if filters else {}
-            query = select(self.model).filter_by(**filters)
+        filters = self._sanitize_filters_from_model(filters=filters) if filters else {}
+        order_by = order_by if order_by in self._metadata.columns else None
+        load_plan = self._load_plan(relationship_to_load=relationship_to_load, raw=raw)
 
-            if relationship_to_load:
-                query = self._add_subquery_load(query=query, keys_subquery_load=relationship_to_load)
+        def build() -> Select | SelectOfScalar:
+            query = self._select(columns=columns, raw=raw, relationship_to_load=relationship_to_load)
 
-            if order_by and hasattr(self.model, order_by):
-                query = query.order_by(descending(order_by)) if desc else query.order_by(order_by)
+            query = self._add_relationship_load(query=query, load_plan=load_plan)
+
+            if order_by:
+                query = self._order_by(query=query, order_by=order_by, desc=desc)
+
+            return query.limit(1) if raw else query
 
-            return await session.scalar(query)
+        query, query_params = self._cached_statement(
+            shape=("find_one", columns, raw, tuple(load_plan.items()), order_by, desc), filters=filters, build=build
+        )
+
+        async with self.async_session_manager(read_only=self._use_read_only(read_only)) as session:
+            if raw:
+                row = (await session.execute(query, query_params)).mappings().first()
+                return dict(row) if row else None
+
+            return await session.scalar(query, query_params)
 
     async def find_paginated(
         self,
@@ -87,84 +335,618 @@ class Repository(RepositoryABC, ABC):
         filters: dict = None,
         order_by: str = None,
         desc: bool = False,
-        relationship_to_load: list[str] = None,
-    ) -> Page[Model]:
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+        columns: list[str] = None,
+        raw: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> OffsetPage[Model] | OffsetPage[dict]:
         """
         This method make query using params, filters, order and desc applied
         :param params: The obj Params (page and size)
         :param filters: A dict with filters, example {'id': 1, 'name': 'foo'}
         :param order_by: The field for ordering select in database
         :param desc: When False the select is using ASC, when True the select is using DESC
-        :param relationship_to_load:
-        :return: The object PaginationResult(items and count)
+        :param relationship_to_load: The relationship paths, example ['powers', 'powers.hero'], or a dict of path and
+                                     LoadStrategy, example {'powers': 'joined'}
+        :param read_only: When None the repository choose the database, True force read only and False force master
+        :param columns: Select only these columns, the others are not loaded in the Models
+        :param raw: The items are the rows as dicts without create the Models, faster to only serialize
+        :param count_mode: How the total is computed, EXACT count, NONE only has_next, CACHED count reused during
+                           count_cache_seconds and ESTIMATED by the planner (PostgreSQL without filters)
+        :return: The object OffsetPage(items, total, total_kind and has_next)
                 items: The data of select
-                count: with count of items for the filters
+                total: with count of items for the filters, None with CountMode.NONE
         """
         if not isinstance(params, Params):
             raise ValueError(f"params should be a Params obj, received {type(params)}")
 
-        async with self.async_session_manager() as session:
-            filters = self._sanitize_filters_from_model(filters=filters) if filters else {}
+        raw_params = params.to_raw_params()
+        use_read_only = self._use_read_only(read_only)
 
-            query = select(self.model)
+        filters = self._sanitize_filters_from_model(filters=filters) if filters else {}
+        order_by = order_by if order_by in self._metadata.columns else None
+        load_plan = self._load_plan(relationship_to_load=relationship_to_load, raw=raw)
 
-            if relationship_to_load:
-                query = self._add_joined_load(query=query, keys_joined_load=relationship_to_load)
+        def build() -> Select | SelectOfScalar:
+            query = self._select(columns=columns, raw=raw, relationship_to_load=relationship_to_load)
 
-            query = query.filter_by(**filters)
-            if order_by and hasattr(self.model, order_by):
-                query = query.order_by(descending(order_by)) if desc else query.order_by(order_by)
+            query = self._add_relationship_load(query=query, load_plan=load_plan)
+
+            if order_by:
+                query = self._order_by(query=query, order_by=order_by, desc=desc)
+
+            return query.limit(bindparam("page_limit", type_=Integer)).offset(bindparam("page_offset", type_=Integer))
+
+        query, query_params = self._cached_statement(
+            shape=("find_paginated", columns, raw, tuple(load_plan.items()), order_by, desc),
+            filters=filters,
+            build=build,
+        )
+        # Fetch one more item to know if has next page without count
+        query_params = {**query_params, "page_limit": raw_params.limit + 1, "page_offset": raw_params.offset}
+
+        async with self.async_session_manager(read_only=use_read_only) as session:
+            if self.__needs_count_query(filters=filters, count_mode=count_mode) and (
+                pool := self._reserve_concurrent_connections(session)
+            ):
+                try:
+                    # The count run in other connection at the same time of the page
+                    items, (total, total_kind) = await asyncio.gather(
+                        self.__fetch_page(session=session, query=query, query_params=query_params, raw=raw),
+                        self.__count_for_page_in_new_session(
+                            filters=filters, count_mode=count_mode, read_only=use_read_only
+                        ),
+                    )
+                finally:
+                    self._release_concurrent_connections(pool)
+            else:
+                items = await self.__fetch_page(session=session, query=query, query_params=query_params, raw=raw)
+                total, total_kind = await self._count_for_page(session=session, filters=filters, count_mode=count_mode)
+
+        has_next = len(items) > raw_params.limit
+
+        return OffsetPage.create(
+            items=items[: raw_params.limit],
+            params=params,
+            total=total,
+            total_kind=total_kind,
+            has_next=has_next,
+        )
+
+    @classmethod
+    async def __fetch_page(
+        cls, session: AsyncSession, query: Select | SelectOfScalar, query_params: dict, raw: bool
+    ) -> list:
+        if raw:
+            result = await session.execute(query, query_params)
+            return [dict(row) for row in result.mappings()]
+
+        scalar = await session.scalars(query, query_params)
+        return scalar.unique().all()
+
+    @classmethod
+    def _reserve_concurrent_connections(cls, session: AsyncSession) -> Pool | None:
+        """
+        Reserve the two connections of the page and of the count run at the same time, it can not inside a UnitOfWork
+        (the repositories share the session), when the engine pool has only one connection or when the pool do not
+        have two connections free, because the calls holding a connection while wait the second would deadlock the
+        pool, in these cases the count run after the page in the same connection
+        :return: The pool reserved, release it with _release_concurrent_connections, or None when not reserved
+        """
+        if is_unit_of_work_session(session):
+            return None
+
+        pool = session.bind.pool
+
+        if isinstance(pool, (StaticPool, SingletonThreadPool, AssertionPool)):
+            return None
+
+        if isinstance(pool, QueuePool) and pool._max_overflow >= 0:
+            reserved = _CONCURRENT_CONNECTIONS.get(pool, 0)
+
+            # The connections reserved and already checked out are counted twice, a conservative estimate
+            if pool.checkedout() + reserved + CONNECTIONS_PER_CONCURRENT_PAGE > pool.size() + pool._max_overflow:
+                return None
+
+        _CONCURRENT_CONNECTIONS[pool] = _CONCURRENT_CONNECTIONS.get(pool, 0) + CONNECTIONS_PER_CONCURRENT_PAGE
+        return pool
+
+    @classmethod
+    def _release_concurrent_connections(cls, pool: Pool) -> None:
+        _CONCURRENT_CONNECTIONS[pool] -= CONNECTIONS_PER_CONCURRENT_PAGE
+
+    def __needs_count_query(self, filters: dict, count_mode: CountMode) -> bool:
+        if count_mode == CountMode.NONE:
+            return False
+
+        return count_mode != CountMode.CACHED or self._count_cache.get(self.__count_cache_key(filters=filters)) is None
+
+    async def __count_for_page_in_new_session(
+        self, filters: dict, count_mode: CountMode, read_only: bool
+    ) -> tuple[int | None, CountMode]:
+        async with self.async_session_manager(read_only=read_only) as session:
+            return await self._count_for_page(session=session, filters=filters, count_mode=count_mode)
+
+    @classmethod
+    def __count_cache_key(cls, filters: dict) -> str:
+        return json.dumps(filters, sort_keys=True, default=str)
+
+    async def _count_for_page(
+        self, session: AsyncSession, filters: dict, count_mode: CountMode
+    ) -> tuple[int | None, CountMode]:
+        """
+        Compute the total of find_paginated
+        :return: The total and the CountMode used, ESTIMATED and CACHED fall back to EXACT when can not be used
+        """
+        if count_mode == CountMode.NONE:
+            return None, CountMode.NONE
+
+        if count_mode == CountMode.ESTIMATED and not filters and session.bind.dialect.name == "postgresql":
+            estimated = await session.scalar(
+                text(POSTGRES_ESTIMATED_COUNT_STATEMENT), {"table_name": self.model.__tablename__}
+            )
+
+            # reltuples is -1 (or 0 in old versions) until the first VACUUM/ANALYZE of table
+            if estimated and estimated > 0:
+                return estimated, CountMode.ESTIMATED
 
-            return await paginate(session=session, query=query, params=params)
+        if count_mode == CountMode.CACHED:
+            if (total := self._count_cache.get(self.__count_cache_key(filters=filters))) is not None:
+                return total, CountMode.CACHED
+
+            total = await session.scalar(*self.__count_query(filters=filters))
+            self._count_cache.set(self.__count_cache_key(filters=filters), total)
+            return total, CountMode.CACHED
+
+        return await session.scalar(*self.__count_query(filters=filters)), CountMode.EXACT
+
+    def __count_query(self, filters: dict) -> tuple[SelectOfScalar, dict]:
+        return self._cached_statement(
+            shape=("count",), filters=filters, build=lambda: select([func.count()]).select_from(self.model)
+        )
+
+    def _get_primary_key_column(self) -> Column:
+        return self._metadata.primary_key
+
+    async def get_many_by_pks(
+        self, pks: list[any], pk_field: str = None, chunk_size: int = 1000, read_only: bool = None
+    ) -> dict[any, Model]:
+        """
+        This method find the items of a list of primary keys with one SELECT ... WHERE pk IN (...) per chunk
+        :param pks: The primary keys, the repeated are selected once
+        :param pk_field: The unique field used as key, default is the primary key
+        :param chunk_size: The max number of primary keys in each SELECT
+        :param read_only: When None the repository choose the database, True force read only and False force master
+        :return: A dict of primary key and item, the primary keys that do not exist are not in the dict
+        """
+        pk_name = pk_field or self._get_primary_key_name()
+        column = self._metadata.columns[pk_name]
+        pks = list(dict.fromkeys(pks))
+        items = {}
+
+        if not pks:
+            return items
+
+        async with self.async_session_manager(read_only=self._use_read_only(read_only)) as session:
+            for chunk in self._chunks(pks, chunk_size):
+                for obj in await session.scalars(select(self.model).where(column.in_(chunk))):
+                    items[getattr(obj, pk_name)] = obj
+
+        return items
+
+    async def find_cursor_paginated(
+        self,
+        params: CursorParams = CursorParams(),
+        filters: dict = None,
+        order_by: str = None,
+        desc: bool = False,
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+    ) -> CursorPage[Model]:
+        """
+        This method paginate by the ordered key (order_by + primary key) instead of OFFSET, so the deep pages are as
+        fast as the first one when the key is indexed
+        :param params: The obj CursorParams (size, cursor and include_total)
+        :param filters: A dict with filters, example {'id': 1, 'name': 'foo'}
+        :param order_by: The field for ordering select in database, the primary key is always the tiebreaker,
+                         it should be not nullable
+        :param desc: When False the select is using ASC, when True the select is using DESC
+        :param relationship_to_load: The relationship paths, example ['powers', 'powers.hero'], or a dict of path and
+                                     LoadStrategy, example {'powers': 'joined'}
+        :param read_only: When None the repository choose the database, True force read only and False force master
+        :return: The object CursorPage(items, next_cursor and total only when params.include_total)
+        """
+        if not isinstance(params, CursorParams):
+            raise ValueError(f"params should be a CursorParams obj, received {type(params)}")
+
+        key_names = [self._get_primary_key_name()]
+        if order_by in self._metadata.columns and order_by != key_names[0]:
+            if self._metadata.columns[order_by].nullable:
+                # The rows with NULL are never greater or lower than the cursor, they would be skipped in all pages
+                raise ValueError(
+                    f"order_by of find_cursor_paginated should be a not nullable column, received {order_by}"
+                )
+
+            key_names.insert(0, order_by)
+
+        key_columns = [self._metadata.columns[name] for name in key_names]
+
+        filters = self._sanitize_filters_from_model(filters=filters) if filters else {}
+        query = select(self.model).where(*self._filter_clauses(filters))
+        query = self._add_relationship_load(query=query, load_plan=self._load_plan(relationship_to_load))
+
+        if params.cursor:
+            last_key = tuple_(*decode_cursor(cursor=params.cursor, columns=key_columns))
+            query = query.where(tuple_(*key_columns) < last_key if desc else tuple_(*key_columns) > last_key)
+
+        query = query.order_by(*[column.desc() if desc else column.asc() for column in key_columns])
+
+        # Fetch one more item to know if has next page without count
+        query = query.limit(params.size + 1)
+
+        async with self.async_session_manager(read_only=self._use_read_only(read_only)) as session:
+            scalar = await session.scalars(query)
+            items = scalar.unique().all()
+
+        next_cursor = None
+        if len(items) > params.size:
+            items = items[: params.size]
+            next_cursor = encode_cursor([getattr(items[-1], name) for name in key_names])
+
+        return CursorPage[self.model](
+            items=items,
+            size=params.size,
+            next_cursor=next_cursor,
+            total=(
+                await self.__count_by_filters_query(filters=filters, read_only=read_only)
+                if params.include_total
+                else None
+            ),
+        )
 
     async def find_all(
         self,
         filters: dict = None,
         order_by: str = None,
         desc: bool = False,
-        relationship_to_load: list[str] = None,
-    ) -> list[Model]:
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+        columns: list[str] = None,
+        raw: bool = False,
+    ) -> list[Model] | list[dict[str, any]]:
         """
         This method make query using params, filters, order and desc applied
         :param filters: A dict with filters, example {'id': 1, 'name': 'foo'}
         :param order_by: The field for ordering select in database
         :param desc: When False the select is using ASC, when True the select is using DESC
-        :param relationship_to_load:
-        :return: Return a list of Models
+        :param relationship_to_load: The relationship paths, example ['powers', 'powers.hero'], or a dict of path and
+                                     LoadStrategy, example {'powers': 'joined'}
+        :param read_only: When None the repository choose the database, True force read only and False force master
+        :param columns: Select only these columns, the others are not loaded in the Models
+        :param raw: Return the rows as dicts without create the Models, faster to only serialize
+        :return: Return a list of Models or dicts
         """
-        async with self.async_session_manager() as session:
-            filters = self._sanitize_filters_from_model(filters=filters) if filters else {}
-            query = select(self.model)
+        filters = self._sanitize_filters_from_model(filters=filters) if filters else {}
+        order_by = order_by if order_by in self._metadata.columns else None
+        load_plan = self._load_plan(relationship_to_load=relationship_to_load, raw=raw)
 
-            if relationship_to_load:
-                query = self._add_joined_load(query=query, keys_joined_load=relationship_to_load)
+        def build() -> Select | SelectOfScalar:
+            query = self._select(columns=columns, raw=raw, relationship_to_load=relationship_to_load)
 
-            query = query.filter_by(**filters)
+            query = self._add_relationship_load(query=query, load_plan=load_plan)
 
-            if order_by and hasattr(self.model, order_by):
-                query = query.order_by(descending(order_by)) if desc else query.order_by(order_by)
+            if order_by:
+                query = self._order_by(query=query, order_by=order_by, desc=desc)
 
-            scalar = await session.scalars(query)
+            return query
+
+        query, query_params = self._cached_statement(
+            shape=("find_all", columns, raw, tuple(load_plan.items()), order_by, desc), filters=filters, build=build
+        )
+
+        async with self.async_session_manager(read_only=self._use_read_only(read_only)) as session:
+            if raw:
+                result = await session.execute(query, query_params)
+                return [dict(row) for row in result.mappings()]
+
+            scalar = await session.scalars(query, query_params)
             return scalar.unique().all()
 
-    async def __count_by_filters_query(self, filters: dict) -> int | None:
+    async def find_stream(
+        self,
+        filters: dict = None,
+        order_by: str = None,
+        desc: bool = False,
+        relationship_to_load: RelationshipToLoad = None,
+        batch_size: int = 1000,
+        read_only: bool = None,
+    ) -> AsyncIterator[Model]:
+        """
+        This method stream the items with a server-side cursor, fetching batch_size rows per round-trip, so exports
+        and batch jobs keep constant memory, example: CSVExporter.to_csv_streaming_response(repo.find_stream())
+        :param filters: A dict with filters, example {'id': 1, 'name': 'foo'}
+        :param order_by: The field for ordering select in database
+        :param desc: When False the select is using ASC, when True the select is using DESC
+        :param relationship_to_load: The relationship paths or a dict of path and LoadStrategy, loaded per batch
+                                     (selectin), the joined and subquery strategies raise ValueError because they
+                                     can not be streamed
+        :param batch_size: The number of rows fetched per round-trip
+        :param read_only: When None the repository choose the database, True force read only and False force master
+        :return: AsyncIterator of Models
+        """
+        load_plan = self._load_plan(relationship_to_load)
+
+        if streamless := [path for path, strategy in load_plan.items() if strategy in STREAMLESS_LOAD_STRATEGIES]:
+            raise ValueError(f"find_stream can not load the relationships {streamless} with joined or subquery")
+
+        filters = self._sanitize_filters_from_model(filters=filters) if filters else {}
+        query = select(self.model).where(*self._filter_clauses(filters))
+        query = self._add_relationship_load(query=query, load_plan=load_plan)
+
+        if order_by in self._metadata.columns:
+            query = self._order_by(query=query, order_by=order_by, desc=desc)
+
+        query = query.execution_options(yield_per=batch_size)
+
+        async with self.async_session_manager(read_only=self._use_read_only(read_only)) as session:
+            result = await session.stream_scalars(query)
+
+            async for batch in result.partitions(batch_size):
+                for obj in batch:
+                    yield obj
+
+                # Remove the batch from identity map to keep the memory constant
+                for obj in batch:
+                    session.expunge(obj)
+
+    async def find_in_batches(
+        self,
+        batch_size: int = 1000,
+        filters: dict = None,
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+        after_pk: any = None,
+    ) -> AsyncIterator[list[Model]]:
+        """
+        This method walk the items ordered by primary key in batches, each batch is a WHERE pk > last_pk LIMIT query
+        in a short session, so the last batches are as fast as the first one and no transaction stay open in the job
+        :param batch_size: The max number of items per batch
+        :param filters: A dict with filters, example {'id': 1, 'name': 'foo'}
+        :param relationship_to_load: The relationship paths or a dict of path and LoadStrategy
+        :param read_only: When None the repository choose the database, True force read only and False force master
+        :param after_pk: Start after this primary key, example: the checkpoint of a job stopped
+        :return: AsyncIterator of lists of Models
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size should be greater than 0, received {batch_size}")
+
+        primary_key = self._get_primary_key_column()
+        filters = self._sanitize_filters_from_model(filters=filters) if filters else {}
+        load_plan = self._load_plan(relationship_to_load)
+        last_pk = after_pk
+
+        def build(has_last_pk: bool) -> SelectOfScalar:
+            query = self._add_relationship_load(query=select(self.model), load_plan=load_plan)
+
+            if has_last_pk:
+                query = query.where(primary_key > bindparam("batch_last_pk"))
+
+            return query.order_by(primary_key).limit(bindparam("batch_limit", type_=Integer))
+
+        while True:
+            has_last_pk = last_pk is not None
+            query, query_params = self._cached_statement(
+                shape=("find_in_batches", tuple(load_plan.items()), has_last_pk),
+                filters=filters,
+                build=functools.partial(build, has_last_pk),
+            )
+            query_params = {**query_params, "batch_limit": batch_size}
+            if has_last_pk:
+                query_params["batch_last_pk"] = last_pk
+
+            async with self.async_session_manager(read_only=self._use_read_only(read_only)) as session:
+                batch = (await session.scalars(query, query_params)).unique().all()
+
+            if batch:
+                yield batch
+
+            if len(batch) < batch_size:
+                return
+
+            last_pk = getattr(batch[-1], self._get_primary_key_name())
+
+    async def process_in_batches(
+        self,
+        process: Callable[[list[Model]], Awaitable[None]],
+        batch_size: int = 1000,
+        concurrency: int = 1,
+        filters: dict = None,
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+        checkpoint: BatchCheckpointABC = None,
+    ) -> int:
+        """
+        This method call process with each batch of find_in_batches, with up to concurrency batches processed at the
+        same time while the next batch is selected. The checkpoint save the primary key of the last batch processed
+        with all the previous batches also processed, so a job stopped (error or deploy) restart after it
+        :param process: The async function that process a batch
+        :param batch_size: The max number of items per batch
+        :param concurrency: The max number of batches processed at the same time
+        :param filters: A dict with filters, example {'id': 1, 'name': 'foo'}
+        :param relationship_to_load: The relationship paths or a dict of path and LoadStrategy
+        :param read_only: When None the repository choose the database, True force read only and False force master
+        :param checkpoint: Where the progress is saved, it is cleared when all items are processed
+        :return: The number of items processed in this call
+        :raise: The exception of process, the batches still running are cancelled
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency should be greater than 0, received {concurrency}")
+
+        primary_key_name = self._get_primary_key_name()
+        after_pk = None
+        if checkpoint and (saved_pk := await checkpoint.load()) is not None:
+            after_pk = self._metadata.coerce(column_name=primary_key_name, value=saved_pk)
+
+        # The batches in order of primary key: (last pk, number of items, task)
+        in_flight: deque[tuple[any, int, asyncio.Task]] = deque()
+        processed = 0
+
+        try:
+            async for batch in self.find_in_batches(
+                batch_size=batch_size,
+                filters=filters,
+                relationship_to_load=relationship_to_load,
+                read_only=read_only,
+                after_pk=after_pk,
+            ):
+                processed += await self.__wait_batches(in_flight, checkpoint=checkpoint, max_running=concurrency - 1)
+                in_flight.append(
+                    (getattr(batch[-1], primary_key_name), len(batch), asyncio.create_task(process(batch)))
+                )
+
+            processed += await self.__wait_batches(in_flight, checkpoint=checkpoint, max_running=0)
+        except BaseException:
+            for _, _, task in in_flight:
+                task.cancel()
+            await asyncio.gather(*(task for _, _, task in in_flight), return_exceptions=True)
+            raise
+
+        if checkpoint:
+            await checkpoint.clear()
+
+        return processed
+
+    @classmethod
+    async def __wait_batches(
+        cls, in_flight: deque[tuple[any, int, asyncio.Task]], checkpoint: BatchCheckpointABC | None, max_running: int
+    ) -> int:
+        """
+        Wait until at most max_running batches are running and remove the batches done in order of primary key
+        :return: The number of items of batches removed
+        """
+        while len(running := [task for _, _, task in in_flight if not task.done()]) > max_running:
+            await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+        for _, _, task in in_flight:
+            if task.done() and task.exception():
+                raise task.exception()
+
+        processed, last_pk = 0, None
+        while in_flight and in_flight[0][2].done():
+            last_pk, size, _ = in_flight.popleft()
+            processed += size
+
+        if checkpoint and processed:
+            await checkpoint.save(last_pk)
+
+        return processed
+
+    async def __count_by_filters_query(self, filters: dict, read_only: bool = None) -> int | None:
         """
         Rerturn count of query
         :param filters:
+        :param read_only:
         :return: int
         """
-        async with self.async_session_manager() as session:
-            query = select([func.count()]).select_from(self.model).filter_by(**filters)
-            return await session.scalar(query)
+        async with self.async_session_manager(read_only=self._use_read_only(read_only)) as session:
+            return await session.scalar(*self.__count_query(filters=filters))
 
-    async def count(self, filters: dict = None) -> int:
+    async def count(self, filters: dict = None, read_only: bool = None) -> int:
         """
         This method count items with filters
         :param filters: A dict with filters, example {'id': 1, 'name': 'foo'}
+        :param read_only: When None the repository choose the database, True force read only and False force master
         :return: Return int that represent the count of query
         """
         filters = self._sanitize_filters_from_model(filters=filters) if filters else {}
-        return await self.__count_by_filters_query(filters=filters)
+        return await self.__count_by_filters_query(filters=filters, read_only=read_only)
+
+    async def exists(self, filters: dict = None, read_only: bool = None) -> bool:
+        """
+        This method check if there is an item with filters using SELECT EXISTS, the database stop in the first row
+        :param filters: A dict with filters, example {'id': 1, 'name': 'foo'}
+        :param read_only: When None the repository choose the database, True force read only and False force master
+        :return: True when at least one item match the filters
+        """
+        filters = self._sanitize_filters_from_model(filters=filters) if filters else {}
+        query, query_params = self._cached_statement(
+            shape=("exists",), filters=filters, build=lambda: select(self._get_primary_key_column())
+        )
+
+        async with self.async_session_manager(read_only=self._use_read_only(read_only)) as session:
+            return bool(await session.scalar(select(query.exists()), query_params))
+
+    async def aggregate(
+        self,
+        aggregations: dict[str, tuple[AggregateFunction | str, str | None]],
+        group_by: list[str] = None,
+        filters: dict = None,
+        order_by: str = None,
+        desc: bool = False,
+        read_only: bool = None,
+    ) -> list[dict[str, any]]:
+        """
+        This method group and aggregate the items in database, only the result rows are transferred
+        :param aggregations: A dict of label and (function, column), example {'total': ('count', None),
+        'max_age': ('max', 'age')}, the functions are count, sum, avg, min and max, count without column is COUNT(*)
+        :param group_by: The columns of groups, when None aggregate all items in one row
+        :param filters: A dict with filters, example {'id': 1, 'name': 'foo'}
+        :param order_by: A column of group_by or a label of aggregations for ordering
+        :param desc: When False the select is using ASC, when True the select is using DESC
+        :param read_only: When None the repository choose the database, True force read only and False force master
+        :return: A list of dicts with the columns of group_by and the labels of aggregations
+        :raise: ValueError when a column, function or label is invalid
+        """
+        group_by = group_by or []
+        filters = self._sanitize_filters_from_model(filters=filters) if filters else {}
+
+        if not aggregations:
+            raise ValueError("aggregations should have at least one aggregate")
+
+        invalid_columns = [
+            column_name
+            for column_name in [*group_by, *(column_name for _, column_name in aggregations.values())]
+            if column_name is not None and column_name not in self._metadata.columns
+        ]
+        if invalid_columns:
+            raise ValueError(f"{invalid_columns} should be valid fields of {self.model.__name__}")
+
+        if repeated_labels := set(aggregations) & set(group_by):
+            raise ValueError(f"The labels {sorted(repeated_labels)} are columns of group_by")
+
+        aggregates = {
+            label: (AggregateFunction(function), column_name) for label, (function, column_name) in aggregations.items()
+        }
+        order_by = order_by if order_by in group_by or order_by in aggregates else None
+
+        def build() -> Select:
+            query = select_columns(
+                *(self._labeled_column(column_name) for column_name in group_by),
+                *(
+                    build_aggregate(
+                        function=function,
+                        column=self._metadata.columns[column_name] if column_name else None,
+                    ).label(label)
+                    for label, (function, column_name) in aggregates.items()
+                ),
+            ).select_from(self.model)
+
+            if group_by:
+                query = query.group_by(*(self._metadata.columns[column_name] for column_name in group_by))
+
+            if order_by:
+                query = query.order_by(descending(order_by)) if desc else query.order_by(order_by)
+
+            return query
+
+        query, query_params = self._cached_statement(
+            shape=("aggregate", tuple(aggregates.items()), group_by, order_by, desc), filters=filters, build=build
+        )
+
+        async with self.async_session_manager(read_only=self._use_read_only(read_only)) as session:
+            result = await session.execute(query, query_params)
+            return [dict(row) for row in result.mappings()]
 
     def __create_new_obj(self, obj: dict[str, any] | SQLModel) -> SQLModel:
         if isinstance(obj, SQLModel):
@@ -191,78 +973,467 @@ class Repository(RepositoryABC, ABC):
         new_obj = self.__create_new_obj(obj=obj)
         async with self.async_session_manager() as session:
             session.add(new_obj)
-            await session.commit()
+            await self._commit(session)
             await session.refresh(new_obj)
             return new_obj
 
-    async def bulk_create(self, objs: list[dict[str, any] | SQLModel]) -> list[Model]:
+    @classmethod
+    def _supports_returning(cls, session: AsyncSession) -> bool:
+        return session.bind.dialect.full_returning
+
+    @classmethod
+    def _chunks(cls, items: list, chunk_size: int) -> list[list]:
+        return [items[index : index + chunk_size] for index in range(0, len(items), chunk_size)]
+
+    def __has_related_objects(self, obj: SQLModel) -> bool:
+        state = inspect(obj)
+        return any(state.dict.get(relationship.key) for relationship in state.mapper.relationships)
+
+    def __group_by_columns(self, objs: list[SQLModel]) -> list[tuple[tuple[str, ...], list[SQLModel]]]:
+        """
+        Group the objects by the columns that they have (not None), the INSERT of each group only has these columns,
+        so the columns missing use their default (server, Python or autoincrement) instead of NULL.
+        The objects without columns are alone in their group, they are inserted with DEFAULT VALUES
+        """
+        groups: dict[tuple[str, ...], list[SQLModel]] = {}
+        alone: list[tuple[tuple[str, ...], list[SQLModel]]] = []
+
+        for obj in objs:
+            names = tuple(name for name in self._metadata.columns if getattr(obj, name) is not None)
+
+            if names:
+                groups.setdefault(names, []).append(obj)
+            else:
+                alone.append((names, [obj]))
+
+        return [*groups.items(), *alone]
+
+    def __insert_rows(self, names: tuple[str, ...], objs: list[SQLModel]) -> list[dict] | dict:
         """
-        This method create objects in database
+        :return: The VALUES of INSERT by column key, one row is a dict because VALUES of an empty dict is
+                 DEFAULT VALUES
+        """
+        rows = [{self._metadata.columns[name].key: getattr(obj, name) for name in names} for obj in objs]
+        return rows if len(rows) > 1 else rows[0]
+
+    @classmethod
+    def __match_key(cls, values: tuple) -> tuple:
+        # The unhashable values (example: JSON) are compared by their JSON
+        return tuple(
+            value if isinstance(value, Hashable) else json.dumps(value, sort_keys=True, default=str) for value in values
+        )
+
+    async def __insert_returning(self, session: AsyncSession, new_objs: list[SQLModel]) -> None:
+        """
+        Insert the objects with one multi-row INSERT ... RETURNING per group of columns and load the server
+        generated columns in the objects.
+        The database do not guarantee the order of RETURNING, so each row is matched to its object by the primary key
+        when it was informed, otherwise by the values inserted (the objects with the same values are interchangeable)
+        """
+        table = self.model.__table__
+        primary_key_name = self._get_primary_key_name()
+
+        for names, group in self.__group_by_columns(new_objs):
+            result = await session.execute(
+                insert(table).values(self.__insert_rows(names, group)).returning(*self._metadata.columns.values())
+            )
+
+            key_names = (primary_key_name,) if primary_key_name in names else names
+            key_columns = [self._metadata.columns[name] for name in key_names]
+            pending: dict[tuple, list[SQLModel]] = {}
+
+            for obj in group:
+                pending.setdefault(self.__match_key(tuple(getattr(obj, name) for name in key_names)), []).append(obj)
+
+            for row in result.all():
+                objs = pending.get(self.__match_key(tuple(row._mapping[column] for column in key_columns)))
+
+                if not objs:
+                    raise ValueError(
+                        f"bulk_create can not match a row of RETURNING to a {self.model.__name__}, the database "
+                        f"changed the values inserted of {list(key_names)}"
+                    )
+
+                obj = objs.pop()
+
+                for name, column in self._metadata.columns.items():
+                    setattr(obj, name, row._mapping[column])
+
+                make_transient_to_detached(obj)
+                session.add(obj)
+
+    async def bulk_create(self, objs: list[dict[str, any] | SQLModel], chunk_size: int = 1000) -> list[Model]:
+        """
+        This method create objects in database with one INSERT ... RETURNING per chunk and columns informed (the
+        columns None use their default), when the database do not support RETURNING or the objects have related
+        objects to cascade the insert is made by the session
         :param objs:
+        :param chunk_size: The max number of rows in each INSERT
         :return:
         """
         new_objs = [self.__create_new_obj(obj=obj) for obj in objs]
-        async with self.async_session_manager() as session:
-            for new_obj in new_objs:
-                session.add(new_obj)
 
-            await session.commit()
+        if not new_objs:
+            return []
 
-            await asyncio.gather(*[session.refresh(new_obj) for new_obj in new_objs])
+        async with self.async_session_manager() as session:
+            if self._supports_returning(session) and not any(self.__has_related_objects(obj) for obj in new_objs):
+                for chunk in self._chunks(new_objs, chunk_size):
+                    await self.__insert_returning(session=session, new_objs=chunk)
+            else:
+                session.add_all(new_objs)
+
+            await self._commit(session)
 
             return new_objs
 
+    def __insert_with_conflict_update(
+        self,
+        dialect_name: str,
+        rows: list[dict] | dict,
+        conflict_target: list[str],
+        set_columns: list[str],
+        onupdate_values: dict[str, any],
+    ):
+        table = self.model.__table__
+
+        if dialect_name in ("postgresql", "sqlite"):
+            dialect_insert = postgresql_insert if dialect_name == "postgresql" else sqlite_insert
+            query = dialect_insert(table).values(rows)
+
+            if not set_columns:
+                return query.on_conflict_do_nothing(index_elements=conflict_target)
+
+            return query.on_conflict_do_update(
+                index_elements=conflict_target,
+                set_={**{key: query.excluded[key] for key in set_columns}, **onupdate_values},
+            )
+
+        if dialect_name == "mysql":
+            # MySQL use all unique keys of table as conflict target
+            query = mysql_insert(table).values(rows)
+            return query.on_duplicate_key_update(
+                {**{key: query.inserted[key] for key in set_columns or conflict_target}, **onupdate_values}
+            )
+
+        raise ValueError(f"bulk_upsert do not support the database {dialect_name}")
+
+    async def bulk_upsert(
+        self,
+        objs: list[dict[str, any] | SQLModel],
+        conflict_target: list[str] = None,
+        update_columns: list[str] = None,
+        chunk_size: int = 1000,
+        returning: bool = False,
+    ) -> list[Model] | int:
+        """
+        This method insert the objects or update them when exist, with one INSERT ... ON CONFLICT DO UPDATE per chunk
+        (ON DUPLICATE KEY UPDATE in MySQL), the rows of chunk with the same columns (not None) are in the same INSERT
+        :param objs: The dicts or models, the columns None are not inserted, so they use their default
+        :param conflict_target: The columns of unique index that identify the row, default is the primary key
+        :param update_columns: The columns updated when the row exist, default are the fields informed and not None
+                               in each obj (dict keys or fields set in model), [] do nothing when the row exist
+        :param chunk_size: The max number of rows in each INSERT
+        :param returning: When True and the database support RETURNING return the rows, otherwise the count
+        :return: The list of models upserted or the number of rows affected
+        """
+        new_objs = [self.__create_new_obj(obj=obj) for obj in objs]
+
+        if not new_objs:
+            return [] if returning else 0
+
+        conflict_target = conflict_target or [self._get_primary_key_name()]
+
+        if invalid_columns := [name for name in conflict_target if name not in self._metadata.columns]:
+            raise ValueError(
+                f"conflict_target should be valid fields of {self.model.__name__}, received {invalid_columns}"
+            )
+
+        update_fields_set = update_columns is None
+
+        if update_fields_set:
+            update_columns = {field for obj in new_objs for field in obj.__fields_set__}
+
+        set_names = [name for name in self._metadata.columns if name in update_columns and name not in conflict_target]
+        upserted = []
+        affected = 0
+
+        async with self.async_session_manager() as session:
+            use_returning = returning and self._supports_returning(session)
+
+            for chunk in self._chunks(new_objs, chunk_size):
+                for names, group in self.__group_by_columns(chunk):
+                    # By default a row only update the columns that it informed
+                    group_set_names = [name for name in set_names if name in names] if update_fields_set else set_names
+                    query = self.__insert_with_conflict_update(
+                        dialect_name=session.bind.dialect.name,
+                        rows=self.__insert_rows(names, group),
+                        conflict_target=[self._metadata.columns[name].key for name in conflict_target],
+                        set_columns=[self._metadata.columns[name].key for name in group_set_names],
+                        onupdate_values=(
+                            self.__column_keys(self.__get_onupdate_values(group_set_names)) if group_set_names else {}
+                        ),
+                    )
+
+                    if use_returning:
+                        result = await session.execute(query.returning(*self._metadata.columns.values()))
+                        upserted.extend(self._model_from_row(row) for row in result.all())
+                    else:
+                        result = await session.execute(query)
+                        affected += result.rowcount
+
+            await self._commit(session)
+
+        return upserted if use_returning else affected
+
+    def _model_from_row(self, row: Row) -> Model:
+        """
+        Build the model from a row of RETURNING, detached with identity key as the objects loaded by session
+        """
+        obj = self.model(**{name: row._mapping[column] for name, column in self._metadata.columns.items()})
+        make_transient_to_detached(obj)
+        return obj
+
     @classmethod
     def __update_obj(cls, obj: SQLModel, update_values: dict[str, any] | SQLModel = None) -> Model:
         if isinstance(obj, SQLModel) and update_values is None:
             return obj
 
-        obj_data = jsonable_encoder(obj)
-
         if isinstance(update_values, dict):
             update_data = update_values
         else:
             update_data = update_values.dict(exclude_unset=True)
 
-        for field in obj_data:
-            if field in update_data:
-                setattr(obj, field, update_data[field])
+        for field, value in update_data.items():
+            # Set only the changed values, the others would be written in the UPDATE
+            if field in obj.__fields__ and getattr(obj, field) != value:
+                setattr(obj, field, value)
 
         return obj
 
     async def update(self, obj: SQLModel, update_values: dict[str, any] | SQLModel = None) -> Model:
         """
-        This method update the model in database
+        This method update the model in database, only the changed columns and the mutable ones (JSON, ARRAY and
+        PickleType, their changes in place are not tracked) are written and the database is not used when nothing
+        changed, the values generated by the database in the UPDATE are loaded in the model
         :param obj: The Model in a database
         :param update_values: The BaseModel with field and data
         :return: The Model updated
         """
         obj_to_update = self.__update_obj(obj=obj, update_values=update_values)
+        state = inspect(obj_to_update)
+
+        # The changes in place of mutable values (example: a dict of JSON column) do not have history
+        for name in self._mutable_columns:
+            if name in state.dict:
+                flag_modified(obj_to_update, name)
+
+        if not state.transient and not any(attr.history.has_changes() for attr in state.attrs):
+            return obj_to_update
+
         async with self.async_session_manager() as session:
-            obj_to_save = await session.merge(obj_to_update)
-            session.add(obj_to_save)
-            await session.commit()
-            await session.refresh(obj_to_save)
-            return obj_to_save
+            if state.transient or (state.session is not None and state.session is not session.sync_session):
+                # The model was not loaded from database or is in other session, merge select it by primary key
+                obj_to_save = await session.merge(obj_to_update)
+                await self._commit(session)
+                await session.refresh(obj_to_save)
+                return obj_to_save
+
+            session.add(obj_to_update)
+            await self._commit(session)
 
-    async def bulk_update(self, objs: list[SQLModel]) -> list[Model]:
+            # The values generated by the database in the UPDATE (example: server_onupdate) are expired by the flush
+            if expired_attributes := inspect(obj_to_update).expired_attributes:
+                await session.refresh(obj_to_update, attribute_names=list(expired_attributes))
+
+            return obj_to_update
+
+    def __get_changed_columns(self, obj: SQLModel) -> list[str]:
+        state = inspect(obj)
+        primary_key_name = self._get_primary_key_name()
+
+        return [
+            name
+            for name in self._metadata.columns
+            if name != primary_key_name and state.attrs[name].history.has_changes()
+        ]
+
+    def __get_onupdate_values(self, changed_columns: list[str]) -> dict[str, any]:
+        """
+        Compute the python onupdate values (example ModelBase.updated_at) to keep the objects equal to the database
+        :return: The values by name of field
         """
-        This method update the models in database
+        onupdate_values = {}
+
+        for name, column in self._metadata.columns.items():
+            if name in changed_columns or column.onupdate is None or column.onupdate.is_clause_element:
+                continue
+
+            onupdate_values[name] = column.onupdate.arg(None) if column.onupdate.is_callable else column.onupdate.arg
+
+        return onupdate_values
+
+    def __column_keys(self, values: dict[str, any]) -> dict[str, any]:
+        """
+        :return: The values by name of field keyed by the column of table, to the Core statements of table
+        """
+        return {self._metadata.columns[name].key: value for name, value in values.items()}
+
+    def __filters_for_bulk_write(self, filters: dict) -> dict:
+        """
+        Validate the filters of a write, an invalid or empty filter can not be ignored because would write all rows
+        """
+        sanitized_filters = self._sanitize_filters_from_model(filters=filters or {})
+
+        if not sanitized_filters or len(sanitized_filters) != len(filters):
+            raise ValueError(f"filters should be valid fields of {self.model.__name__}, received {filters}")
+
+        return sanitized_filters
+
+    async def bulk_update(self, objs: list[SQLModel], chunk_size: int = 1000) -> list[Model]:
+        """
+        This method update the models in database with executemany UPDATE by primary key, writing only the changed
+        columns, the objects grouped by the changed columns and objects without changes are skipped
         :param objs:
-        :return:
+        :param chunk_size: The max number of objects in each executemany
+        :return: The objects updated
         """
-        objs_to_update = [self.__update_obj(obj=obj) for obj in objs]
+        primary_key = self._get_primary_key_column()
+        primary_key_name = self._get_primary_key_name()
+        groups: dict[tuple[str, ...], list[SQLModel]] = {}
+
+        for obj in objs:
+            if getattr(obj, primary_key_name) is None:
+                raise ValueError(f"bulk_update received a {self.model.__name__} without {primary_key_name}")
+
+            if changed_columns := self.__get_changed_columns(obj):
+                groups.setdefault(tuple(changed_columns), []).append(obj)
+
+        if not groups:
+            return list(objs)
+
         async with self.async_session_manager() as session:
-            objs_to_save = await asyncio.gather(*[session.merge(new_obj) for new_obj in objs_to_update])
+            for changed_columns, group in groups.items():
+                onupdate_values = self.__get_onupdate_values(list(changed_columns))
+                query = (
+                    update(self.model.__table__)
+                    .where(primary_key == bindparam("pk_value"))
+                    .values(
+                        self.__column_keys(
+                            {key: bindparam(f"new_{key}") for key in (*changed_columns, *onupdate_values)}
+                        )
+                    )
+                )
 
-            for obj_to_save in objs_to_save:
-                session.add(obj_to_save)
+                for chunk in self._chunks(group, chunk_size):
+                    await session.execute(
+                        query,
+                        [
+                            {
+                                "pk_value": getattr(obj, primary_key_name),
+                                **{f"new_{key}": getattr(obj, key) for key in changed_columns},
+                                **{f"new_{key}": value for key, value in onupdate_values.items()},
+                            }
+                            for obj in chunk
+                        ],
+                    )
 
-            await session.commit()
+                for obj in group:
+                    for key in changed_columns:
+                        set_committed_value(obj, key, getattr(obj, key))
+
+                    for key, value in onupdate_values.items():
+                        set_committed_value(obj, key, value)
+
+            await self._commit(session)
+
+        return list(objs)
+
+    async def update_by_filters(self, filters: dict, values: dict[str, any]) -> int:
+        """
+        This method update all rows of filters in one UPDATE ... WHERE
+        :param filters: A dict with filters, example {'name': 'foo'}, should not be empty
+        :param values: A dict with the new values, example {'name': 'bar'}
+        :return: The number of rows updated
+        """
+        filters = self.__filters_for_bulk_write(filters=filters)
+        values = {key: value for key, value in values.items() if key in self._metadata.columns}
 
-            await asyncio.gather(*[session.refresh(new_obj) for new_obj in objs_to_save])
+        if not values:
+            return 0
 
-            return list(objs_to_save)
+        async with self.async_session_manager() as session:
+            result = await session.execute(
+                update(self.model)
+                .where(*self._filter_clauses(filters))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            await self._commit(session)
+            return result.rowcount
+
+    def _get_pk_column(self, pk_field: str = None) -> Column:
+        return self._metadata.columns[pk_field] if pk_field else self._get_primary_key_column()
+
+    def _needs_orm_update(self) -> bool:
+        """
+        The UPDATE ... WHERE pk do not run the mapper events of update and the ON UPDATE cascades made by the ORM
+        (relationships with passive_updates=False), the models with them are updated by the ORM
+        """
+        mapper = inspect(self.model)
+
+        if mapper.dispatch.before_update or mapper.dispatch.after_update:
+            return True
+
+        return any(not relationship.passive_updates for relationship in mapper.relationships)
+
+    async def __orm_update_by_pk(self, pk: any, pk_name: str, change: Callable[[Model], None]) -> Model | None:
+        if (obj := await self.find_one(filters={pk_name: pk}, read_only=False)) is None:
+            return None
+
+        change(obj)
+        return await self.update(obj=obj)
+
+    async def update_by_pk(self, pk: any, values: dict[str, any] | SQLModel, pk_field: str = None) -> Model | None:
+        """
+        This method update the row of primary key with UPDATE ... WHERE pk = :pk RETURNING in one round trip,
+        without RETURNING support the row is selected after the UPDATE in the same session
+        The models with ORM events or cascades of update are selected and saved by update
+        The overrides of update in subclasses are not called by the one statement path
+        :param pk: The value of primary key
+        :param values: A dict or BaseModel (only the fields set) with the new values, example {'name': 'bar'}
+        :param pk_field: The unique field used as key, default is the primary key
+        :return: The Model updated or None when the row do not exist
+        """
+        if not isinstance(values, dict):
+            values = values.dict(exclude_unset=True)
+
+        columns = self._metadata.columns
+        pk_name = pk_field or self._get_primary_key_name()
+        pk_column = columns[pk_name]
+        values = {key: value for key, value in values.items() if key in columns and key != pk_name}
+
+        if not values:
+            return await self.find_one(filters={pk_name: pk}, read_only=False)
+
+        if self._needs_orm_update():
+            return await self.__orm_update_by_pk(pk, pk_name, lambda obj: self.__update_obj(obj, values))
+
+        query = update(self.model).where(pk_column == pk).values(**values).execution_options(synchronize_session=False)
+
+        async with self.async_session_manager() as session:
+            if self._supports_returning(session):
+                row = (await session.execute(query.returning(*columns.values()))).first()
+                await self._commit(session)
+                return self._model_from_row(row) if row else None
+
+            result = await session.execute(query)
+            if not result.rowcount:
+                return None
+
+            row = (await session.execute(select_columns(*columns.values()).where(pk_column == pk))).first()
+            await self._commit(session)
+            return self._model_from_row(row)
 
     async def delete(self, obj: SQLModel) -> None:
         """
@@ -272,17 +1443,178 @@ class Repository(RepositoryABC, ABC):
         """
         async with self.async_session_manager() as session:
             await session.delete(obj)
-            await session.commit()
+            await self._commit(session)
 
-    async def bulk_delete(self, objs: list[SQLModel]) -> None:
+    def _needs_orm_delete(self) -> bool:
         """
-        This method delete item in database
+        The set-based DELETE do not run the ORM cascades (cascade="delete" or "delete-orphan" without
+        passive_deletes) and the mapper events of delete, the models with them are deleted by the ORM
+        """
+        mapper = inspect(self.model)
+
+        if mapper.dispatch.before_delete or mapper.dispatch.after_delete:
+            return True
+
+        return any(
+            (relationship.cascade.delete or relationship.cascade.delete_orphan) and not relationship.passive_deletes
+            for relationship in mapper.relationships
+        )
+
+    async def __orm_delete(self, session: AsyncSession, *where_clauses: ColumnElement) -> int:
+        """
+        Select the rows and delete each one in the session, so the cascades and the events of delete are run
+        :return: The number of rows deleted
+        """
+        objs = (await session.execute(select(self.model).where(*where_clauses))).scalars().all()
+
+        for obj in objs:
+            await session.delete(obj)
+
+        return len(objs)
+
+    async def bulk_delete(self, objs: list[SQLModel], chunk_size: int = 1000) -> int:
+        """
+        This method delete items in database with one DELETE ... WHERE pk IN (...) per chunk,
+        the models with ORM cascades or events of delete are selected and deleted by the ORM
+        The session events (example before_flush) do not see the rows of set-based DELETE
         :param objs: The list of models that will be deleted
-        :return: The result of commit
+        :param chunk_size: The max number of primary keys in each DELETE
+        :return: The number of rows deleted
         """
         if not objs:
-            return
+            return 0
+
+        primary_key = self._get_primary_key_column()
+        primary_key_name = self._get_primary_key_name()
+        pks = [getattr(obj, primary_key_name) for obj in objs]
+        orm_delete = self._needs_orm_delete()
+        deleted = 0
 
         async with self.async_session_manager() as session:
-            await asyncio.gather(*[session.delete(obj) for obj in objs])
-            await session.commit()
+            for chunk in self._chunks(pks, chunk_size):
+                if orm_delete:
+                    deleted += await self.__orm_delete(session, primary_key.in_(chunk))
+                    continue
+
+                result = await session.execute(
+                    delete(self.model).where(primary_key.in_(chunk)).execution_options(synchronize_session=False)
+                )
+                deleted += result.rowcount
+
+            await self._commit(session)
+
+        return deleted
+
+    async def delete_by_filters(self, filters: dict) -> int:
+        """
+        This method delete all rows of filters in one DELETE ... WHERE,
+        the models with ORM cascades or events of delete are selected and deleted by the ORM
+        The session events (example before_flush) do not see the rows of set-based DELETE
+        :param filters: A dict with filters, example {'name': 'foo'}, should not be empty
+        :return: The number of rows deleted
+        """
+        filters = self.__filters_for_bulk_write(filters=filters)
+
+        async with self.async_session_manager() as session:
+            if self._needs_orm_delete():
+                deleted = await self.__orm_delete(session, *self._filter_clauses(filters))
+                await self._commit(session)
+                return deleted
+
+            result = await session.execute(
+                delete(self.model).where(*self._filter_clauses(filters)).execution_options(synchronize_session=False)
+            )
+            await self._commit(session)
+            return result.rowcount
+
+    async def delete_by_pk(self, pk: any, pk_field: str = None) -> bool:
+        """
+        This method delete the row of primary key with one DELETE ... WHERE pk = :pk,
+        the models with ORM cascades or events of delete are selected and deleted by the ORM
+        The overrides of delete in subclasses are not called
+        :param pk: The value of primary key
+        :param pk_field: The unique field used as key, default is the primary key
+        :return: False when the row do not exist
+        """
+        pk_column = self._get_pk_column(pk_field=pk_field)
+
+        async with self.async_session_manager() as session:
+            if self._needs_orm_delete():
+                deleted = await self.__orm_delete(session, pk_column == pk)
+                await self._commit(session)
+                return deleted > 0
+
+            result = await session.execute(
+                delete(self.model).where(pk_column == pk).execution_options(synchronize_session=False)
+            )
+            await self._commit(session)
+            return result.rowcount > 0
+
+    async def bulk_soft_delete(self, objs: list[ModelBase], chunk_size: int = 1000) -> int:
+        """
+        This method soft delete (ModelBase.deleted_at) the items not deleted yet with one UPDATE per chunk
+        :param objs: The list of models that will be soft deleted
+        :param chunk_size: The max number of primary keys in each UPDATE
+        :return: The number of rows soft deleted
+        """
+        if not issubclass(self.model, ModelBase):
+            raise ValueError(f"{self.model.__name__} should be a ModelBase to soft delete")
+
+        objs = [obj for obj in objs if obj.deleted_at is None]
+
+        if not objs:
+            return 0
+
+        primary_key = self._get_primary_key_column()
+        deleted_at = datetime.now()
+        deleted = 0
+
+        async with self.async_session_manager() as session:
+            for chunk in self._chunks(objs, chunk_size):
+                result = await session.execute(
+                    update(self.model)
+                    .where(primary_key.in_([getattr(obj, self._get_primary_key_name()) for obj in chunk]))
+                    .where(self.model.deleted_at.is_(None))
+                    .values(deleted_at=deleted_at)
+                    .execution_options(synchronize_session=False)
+                )
+                deleted += result.rowcount
+
+            await self._commit(session)
+
+        for obj in objs:
+            set_committed_value(obj, "deleted_at", deleted_at)
+
+        return deleted
+
+    async def soft_delete_by_pk(self, pk: any, pk_field: str = None) -> Model | None:
+        """
+        This method soft delete (ModelBase.deleted_at) the row of primary key in one UPDATE,
+        the deleted_at of a row already soft deleted is kept
+        :param pk: The value of primary key
+        :param pk_field: The unique field used as key, default is the primary key
+        :return: The Model soft deleted or None when the row do not exist
+        """
+        if not issubclass(self.model, ModelBase):
+            raise ValueError(f"{self.model.__name__} should be a ModelBase to soft delete")
+
+        if self._needs_orm_update():
+            return await self.__orm_update_by_pk(pk, pk_field or self._get_primary_key_name(), ModelBase.soft_delete)
+
+        return await self.update_by_pk(
+            pk=pk,
+            values={"deleted_at": func.coalesce(self.model.deleted_at, datetime.now())},
+            pk_field=pk_field,
+        )
+
+    async def undo_soft_delete_by_pk(self, pk: any, pk_field: str = None) -> Model | None:
+        """
+        This method undo the soft delete of the row of primary key in one UPDATE
+        :param pk: The value of primary key
+        :param pk_field: The unique field used as key, default is the primary key
+        :return: The Model or None when the row do not exist
+        """
+        if not issubclass(self.model, ModelBase):
+            raise ValueError(f"{self.model.__name__} should be a ModelBase to soft delete")
+
+        return await self.update_by_pk(pk=pk, values={"deleted_at": None}, pk_field=pk_field)
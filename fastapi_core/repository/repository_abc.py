@@ -1,23 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
 
-from fastapi_pagination import Page, Params
+from fastapi_pagination import Params
 from sqlmodel import SQLModel
-from sqlmodel.sql.expression import SelectOfScalar
+
+from fastapi_core.repository.aggregation import AggregateFunction
+from fastapi_core.repository.batches import BatchCheckpointABC
+from fastapi_core.repository.cursor_pagination import CursorPage, CursorParams
+from fastapi_core.repository.loading import RelationshipToLoad
+from fastapi_core.repository.offset_pagination import CountMode, OffsetPage
 
 Model = TypeVar("Model", bound=SQLModel)
 
 
 class RepositoryABC(ABC):
 
-    @abstractmethod
-    def _add_subquery_load(self, query: SelectOfScalar, keys_subquery_load: list[str]) -> SelectOfScalar:
-        """Not Implemented"""
-
-    @abstractmethod
-    def _add_joined_load(self, query: SelectOfScalar, keys_joined_load: list[str]) -> SelectOfScalar:
-        """Not Implemented"""
-
     @abstractmethod
     async def _sanitize_filters_from_model(self, filters: dict) -> dict:
         """Not Implemented"""
@@ -28,8 +25,11 @@ class RepositoryABC(ABC):
         filters: dict[str, any] = None,
         order_by: str = None,
         desc: bool = False,
-        relationship_to_load: list[str] = None,
-    ) -> Model | None:
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+        columns: list[str] = None,
+        raw: bool = False,
+    ) -> Model | dict[str, any] | None:
         """Not Implemented"""
 
     @abstractmethod
@@ -39,8 +39,30 @@ class RepositoryABC(ABC):
         filters: dict = None,
         order_by: str = None,
         desc: bool = False,
-        relationship_to_load: list[str] = None,
-    ) -> Page[Model]:
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+        columns: list[str] = None,
+        raw: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> OffsetPage[Model] | OffsetPage[dict]:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def get_many_by_pks(
+        self, pks: list[any], pk_field: str = None, chunk_size: int = 1000, read_only: bool = None
+    ) -> dict[any, Model]:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def find_cursor_paginated(
+        self,
+        params: CursorParams = CursorParams(),
+        filters: dict = None,
+        order_by: str = None,
+        desc: bool = False,
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+    ) -> CursorPage[Model]:
         """Not Implemented"""
 
     @abstractmethod
@@ -49,12 +71,67 @@ class RepositoryABC(ABC):
         filters: dict = None,
         order_by: str = None,
         desc: bool = False,
-        relationship_to_load: list[str] = None,
-    ) -> list[Model]:
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+        columns: list[str] = None,
+        raw: bool = False,
+    ) -> list[Model] | list[dict[str, any]]:
         """Not Implemented"""
 
     @abstractmethod
-    async def count(self, filters: dict = None) -> int:
+    def find_stream(
+        self,
+        filters: dict = None,
+        order_by: str = None,
+        desc: bool = False,
+        relationship_to_load: RelationshipToLoad = None,
+        batch_size: int = 1000,
+        read_only: bool = None,
+    ) -> AsyncIterator[Model]:
+        """Not Implemented"""
+
+    @abstractmethod
+    def find_in_batches(
+        self,
+        batch_size: int = 1000,
+        filters: dict = None,
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+        after_pk: any = None,
+    ) -> AsyncIterator[list[Model]]:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def process_in_batches(
+        self,
+        process: Callable[[list[Model]], Awaitable[None]],
+        batch_size: int = 1000,
+        concurrency: int = 1,
+        filters: dict = None,
+        relationship_to_load: RelationshipToLoad = None,
+        read_only: bool = None,
+        checkpoint: BatchCheckpointABC = None,
+    ) -> int:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def count(self, filters: dict = None, read_only: bool = None) -> int:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def exists(self, filters: dict = None, read_only: bool = None) -> bool:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def aggregate(
+        self,
+        aggregations: dict[str, tuple[AggregateFunction | str, str | None]],
+        group_by: list[str] = None,
+        filters: dict = None,
+        order_by: str = None,
+        desc: bool = False,
+        read_only: bool = None,
+    ) -> list[dict[str, any]]:
         """Not Implemented"""
 
     @abstractmethod
@@ -62,7 +139,18 @@ class RepositoryABC(ABC):
         """Not Implemented"""
 
     @abstractmethod
-    async def bulk_create(self, objs: list[dict[str, any] | SQLModel]) -> list[Model]:
+    async def bulk_create(self, objs: list[dict[str, any] | SQLModel], chunk_size: int = 1000) -> list[Model]:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def bulk_upsert(
+        self,
+        objs: list[dict[str, any] | SQLModel],
+        conflict_target: list[str] = None,
+        update_columns: list[str] = None,
+        chunk_size: int = 1000,
+        returning: bool = False,
+    ) -> list[Model] | int:
         """Not Implemented"""
 
     @abstractmethod
@@ -70,7 +158,15 @@ class RepositoryABC(ABC):
         """Not Implemented"""
 
     @abstractmethod
-    async def bulk_update(self, objs: list[SQLModel]) -> list[Model]:
+    async def bulk_update(self, objs: list[SQLModel], chunk_size: int = 1000) -> list[Model]:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def update_by_filters(self, filters: dict, values: dict[str, any]) -> int:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def update_by_pk(self, pk: any, values: dict[str, any] | SQLModel, pk_field: str = None) -> Model | None:
         """Not Implemented"""
 
     @abstractmethod
@@ -78,5 +174,25 @@ class RepositoryABC(ABC):
         """Not Implemented"""
 
     @abstractmethod
-    async def bulk_delete(self, objs: list[SQLModel]) -> None:
+    async def bulk_delete(self, objs: list[SQLModel], chunk_size: int = 1000) -> int:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def delete_by_filters(self, filters: dict) -> int:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def delete_by_pk(self, pk: any, pk_field: str = None) -> bool:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def bulk_soft_delete(self, objs: list[SQLModel], chunk_size: int = 1000) -> int:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def soft_delete_by_pk(self, pk: any, pk_field: str = None) -> Model | None:
+        """Not Implemented"""
+
+    @abstractmethod
+    async def undo_soft_delete_by_pk(self, pk: any, pk_field: str = None) -> Model | None:
         """Not Implemented"""
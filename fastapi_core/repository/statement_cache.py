@@ -0,0 +1,50 @@
+import dataclasses
+from collections import OrderedDict
+from typing import Callable, Hashable, TypeVar
+
+Statement = TypeVar("Statement")
+
+
+@dataclasses.dataclass
+class StatementCacheStats:
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class StatementCache:
+    def __init__(self, max_size: int = 500):
+        """
+        LRU of statements built with bound parameters, keyed by the shape of query (filter keys, order, loads...),
+        so the repeated shapes do not build the statement again and reuse the compiled cache of sqlalchemy
+        :param max_size: The max number of shapes, the least recently used is removed
+        """
+        self.max_size = max_size
+        self._statements: OrderedDict[Hashable, Statement] = OrderedDict()
+        self._stats = StatementCacheStats()
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Statement]) -> Statement:
+        if (statement := self._statements.get(key)) is not None:
+            self._statements.move_to_end(key)
+            self._stats.hits += 1
+            return statement
+
+        self._stats.misses += 1
+        statement = self._statements[key] = build()
+
+        if len(self._statements) > self.max_size:
+            self._statements.popitem(last=False)
+
+        return statement
+
+    def stats(self) -> StatementCacheStats:
+        return dataclasses.replace(self._stats, size=len(self._statements))
+
+    def clear(self) -> None:
+        self._statements.clear()
+        self._stats = StatementCacheStats()
@@ -0,0 +1,137 @@
+import asyncio
+import contextvars
+
+from starlette_context import context
+
+from fastapi_core.database.routing import writes_in_master, wrote_in_master
+from fastapi_core.database.unit_of_work import in_unit_of_work
+from fastapi_core.repository import RepositoryABC
+from fastapi_core.repository.repository_abc import Model
+from fastapi_core.utils.model_metadata import get_model_metadata
+
+PK_DATA_LOADERS_CONTEXT_KEY = "service_pk_data_loaders"
+
+
+class PkDataLoader:
+    def __init__(self, repository: RepositoryABC, pk_field: str = None):
+        """
+        Coalesce the loads by primary key made in the same event loop tick in one get_many_by_pks
+        and memoize the results, including the not found, until the next write of request
+        :param repository: The repository used to load the items
+        :param pk_field: The unique field used as key, default is the primary key
+        """
+        self.repository = repository
+        self.pk_field = pk_field
+        self._metadata = get_model_metadata(repository.model)
+        self._pk_column_name = pk_field or self._metadata.attribute_name(self._metadata.primary_key)
+        self._results: dict[any, asyncio.Future] = {}
+        self._pending: list[tuple[any, asyncio.Future]] = []
+        self._batches: set[asyncio.Task] = set()
+        self._writes = writes_in_master()
+
+    async def load(self, pk: any) -> Model | None:
+        pk = self.coerce(pk)
+        self.__forget_before_write()
+
+        if pk not in self._results:
+            loop = asyncio.get_running_loop()
+            self._results[pk] = future = loop.create_future()
+            self._pending.append((pk, future))
+
+            if len(self._pending) == 1:
+                # Dispatch after the other tasks ready in this tick add their primary keys
+                loop.call_soon(self.__dispatch)
+
+        # The cancel of a caller do not cancel the load of the others callers of the same primary key
+        return await asyncio.shield(self._results[pk])
+
+    async def load_many(self, pks: list[any]) -> list[Model | None]:
+        return list(await asyncio.gather(*[self.load(pk) for pk in pks]))
+
+    def coerce(self, pk: any) -> any:
+        """
+        Convert the pk to the python type of column (example: '1' to 1), as the keys of the loaded items
+        """
+        try:
+            return self._metadata.coerce(column_name=self._pk_column_name, value=pk)
+        except (TypeError, ValueError):
+            # The pk is kept, the database do not find it as in Repository.find_one
+            return pk
+
+    def clear(self, pk: any = None) -> None:
+        """
+        Forget the memoized result of pk, when None forget all, the loads in progress are kept
+        """
+        pks = [self.coerce(pk)] if pk is not None else list(self._results)
+
+        for key in pks:
+            if key in self._results and self._results[key].done():
+                del self._results[key]
+
+    def __forget_before_write(self) -> None:
+        """
+        The writes in the request made by Repository (directly or by Service) change the items,
+        so the results and the loads in progress before them are forgotten
+        """
+        if (writes := writes_in_master()) != self._writes:
+            self._writes = writes
+            self._results = {}
+
+    def __dispatch(self) -> None:
+        items, self._pending = self._pending, []
+        read_only = False if wrote_in_master() else None
+
+        # The batch has loads of many tasks, it use its own session and not the session of request (UnitOfWork)
+        task = contextvars.Context().run(asyncio.ensure_future, self.__load_batch(items, read_only=read_only))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def __load_batch(self, items: list[tuple[any, asyncio.Future]], read_only: bool | None) -> None:
+        try:
+            found = await self.repository.get_many_by_pks(
+                pks=[pk for pk, _ in items], pk_field=self.pk_field, read_only=read_only
+            )
+
+            for pk, future in items:
+                if not future.done():
+                    future.set_result(found.get(pk))
+        except Exception as exc:
+            self.__fail(items, exc)
+        finally:
+            # The batch cancelled (example: in the shutdown of loop) do not leave the loads waiting forever
+            self.__fail(items, None)
+
+    def __fail(self, items: list[tuple[any, asyncio.Future]], exc: Exception | None) -> None:
+        for pk, future in items:
+            if future.done():
+                continue
+
+            if exc is None:
+                future.cancel()
+            else:
+                future.set_exception(exc)
+
+            # The failed loads are not memoized
+            if self._results.get(pk) is future:
+                del self._results[pk]
+
+
+def get_pk_data_loader(repository: RepositoryABC, pk_field: str = None) -> PkDataLoader | None:
+    """
+    :return: The PkDataLoader of current request for the repository or None outside a request and after a write
+             inside a UnitOfWork, because the writes not committed are only visible in the session of UnitOfWork
+    """
+    if not context.exists() or (in_unit_of_work() and wrote_in_master()):
+        return None
+
+    data_loaders: dict[tuple[int, str], PkDataLoader] = context.get(PK_DATA_LOADERS_CONTEXT_KEY)
+
+    if data_loaders is None:
+        data_loaders = {}
+        context[PK_DATA_LOADERS_CONTEXT_KEY] = data_loaders
+
+    key = (id(repository), pk_field)
+    if key not in data_loaders:
+        data_loaders[key] = PkDataLoader(repository=repository, pk_field=pk_field)
+
+    return data_loaders[key]
@@ -1,49 +1,144 @@
 from typing import TypeVar
 
-from fastapi_pagination import Page, Params
+from fastapi_pagination import Params
 from pydantic import BaseModel
+from sqlalchemy import Column
 from sqlalchemy.orm import InstrumentedAttribute
 from sqlmodel import SQLModel
 
 from fastapi_core.model import ModelMixin
-from fastapi_core.repository import RepositoryABC
+from fastapi_core.repository import CountMode, CreateCoalescer, CursorPage, CursorParams, OffsetPage, RepositoryABC
+from fastapi_core.service.data_loader import get_pk_data_loader
 from fastapi_core.utils.exceptions import EntityNotFoundException
+from fastapi_core.utils.model_metadata import get_model_metadata
 
 T = TypeVar("T")
 
 
 class Service:
-    def __init__(self, repository: RepositoryABC, pk_field: str | InstrumentedAttribute):
+    def __init__(
+        self,
+        repository: RepositoryABC,
+        pk_field: str | InstrumentedAttribute = None,
+        create_coalescer: CreateCoalescer = None,
+        single_statement_writes: bool = False,
+    ):
+        """
+        :param repository: The repository of model
+        :param pk_field: The unique field used by the methods by pk, default is the primary key of repository model
+        :param create_coalescer: When informed the creates of concurrent requests are inserted in batches
+        :param single_statement_writes: When True update, delete, soft_delete and undo_soft_delete write by pk in one
+                                        statement (Repository.update_by_pk and delete_by_pk), without load the model
+                                        and without call the overrides of Repository.update and delete, the models
+                                        with ORM cascades or events are still written by the ORM
+        """
         self.repository = repository
+        self.create_coalescer = create_coalescer
+        self.single_statement_writes = single_statement_writes
+
+        self._metadata = get_model_metadata(repository.model)
+
+        if pk_field is None:
+            pk_field = self._metadata.primary_key
+
+        if isinstance(pk_field, Column):
+            pk_field = self._metadata.attribute_name(pk_field)
+
         self.pk_field = pk_field.key if isinstance(pk_field, InstrumentedAttribute) else pk_field
 
-    async def get_by_pk(self, pk: any, raise_exception_that_not_exist: bool = True) -> ModelMixin | SQLModel | T:
-        if obj := await self.repository.find_one(filters={self.pk_field: pk}):
+    async def get_by_pk(
+        self, pk: any, raise_exception_that_not_exist: bool = True, read_only: bool = None
+    ) -> ModelMixin | SQLModel | T:
+        """
+        Inside a request the gets without read_only made in the same event loop tick are loaded in one SELECT
+        and memoized until the next write of request
+        """
+        if read_only is None and (data_loader := get_pk_data_loader(self.repository, pk_field=self.pk_field)):
+            obj = await data_loader.load(pk)
+        else:
+            obj = await self.repository.find_one(filters={self.pk_field: pk}, read_only=read_only)
+
+        if obj:
             return obj
 
         if raise_exception_that_not_exist:
             raise EntityNotFoundException
 
-    async def get_paginated(self, params: Params, filters: dict = None) -> Page:
-        return await self.repository.find_paginated(params=params, filters=filters)
+    async def get_many_by_pks(self, pks: list[any], read_only: bool = None) -> list[ModelMixin | SQLModel | T]:
+        """
+        :return: The items found in the order of pks, the primary keys that do not exist are ignored
+        """
+        if read_only is None and (data_loader := get_pk_data_loader(self.repository, pk_field=self.pk_field)):
+            return [obj for obj in await data_loader.load_many(pks) if obj]
+
+        pks = [self.__coerce(pk) for pk in pks]
+        items = await self.repository.get_many_by_pks(pks=pks, pk_field=self.pk_field, read_only=read_only)
+        return [items[pk] for pk in dict.fromkeys(pks) if pk in items]
+
+    def __coerce(self, pk: any) -> any:
+        """
+        Convert the pk to the python type of column (example: '1' to 1), as the keys of the items found
+        """
+        try:
+            return self._metadata.coerce(column_name=self.pk_field, value=pk)
+        except (TypeError, ValueError):
+            return pk
+
+    async def get_paginated(
+        self, params: Params, filters: dict = None, count_mode: CountMode = CountMode.EXACT
+    ) -> OffsetPage:
+        return await self.repository.find_paginated(params=params, filters=filters, count_mode=count_mode)
+
+    async def get_cursor_paginated(
+        self, params: CursorParams, filters: dict = None, order_by: str = None, desc: bool = False
+    ) -> CursorPage:
+        return await self.repository.find_cursor_paginated(params=params, filters=filters, order_by=order_by, desc=desc)
 
     async def create(self, obj: SQLModel | BaseModel) -> ModelMixin | SQLModel | T:
+        if self.create_coalescer:
+            return await self.create_coalescer.create(obj=obj)
+
         return await self.repository.create(obj=obj)
 
     async def update(self, pk: any, obj_update: SQLModel | BaseModel | dict) -> ModelMixin | SQLModel | T:
-        db_obj = await self.get_by_pk(pk=pk)
+        if self.single_statement_writes:
+            return self.__raise_if_not_exist(
+                await self.repository.update_by_pk(pk=pk, values=obj_update, pk_field=self.pk_field)
+            )
+
+        db_obj = await self.get_by_pk(pk=pk, read_only=False)
         return await self.repository.update(obj=db_obj, update_values=obj_update)
 
     async def delete(self, pk: any) -> None:
-        db_obj = await self.get_by_pk(pk=pk)
+        if self.single_statement_writes:
+            if not await self.repository.delete_by_pk(pk=pk, pk_field=self.pk_field):
+                raise EntityNotFoundException
+            return
+
+        db_obj = await self.get_by_pk(pk=pk, read_only=False)
         return await self.repository.delete(obj=db_obj)
 
     async def soft_delete(self, pk: any) -> ModelMixin | SQLModel | T:
-        obj = await self.get_by_pk(pk=pk)
+        if self.single_statement_writes:
+            return self.__raise_if_not_exist(await self.repository.soft_delete_by_pk(pk=pk, pk_field=self.pk_field))
+
+        obj = await self.get_by_pk(pk=pk, read_only=False)
         obj.soft_delete()
         return await self.repository.update(obj)
 
     async def undo_soft_delete(self, pk: any) -> ModelMixin | SQLModel | T:
-        obj = await self.get_by_pk(pk=pk)
+        if self.single_statement_writes:
+            return self.__raise_if_not_exist(
+                await self.repository.undo_soft_delete_by_pk(pk=pk, pk_field=self.pk_field)
+            )
+
+        obj = await self.get_by_pk(pk=pk, read_only=False)
         obj.undo_soft_delete()
         return await self.repository.update(obj)
+
+    @classmethod
+    def __raise_if_not_exist(cls, obj: ModelMixin | SQLModel | T | None) -> ModelMixin | SQLModel | T:
+        if obj is None:
+            raise EntityNotFoundException
+
+        return obj
@@ -35,20 +35,78 @@ class DatabaseSettings(Settings):
     DB_NAME: str = Field(..., env="DB_NAME")
     DB_PORT: str = Field(..., env="DB_PORT")
 
+    # Pool of master, DB_USE_NULL_POOL=true open one connection per session (use behind PgBouncer)
+    DB_USE_NULL_POOL: bool = Field(default=False, env="DB_USE_NULL_POOL")
+    DB_POOL_SIZE: int = Field(default=5, env="DB_POOL_SIZE")
+    DB_POOL_MAX_OVERFLOW: int = Field(default=10, env="DB_POOL_MAX_OVERFLOW")
+    DB_POOL_RECYCLE: int = Field(default=1800, env="DB_POOL_RECYCLE")
+    DB_POOL_TIMEOUT: float = Field(default=30.0, env="DB_POOL_TIMEOUT")
+
+    # Pool of read only, when not defined use the values of master
+    DB_READ_ONLY_USE_NULL_POOL: bool = Field(default=None, env="DB_READ_ONLY_USE_NULL_POOL")
+    DB_READ_ONLY_POOL_SIZE: int = Field(default=None, env="DB_READ_ONLY_POOL_SIZE")
+    DB_READ_ONLY_POOL_MAX_OVERFLOW: int = Field(default=None, env="DB_READ_ONLY_POOL_MAX_OVERFLOW")
+    DB_READ_ONLY_POOL_RECYCLE: int = Field(default=None, env="DB_READ_ONLY_POOL_RECYCLE")
+    DB_READ_ONLY_POOL_TIMEOUT: float = Field(default=None, env="DB_READ_ONLY_POOL_TIMEOUT")
+
     __BASE_TEMPLATE: str = "://{0}:{1}@{2}:{3}/{4}"
     __POSTGRES_ASYNC_TEMPLATE: str = "postgresql+asyncpg" + __BASE_TEMPLATE
     __POSTGRES_SYNC_TEMPLATE: str = "postgresql" + __BASE_TEMPLATE
     __MYSQL_SYNC_TEMPLATE: str = "mysql" + __BASE_TEMPLATE
 
-    def __format_connection(self, template: str, read_only: bool) -> str:
+    def get_read_only_hosts(self) -> list[str]:
+        """
+        DB_READ_ONLY_HOST accept many hosts separated by comma, example: "replica-1,replica-2"
+        """
+        if not self.DB_READ_ONLY_HOST:
+            return []
+
+        return [host.strip() for host in self.DB_READ_ONLY_HOST.split(",") if host.strip()]
+
+    def __format_connection(self, template: str, read_only: bool, host: str = None) -> str:
+        if host is None:
+            read_only_hosts = self.get_read_only_hosts()
+            host = read_only_hosts[0] if read_only and read_only_hosts else self.DB_HOST
+
         return template.format(
             self.DB_USER,
             self.DB_PASSWORD,
-            self.DB_READ_ONLY_HOST if read_only else self.DB_HOST,
+            host,
             self.DB_PORT,
             self.DB_NAME,
         )
 
+    def get_pool_options(self, read_only: bool = False) -> dict:
+        """
+        Return the options of pool to use in Database(pool_options=..., read_only_pool_options=...)
+        :param read_only: When True return the options of read only engine
+        :return: dict with the fields of PoolOptions
+        """
+        pool_options = {
+            "use_null_pool": self.DB_USE_NULL_POOL,
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_POOL_MAX_OVERFLOW,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "pool_timeout": self.DB_POOL_TIMEOUT,
+        }
+
+        if not read_only:
+            return pool_options
+
+        read_only_pool_options = {
+            "use_null_pool": self.DB_READ_ONLY_USE_NULL_POOL,
+            "pool_size": self.DB_READ_ONLY_POOL_SIZE,
+            "max_overflow": self.DB_READ_ONLY_POOL_MAX_OVERFLOW,
+            "pool_recycle": self.DB_READ_ONLY_POOL_RECYCLE,
+            "pool_timeout": self.DB_READ_ONLY_POOL_TIMEOUT,
+        }
+
+        for key, value in read_only_pool_options.items():
+            if value is not None:
+                pool_options[key] = value
+
+        return pool_options
+
     def get_mysql_db_url(self, read_only: bool = False) -> str:
         return self.__format_connection(self.__MYSQL_SYNC_TEMPLATE, read_only=read_only)
 
@@ -57,3 +115,9 @@ class DatabaseSettings(Settings):
 
     def get_postgres_sync_db_url(self, read_only: bool = False) -> str:
         return self.__format_connection(self.__POSTGRES_SYNC_TEMPLATE, read_only=read_only)
+
+    def get_postgres_async_db_read_only_urls(self) -> list[str]:
+        return [
+            self.__format_connection(self.__POSTGRES_ASYNC_TEMPLATE, read_only=True, host=host)
+            for host in self.get_read_only_hosts()
+        ]
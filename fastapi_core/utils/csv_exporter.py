@@ -1,8 +1,11 @@
 from io import StringIO
+from typing import AsyncIterable, AsyncIterator
 
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from fastapi_core.utils.model_metadata import get_model_metadata
+
 
 class ModelExportValidationError(Exception):
     def __init__(self, model):
@@ -17,41 +20,53 @@ class CSVExporter:
         self._sep = separator
 
     def __generate_headers(self) -> str:
-        headers = []
+        return self._sep.join(get_model_metadata(self._MODEL).csv_headers)
+
+    def __generate_line(self, item: BaseModel) -> str:
+        if not isinstance(item, self._MODEL):
+            raise ModelExportValidationError(self._MODEL)
+
+        item_data = []
 
-        for filed_name, field_model in self._MODEL.__fields__.items():
-            if field_model.field_info.title:
-                headers.append(field_model.field_info.title)
-            else:
-                headers.append(filed_name)
+        for value in item.dict().values():
+            if not isinstance(value, str) and value is not None:
+                value = str(value)
 
-        return self._sep.join(headers)
+            item_data.append(value if value else "")
+
+        return self._sep.join(item_data)
 
     def to_csv(self, data: list[type[BaseModel]]) -> StringIO:
         csv = StringIO()
         csv.write(self.__generate_headers())
 
         for item in data:
-            if not isinstance(item, self._MODEL):
-                raise ModelExportValidationError(self._MODEL)
-
-            item_data = []
             csv.write(self.__NEW_LINE)
-
-            for value in item.dict().values():
-                if not isinstance(value, str) and value is not None:
-                    value = str(value)
-
-                item_data.append(value if value else "")
-
-            csv.write(self._sep.join(item_data))
+            csv.write(self.__generate_line(item))
 
         return csv
 
-    def to_csv_streaming_response(self, data: list[type[BaseModel]], filename: str = "export.csv") -> StreamingResponse:
-        stream = self.to_csv(data=data)
-
-        response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
+    async def to_csv_async_iterator(self, data: AsyncIterable[type[BaseModel]]) -> AsyncIterator[str]:
+        """
+        Generate the csv line by line from an async iterable, example: Repository.find_stream()
+        """
+        yield self.__generate_headers()
+
+        async for item in data:
+            yield self.__NEW_LINE + self.__generate_line(item)
+
+    def to_csv_streaming_response(
+        self, data: list[type[BaseModel]] | AsyncIterable[type[BaseModel]], filename: str = "export.csv"
+    ) -> StreamingResponse:
+        """
+        When data is an async iterable the csv is streamed while it is read, keeping constant memory
+        """
+        if isinstance(data, AsyncIterable):
+            content = self.to_csv_async_iterator(data=data)
+        else:
+            content = iter([self.to_csv(data=data).getvalue()])
+
+        response = StreamingResponse(content, media_type="text/csv")
 
         if not filename.__contains__(".csv"):
             filename += ".csv"
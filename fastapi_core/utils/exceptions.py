@@ -4,6 +4,7 @@ from fastapi import HTTPException
 from pydantic import BaseModel
 
 REGISTER_NOT_FOUND_MESSAGE = "Item do not exist!"
+INVALID_CURSOR_MESSAGE = "Cursor is invalid!"
 
 
 class EntityNotFoundException(HTTPException):
@@ -11,6 +12,11 @@ class EntityNotFoundException(HTTPException):
         super().__init__(status_code=HTTPStatus.NOT_FOUND, detail=message)
 
 
+class InvalidCursorException(HTTPException):
+    def __init__(self, message=INVALID_CURSOR_MESSAGE):
+        super().__init__(status_code=HTTPStatus.BAD_REQUEST, detail=message)
+
+
 class InternalErrorSchema(BaseModel):
     detail: str = "Internal error."
 
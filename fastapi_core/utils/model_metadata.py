@@ -0,0 +1,126 @@
+import dataclasses
+import datetime
+from typing import TYPE_CHECKING, Callable
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from sqlalchemy import Column
+
+_REGISTRY: dict[type[BaseModel], "ModelMetadata"] = {}
+
+
+@dataclasses.dataclass(frozen=True)
+class ModelMetadata:
+    """
+    The reflection of a model computed once, the table attributes are empty when the model is not a table
+    The columns, indexed_columns and coercers are keyed by the name of mapped attribute, that can be other than the
+    name of column, example: name: str = Field(sa_column=Column("hero_name", String))
+    """
+
+    model: type[BaseModel]
+    field_names: tuple[str, ...]
+    csv_headers: tuple[str, ...]
+    columns: dict[str, "Column"]
+    attribute_names: dict[str, str]
+    primary_keys: tuple["Column", ...]
+    indexed_columns: frozenset[str]
+    relationships: frozenset[str]
+    coercers: dict[str, Callable[[any], any]]
+    load_strategies: dict[str, str]
+
+    @property
+    def column_names(self) -> frozenset[str]:
+        return frozenset(self.columns)
+
+    @property
+    def primary_key(self) -> "Column":
+        """
+        :raise: ValueError when the model do not have only one primary key
+        """
+        if len(self.primary_keys) != 1:
+            raise ValueError(f"{self.model.__name__} should have only one primary key, has {len(self.primary_keys)}")
+
+        return self.primary_keys[0]
+
+    def attribute_name(self, column: "Column") -> str:
+        """
+        :return: The name of mapped attribute of the column of table
+        """
+        return self.attribute_names[column.key]
+
+    def is_filterable(self, key: str) -> bool:
+        return key in self.columns or key in self.relationships
+
+    def coerce(self, column_name: str, value: any) -> any:
+        """
+        Convert the value (example from a cursor or cache) to the python type of column
+        :raise: TypeError | ValueError when the value can not be converted
+        """
+        if value is None:
+            return value
+
+        return self.coercers[column_name](value)
+
+
+def get_model_metadata(model: type[BaseModel]) -> ModelMetadata:
+    """
+    :return: The ModelMetadata of model, built in the first call
+    """
+    if (metadata := _REGISTRY.get(model)) is None:
+        metadata = _REGISTRY[model] = _build_model_metadata(model)
+
+    return metadata
+
+
+def _build_model_metadata(model: type[BaseModel]) -> ModelMetadata:
+    columns, attribute_names, primary_keys, indexed_columns, relationships = {}, {}, (), set(), set()
+
+    if hasattr(model, "__table__"):
+        # Only the table models need sqlalchemy
+        from sqlalchemy import inspect
+
+        table = model.__table__
+        mapper = inspect(model)
+        attribute_names = {attribute.columns[0].key: attribute.key for attribute in mapper.column_attrs}
+        # In the order of table, only the columns mapped in the model
+        columns = {attribute_names[column.key]: column for column in table.columns if column.key in attribute_names}
+        primary_keys = tuple(mapper.primary_key)
+        indexed_columns = {
+            name for name, column in columns.items() if column.primary_key or column.index or column.unique
+        }
+        # The leading column of each index can be used alone by the queries
+        indexed_columns.update(
+            attribute_names[leading_column.key]
+            for index in table.indexes
+            if (leading_column := next(iter(index.columns))).key in attribute_names
+        )
+        relationships = set(mapper.relationships.keys())
+
+    return ModelMetadata(
+        model=model,
+        field_names=tuple(model.__fields__),
+        csv_headers=tuple(field.field_info.title or name for name, field in model.__fields__.items()),
+        columns=columns,
+        attribute_names=attribute_names,
+        primary_keys=primary_keys,
+        indexed_columns=frozenset(indexed_columns),
+        relationships=frozenset(relationships),
+        coercers={key: _build_coercer(column) for key, column in columns.items()},
+        # The loading strategy of relationships declared in model, example: __load_strategies__ = {'items': 'joined'}
+        load_strategies=dict(getattr(model, "__load_strategies__", {})),
+    )
+
+
+def _build_coercer(column: "Column") -> Callable[[any], any]:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return lambda value: value
+
+    if python_type in (datetime.datetime, datetime.date, datetime.time):
+        convert = python_type.fromisoformat
+    else:
+        convert = python_type
+
+    return lambda value: value if isinstance(value, python_type) else convert(value)
@@ -0,0 +1,120 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import redis.asyncio as redis
+
+from fastapi_core.cache_driver.cache_driver_abc import NO_TIME_BUDGET
+from fastapi_core.cache_driver.redis_cache_driver import RedisCacheDriver
+
+
+class TestRedisCacheDriver(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.redis = AsyncMock()
+        self.pipeline = MagicMock()
+        self.pipeline.__aenter__.return_value = self.pipeline
+        self.pipeline.execute = AsyncMock(return_value=[])
+        self.redis.pipeline = MagicMock(return_value=self.pipeline)
+
+        with patch.object(redis, "Redis", return_value=self.redis):
+            self.driver = RedisCacheDriver(namespace_prefix="test")
+
+    async def test_get(self):
+        # Arrange
+        self.redis.get.return_value = b"foo"
+
+        # Act
+        value = await self.driver.get("key")
+
+        # Assert
+        self.assertEqual(b"foo", value)
+        self.redis.get.assert_awaited_once_with(name="test:key")
+
+    async def test_get_return_none_when_redis_fail(self):
+        # Arrange
+        self.redis.get.side_effect = redis.ConnectionError()
+
+        # Act
+        value = await self.driver.get("key")
+
+        # Assert
+        self.assertIsNone(value)
+
+    async def test_set(self):
+        # Act
+        await self.driver.set("key", "foo", seconds_for_expire=10)
+
+        # Assert
+        self.redis.set.assert_awaited_once_with(name="test:key", value="foo", ex=10)
+
+    async def test_set_many_in_one_pipeline(self):
+        # Act
+        await self.driver.set_many({"a": "1", "b": "2"}, seconds_for_expire=10)
+
+        # Assert
+        self.redis.pipeline.assert_called_once_with(transaction=False)
+        self.assertEqual(2, self.pipeline.set.call_count)
+        self.pipeline.set.assert_any_call(name="test:a", value="1", ex=10)
+        self.pipeline.execute.assert_awaited_once()
+
+    async def test_close(self):
+        # Arrange
+        self.driver.connection_pool = AsyncMock()
+
+        # Act
+        await self.driver.close()
+
+        # Assert
+        self.redis.aclose.assert_awaited_once()
+        self.driver.connection_pool.disconnect.assert_awaited_once()
+
+    def test_key_pattern_escape_glob_characters(self):
+        # Act
+        pattern = self.driver._key_pattern("heroes:[1]*?\\")
+
+        # Assert
+        self.assertEqual("test:heroes:\\[1\\]\\*\\?\\\\*", pattern)
+
+    async def test_dump_prefix_scan_and_unlink_in_batches(self):
+        # Arrange
+        self.driver.unlink_batch_size = 2
+        self.redis.scan.side_effect = [(5, [b"test:a", b"test:b", b"test:c"]), (0, [b"test:d"])]
+        self.pipeline.execute.side_effect = [[2, 1], [1]]
+
+        with patch("fastapi_core.cache_driver.redis_cache_driver.UNLINK_KEYS_PER_COMMAND", 2):
+            # Act
+            await self.driver.dump_prefix("")
+
+        # Assert
+        self.assertEqual(2, self.redis.scan.await_count)
+        self.redis.scan.assert_any_await(cursor=5, match="test:*", count=self.driver.scan_count)
+        self.assertEqual(
+            [(b"test:a", b"test:b"), (b"test:c",), (b"test:d",)],
+            [call.args for call in self.pipeline.unlink.call_args_list],
+        )
+        self.assertEqual(2, self.pipeline.execute.await_count)
+
+    async def test_dump_prefix_stop_when_time_budget_finish(self):
+        # Arrange
+        self.redis.scan.side_effect = [(5, [b"test:a"]), (6, [b"test:b"]), (7, [b"test:c"])]
+        self.pipeline.execute.return_value = [2]
+
+        with patch("fastapi_core.cache_driver.redis_cache_driver.time.monotonic", side_effect=[0, 0.5, 2]):
+            # Act
+            await self.driver.dump_prefix("", time_budget_seconds=1)
+
+        # Assert
+        self.assertEqual(2, self.redis.scan.await_count)
+        self.pipeline.unlink.assert_called_once_with(b"test:a", b"test:b")
+
+    async def test_dump_prefix_without_time_budget_remove_all_keys(self):
+        # Arrange
+        self.driver.invalidation_time_budget_seconds = 0
+        self.redis.scan.side_effect = [(5, [b"test:a"]), (6, [b"test:b"]), (0, [b"test:c"])]
+        self.pipeline.execute.return_value = [3]
+
+        # Act
+        await self.driver.dump_prefix("", time_budget_seconds=NO_TIME_BUDGET)
+
+        # Assert
+        self.assertEqual(3, self.redis.scan.await_count)
+        self.pipeline.unlink.assert_called_once_with(b"test:a", b"test:b", b"test:c")
@@ -3,7 +3,7 @@ from unittest.mock import patch, Mock
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from fastapi_core.database import Database
+from fastapi_core.database import BalanceStrategy, Database, PoolOptions, PoolStatus
 
 
 class TestDatabase(unittest.IsolatedAsyncioTestCase):
@@ -54,3 +54,151 @@ class TestDatabase(unittest.IsolatedAsyncioTestCase):
                 raise Exception
 
         async_session.rollback.assert_called_once_with()
+
+    async def test_get_pool_status_with_pooled_engine(self):
+        # Arrange
+        db = Database(db_url="sqlite+aiosqlite://", pool_options=PoolOptions(pool_size=2, max_overflow=1))
+
+        # Act
+        async with db.factory_async_session_manager() as session:
+            await session.scalar(Database.IS_READY_STATEMENT)
+            pool_status = db.get_pool_status()
+
+        # Assert
+        self.assertIsInstance(pool_status, PoolStatus)
+        self.assertTrue(pool_status.pooled)
+        self.assertEqual(2, pool_status.size)
+        self.assertEqual(1, pool_status.checked_out)
+        self.assertEqual(1 / 3, pool_status.utilization)
+        self.assertEqual(1, pool_status.checkouts)
+        self.assertIsNone(db.get_pool_status(read_only=True))
+        await db.dispose()
+
+    async def test_get_pool_status_with_null_pool(self):
+        # Arrange
+        db = Database(db_url="sqlite+aiosqlite://", pool_options={"use_null_pool": True})
+
+        # Act
+        pool_status = db.get_pool_status()
+
+        # Assert
+        self.assertFalse(pool_status.pooled)
+        self.assertEqual(0, pool_status.checked_out)
+
+    async def test_balance_read_only_sessions_with_round_robin(self):
+        # Arrange
+        db = Database(db_url="sqlite+aiosqlite://", db_url_read_only=["sqlite+aiosqlite://", "sqlite+aiosqlite://"])
+
+        # Act
+        for _ in range(4):
+            async with db.factory_async_session_manager(read_only=True) as session:
+                await session.scalar(Database.IS_READY_STATEMENT)
+
+        # Assert
+        replicas_status = db.get_replicas_status()
+        self.assertEqual(2, len(replicas_status))
+        self.assertEqual([2, 2], [replica.sessions for replica in replicas_status])
+        self.assertEqual([0, 0], [replica.outstanding for replica in replicas_status])
+
+    async def test_balance_read_only_sessions_with_least_outstanding(self):
+        # Arrange
+        db = Database(
+            db_url="sqlite+aiosqlite://",
+            db_url_read_only=["sqlite+aiosqlite://", "sqlite+aiosqlite://"],
+            replica_strategy=BalanceStrategy.LEAST_OUTSTANDING,
+        )
+
+        # Act
+        async with db.factory_async_session_manager(read_only=True):
+            async with db.factory_async_session_manager(read_only=True):
+                replicas_status = db.get_replicas_status()
+
+        # Assert
+        self.assertEqual([1, 1], [replica.outstanding for replica in replicas_status])
+
+    async def test_read_only_session_is_outstanding_until_closed(self):
+        # Arrange
+        db = Database(db_url="sqlite+aiosqlite://", db_url_read_only="sqlite+aiosqlite://")
+
+        # Act
+        async with db.get_read_only_session() as session:
+            outstanding = db.get_replicas_status()[0].outstanding
+            await session.scalar(Database.IS_READY_STATEMENT)
+        await session.close()
+
+        # Assert
+        self.assertEqual(1, outstanding)
+        self.assertEqual(0, db.get_replicas_status()[0].outstanding)
+        self.assertEqual(1, db.get_replicas_status()[0].sessions)
+
+    async def test_read_only_session_check_in_when_error(self):
+        # Arrange
+        db = Database(db_url="sqlite+aiosqlite://", db_url_read_only="sqlite+aiosqlite://")
+
+        # Act
+        with self.assertRaises(ValueError):
+            async with db.get_read_only_session():
+                raise ValueError
+
+        with self.assertRaises(ValueError):
+            async with db.factory_async_session_manager(read_only=True):
+                raise ValueError
+
+        # Assert
+        self.assertEqual(0, db.get_replicas_status()[0].outstanding)
+
+    async def test_eject_read_only_with_replication_lag_and_fall_back_to_master(self):
+        # Arrange
+        db = Database(
+            db_url="sqlite+aiosqlite://",
+            db_url_read_only="sqlite+aiosqlite://",
+            max_replication_lag_seconds=5,
+            replication_lag_statement="SELECT 10",
+        )
+
+        # Act
+        is_ready = await db.is_ready()
+        async with db.factory_async_session_manager(read_only=True) as session:
+            await session.scalar(Database.IS_READY_STATEMENT)
+
+        # Assert
+        replica_status = db.get_replicas_status()[0]
+        self.assertTrue(is_ready)
+        self.assertFalse(replica_status.healthy)
+        self.assertEqual(10, replica_status.replication_lag_seconds)
+        self.assertEqual(1, replica_status.failed_health_checks)
+        self.assertEqual(0, replica_status.sessions)
+
+    async def test_eject_read_only_that_is_not_ready(self):
+        # Arrange
+        db = Database(db_url="sqlite+aiosqlite://", db_url_read_only="sqlite+aiosqlite:////not/exist/test.db")
+
+        # Act
+        await db.is_ready()
+
+        # Assert
+        self.assertFalse(db.get_replicas_status()[0].healthy)
+
+    async def test_fall_back_to_master_is_logged_only_when_it_change(self):
+        # Arrange
+        db = Database(
+            db_url="sqlite+aiosqlite://",
+            db_url_read_only="sqlite+aiosqlite://",
+            max_replication_lag_seconds=5,
+            replication_lag_statement="SELECT 10",
+        )
+        await db.is_ready()
+
+        with patch("fastapi_core.database.replicas.logger") as logger:
+            # Act
+            for _ in range(3):
+                async with db.factory_async_session_manager(read_only=True) as session:
+                    await session.scalar(Database.IS_READY_STATEMENT)
+
+            db._replicas.replicas[0].healthy = True
+            async with db.factory_async_session_manager(read_only=True) as session:
+                await session.scalar(Database.IS_READY_STATEMENT)
+
+        # Assert
+        self.assertEqual(1, logger.warning.call_count)
+        self.assertEqual(1, logger.info.call_count)
@@ -0,0 +1,165 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from fastapi import APIRouter, BackgroundTasks, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel
+from starlette_context import request_cycle_context
+from starlette_context.middleware import RawContextMiddleware
+
+from fastapi_core.database import Database
+from fastapi_core.database.database import DatabaseRole
+from fastapi_core.database.unit_of_work import UnitOfWork
+from fastapi_core.middleware.unit_of_work_middleware import UnitOfWorkMiddleware
+from fastapi_core.repository import Repository
+from fastapi_core.service import Service
+from tests.unit.repository.hero_model import Hero
+
+
+class TestUnitOfWork(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.database = Database(db_url="sqlite+aiosqlite:///./test.db")
+
+        async with self.database._connections[DatabaseRole.MASTER].begin() as conn:
+            await conn.run_sync(SQLModel.metadata.drop_all)
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+        self.repo = Repository(async_session_manager=self.database.factory_async_session_manager, model=Hero)
+        self.service = Service(repository=self.repo, pk_field="id")
+
+        router = APIRouter()
+
+        @router.post("/heroes")
+        async def create_and_update():
+            hero = await self.service.create(Hero(name="foo"))
+            hero = await self.service.update(pk=hero.id, obj_update={"name": "bar"})
+            return {"id": hero.id, "name": hero.name}
+
+        @router.post("/heroes/background")
+        async def create_in_background(background_tasks: BackgroundTasks):
+            hero = await self.service.create(Hero(name="foo"))
+            background_tasks.add_task(self.service.create, Hero(name="background"))
+            return {"id": hero.id}
+
+        @router.post("/heroes/error")
+        async def create_with_error():
+            await self.service.create(Hero(name="foo"))
+            raise HTTPException(status_code=400)
+
+        self.app = FastAPI()
+        self.app.include_router(router)
+        self.app.add_middleware(UnitOfWorkMiddleware, database=self.database)
+        self.app.add_middleware(RawContextMiddleware)
+
+    async def test_share_one_session_and_commit_in_the_end(self):
+        # Arrange
+        client = TestClient(self.app)
+
+        with patch.object(self.database, "get_master_session", wraps=self.database.get_master_session) as sessions:
+            # Act
+            response = client.post("/heroes")
+
+        # Assert
+        self.assertEqual({"id": 1, "name": "bar"}, response.json())
+        self.assertEqual(1, sessions.call_count)
+        self.assertEqual("bar", (await self.repo.find_one(filters={"id": 1})).name)
+
+    async def test_background_task_commit_its_writes(self):
+        # Arrange
+        client = TestClient(self.app)
+
+        # Act
+        response = client.post("/heroes/background")
+
+        # Assert
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(["foo", "background"], [hero.name for hero in await self.repo.find_all(order_by="id")])
+
+    async def test_finished_unit_of_work_is_not_used(self):
+        with request_cycle_context({}):
+            # Arrange
+            unit_of_work = UnitOfWork(database=self.database)
+            unit_of_work.begin_in_request()
+            await unit_of_work.commit()
+
+            # Act
+            await self.repo.create(Hero(name="foo"))
+            await unit_of_work.close()
+
+        # Assert
+        self.assertEqual(1, await self.repo.count())
+
+    async def test_rollback_when_response_is_error(self):
+        # Arrange
+        client = TestClient(self.app)
+
+        # Act
+        response = client.post("/heroes/error")
+
+        # Assert
+        self.assertEqual(400, response.status_code)
+        self.assertEqual(0, await self.repo.count())
+
+    async def test_concurrent_uses_of_session_wait_their_turn(self):
+        # Arrange
+        events = []
+
+        async def use_session(name: str):
+            async with self.database.factory_async_session_manager() as session:
+                events.append(f"enter {name}")
+                await session.scalar(Database.IS_READY_STATEMENT)
+                await asyncio.sleep(0.01)
+                events.append(f"exit {name}")
+
+        with request_cycle_context({}):
+            unit_of_work = UnitOfWork(database=self.database)
+            unit_of_work.begin_in_request()
+
+            # Act
+            await asyncio.gather(use_session("a"), use_session("b"))
+            await unit_of_work.close()
+
+        # Assert
+        self.assertEqual(["enter a", "exit a", "enter b", "exit b"], events)
+
+    async def test_nested_use_of_session_in_same_task(self):
+        with request_cycle_context({}):
+            # Arrange
+            unit_of_work = UnitOfWork(database=self.database)
+            unit_of_work.begin_in_request()
+
+            # Act
+            async with self.database.factory_async_session_manager() as session:
+                async with self.database.factory_async_session_manager() as nested_session:
+                    await nested_session.scalar(Database.IS_READY_STATEMENT)
+
+            await unit_of_work.close()
+
+        # Assert
+        self.assertIs(session, nested_session)
+
+    async def test_callbacks_run_after_commit_and_discarded_by_rollback(self):
+        # Arrange
+        calls = []
+
+        async def callback():
+            calls.append("called")
+
+        async def failing_callback():
+            raise RuntimeError("cache unavailable")
+
+        unit_of_work = UnitOfWork(database=self.database)
+        unit_of_work.add_after_commit(callback)
+        unit_of_work.add_after_commit(failing_callback)
+        unit_of_work.add_after_commit(callback)
+
+        # Act
+        await unit_of_work.commit()
+        await unit_of_work.commit()
+        unit_of_work.add_after_commit(callback)
+        await unit_of_work.rollback()
+        await unit_of_work.commit()
+
+        # Assert
+        self.assertEqual(["called", "called"], calls)
@@ -2,6 +2,7 @@ import unittest
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import event
 from sqlmodel import Field, SQLModel
 
 from fastapi_core.database import Database
@@ -152,3 +153,41 @@ class TestModelBase(unittest.IsolatedAsyncioTestCase):
         # Act
         with self.assertRaises(ValueError) as _:
             obj.update_values_from_dict({"name": "test2", "test": 1})
+
+    async def test_model_changed_fields(self):
+        # Arrange
+        obj: MyModel = await self.repo.create(MyModel(name="test"))
+
+        # Act
+        obj.update_values(name="test")
+        unchanged_fields = obj.get_changed_fields()
+        obj.update_values(name="test2")
+
+        # Assert
+        self.assertEqual(set(), unchanged_fields)
+        self.assertEqual({"name"}, obj.get_changed_fields())
+        self.assertTrue(obj.has_changes())
+
+        # Act
+        obj: MyModel = await self.repo.update(obj)
+
+        # Assert
+        self.assertFalse(obj.has_changes())
+
+    async def test_model_update_only_changed_columns(self):
+        # Arrange
+        obj: MyModel = await self.repo.create(MyModel(name="test"))
+        statements = []
+        engine = self.database._connections[DatabaseRole.MASTER].sync_engine
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        # Act
+        await self.repo.update(obj, {"name": "test"})
+        no_change_statements = list(statements)
+        await self.repo.update(obj, {"name": "test2"})
+
+        # Assert
+        self.assertEqual([], no_change_statements)
+        self.assertEqual(1, len(statements))
+        self.assertIn("name=", statements[0])
+        self.assertNotIn("created_at", statements[0])
@@ -2,6 +2,7 @@ from typing import List, Optional
 
 from fastapi_core.model import ModelMixin
 from pydantic import BaseModel
+from sqlalchemy import Column, Integer, String
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -20,6 +21,12 @@ class Hero(ModelMixin, table=True):
     powers: List[Power] = Relationship(back_populates="hero", sa_relationship_kwargs={"lazy": "select"})
 
 
+class Villain(SQLModel, table=True):
+    # The attributes are mapped to columns with other names
+    id: Optional[int] = Field(default=None, sa_column=Column("villain_id", Integer, primary_key=True))
+    name: str = Field(sa_column=Column("villain_name", String, index=True))
+
+
 class CreateHero(BaseModel):
     name: str
 
@@ -0,0 +1,83 @@
+from fastapi_core.repository import AggregateFunction
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestAggregate(TestRepository):
+    async def test_aggregate_all_items(self):
+        # Arrange
+        await self.create_heroes(4)
+
+        # Act
+        result = await self.repo.aggregate(
+            aggregations={
+                "total": ("count", None),
+                "sum_id": ("sum", "id"),
+                "avg_id": (AggregateFunction.AVG, "id"),
+                "min_id": ("min", "id"),
+                "max_id": ("max", "id"),
+            }
+        )
+
+        # Assert
+        self.assertEqual([{"total": 4, "sum_id": 10, "avg_id": 2.5, "min_id": 1, "max_id": 4}], result)
+
+    async def test_aggregate_group_by_with_filters_and_order(self):
+        # Arrange
+        await self.repo.bulk_create(objs=[{"name": name} for name in ["foo", "bar", "foo", "foo", "bar", "baz"]])
+
+        # Act
+        result = await self.repo.aggregate(
+            aggregations={"total": ("count", None), "max_id": ("max", "id")},
+            group_by=["name"],
+            filters={"name__ne": "baz"},
+            order_by="total",
+            desc=True,
+        )
+
+        # Assert
+        self.assertEqual([{"name": "foo", "total": 3, "max_id": 4}, {"name": "bar", "total": 2, "max_id": 5}], result)
+
+    async def test_count_column_ignore_nulls(self):
+        # Arrange
+        heroes = await self.create_heroes(3)
+        await self.repo.soft_delete_by_pk(pk=heroes[0].id)
+
+        # Act
+        result = await self.repo.aggregate(aggregations={"rows": ("count", None), "deleted": ("count", "deleted_at")})
+
+        # Assert
+        self.assertEqual([{"rows": 3, "deleted": 1}], result)
+
+    async def test_aggregate_invalid_arguments(self):
+        # Assert
+        with self.assertRaises(ValueError):
+            await self.repo.aggregate(aggregations={})
+        with self.assertRaises(ValueError):
+            await self.repo.aggregate(aggregations={"total": ("median", "id")})
+        with self.assertRaises(ValueError):
+            await self.repo.aggregate(aggregations={"total": ("sum", "foo")})
+        with self.assertRaises(ValueError):
+            await self.repo.aggregate(aggregations={"total": ("sum", None)})
+        with self.assertRaises(ValueError):
+            await self.repo.aggregate(aggregations={"name": ("count", None)}, group_by=["name"])
+
+    async def test_exists(self):
+        # Arrange
+        heroes = await self.create_heroes(2)
+
+        # Act
+        exists = await self.repo.exists(filters={"id": heroes[1].id})
+        not_exists = await self.repo.exists(filters={"id__gt": heroes[1].id})
+        any_exists = await self.repo.exists()
+
+        # Assert
+        self.assertTrue(exists)
+        self.assertFalse(not_exists)
+        self.assertTrue(any_exists)
+
+    async def test_exists_in_empty_table(self):
+        # Act
+        exists = await self.repo.exists()
+
+        # Assert
+        self.assertFalse(exists)
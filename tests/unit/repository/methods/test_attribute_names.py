@@ -0,0 +1,57 @@
+from fastapi_core.cache_driver.in_memory_driver import InMemoryCacheDriver
+from fastapi_core.repository import CachedRepository, Repository
+from fastapi_core.service import Service
+from tests.unit.repository.hero_model import Villain
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestAttributeNames(TestRepository):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.villain_repo = Repository(async_session_manager=self.database.factory_async_session_manager, model=Villain)
+
+    async def test_filters_and_order_by_attribute_with_other_column_name(self):
+        # Arrange
+        await self.villain_repo.bulk_create([Villain(name=name) for name in ("b", "a", "c")])
+
+        # Act
+        villains = await self.villain_repo.find_all(filters={"name__in": ["a", "b"]}, order_by="name", desc=True)
+        rows = await self.villain_repo.find_all(raw=True, order_by="name")
+
+        # Assert
+        self.assertEqual(["b", "a"], [villain.name for villain in villains])
+        self.assertEqual(["a", "b", "c"], [row["name"] for row in rows])
+        self.assertEqual({"id", "name"}, set(rows[0]))
+
+    async def test_writes_attribute_with_other_column_name(self):
+        # Arrange
+        villain = await self.villain_repo.create({"name": "foo"})
+
+        # Act
+        updated = await self.villain_repo.update_by_pk(villain.id, {"name": "bar"})
+        upserted = await self.villain_repo.bulk_upsert([Villain(id=villain.id, name="baz"), Villain(name="new")])
+        deleted = await self.villain_repo.bulk_delete([await self.villain_repo.find_one(filters={"name": "new"})])
+
+        # Assert
+        self.assertEqual("bar", updated.name)
+        self.assertEqual("baz", (await Service(repository=self.villain_repo).get_by_pk(villain.id)).name)
+        self.assertEqual(2, upserted)
+        self.assertEqual(1, deleted)
+        self.assertEqual({villain.id: "baz"}, {obj.id: obj.name for obj in await self.villain_repo.find_all()})
+
+    async def test_cached_repository_by_pk_with_other_column_name(self):
+        # Arrange
+        cache_driver = InMemoryCacheDriver(namespace_prefix="test")
+        await cache_driver.flush_for_namespace()
+        repo = CachedRepository(
+            async_session_manager=self.database.factory_async_session_manager, model=Villain, cache_driver=cache_driver
+        )
+        villain = await repo.create({"name": "foo"})
+
+        # Act
+        found = await repo.find_one(filters={"id": villain.id})
+        many = await repo.get_many_by_pks([villain.id])
+
+        # Assert
+        self.assertEqual("foo", found.name)
+        self.assertEqual({villain.id: "foo"}, {pk: obj.name for pk, obj in many.items()})
@@ -0,0 +1,73 @@
+from sqlalchemy import event
+
+from fastapi_core.database.database import DatabaseRole
+from fastapi_core.repository import Repository
+from tests.unit.repository.hero_model import Hero, Power, Villain
+from tests.unit.repository.test_repository import PostgresSessionMock, TestRepository
+
+
+class TestBulkCreate(TestRepository):
+    async def test_bulk_create_without_select_per_row(self):
+        # Arrange
+        statements = []
+        engine = self.database._connections[DatabaseRole.MASTER].sync_engine
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        # Act
+        heroes = await self.repo.bulk_create([Hero(name="foo"), {"name": "bar"}], chunk_size=1)
+
+        # Assert
+        self.assertEqual([1, 2], [hero.id for hero in heroes])
+        self.assertEqual(["foo", "bar"], [hero.name for hero in heroes])
+        self.assertFalse(any(statement.startswith("SELECT") for statement in statements))
+        self.assertEqual(2, await self.repo.count())
+
+    async def test_bulk_create_with_returning_match_rows_out_of_order(self):
+        # Arrange
+        columns = Villain.__table__.c
+        session = PostgresSessionMock(
+            results=[
+                # The rows of RETURNING in other order of VALUES
+                [
+                    {columns.villain_id: 2, columns.villain_name: "bar"},
+                    {columns.villain_id: 1, columns.villain_name: "foo"},
+                ],
+                [{columns.villain_id: 7, columns.villain_name: "baz"}],
+            ]
+        )
+        repo = Repository(async_session_manager=session.session_manager, model=Villain)
+
+        # Act
+        villains = await repo.bulk_create([Villain(name="foo"), Villain(name="bar"), Villain(id=7, name="baz")])
+
+        # Assert
+        self.assertEqual([(1, "foo"), (2, "bar"), (7, "baz")], [(villain.id, villain.name) for villain in villains])
+        self.assertIn("INSERT INTO villain (villain_name) VALUES", str(session.statements[0]))
+        self.assertIn("RETURNING villain.villain_id, villain.villain_name", str(session.statements[0]))
+        self.assertIn("INSERT INTO villain (villain_id, villain_name) VALUES", str(session.statements[1]))
+
+    async def test_bulk_create_with_returning_fail_when_row_do_not_match(self):
+        # Arrange
+        columns = Villain.__table__.c
+        session = PostgresSessionMock(results=[[{columns.villain_id: 1, columns.villain_name: "FOO"}]])
+        repo = Repository(async_session_manager=session.session_manager, model=Villain)
+
+        # Act and Assert
+        with self.assertRaises(ValueError):
+            await repo.bulk_create([Villain(name="foo")])
+
+    async def test_bulk_create_with_related_objects(self):
+        # Arrange
+        hero = Hero(name="foo")
+        hero.powers.append(Power(name="fly"))
+
+        # Act
+        await self.repo.bulk_create([hero])
+
+        # Assert
+        hero = await self.repo.find_one(filters={"id": 1}, relationship_to_load=["powers"])
+        self.assertEqual(1, len(hero.powers))
+
+    async def test_bulk_create_empty(self):
+        # Act and Assert
+        self.assertEqual([], await self.repo.bulk_create([]))
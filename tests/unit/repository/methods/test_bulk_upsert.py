@@ -0,0 +1,70 @@
+from sqlalchemy import event
+
+from fastapi_core.database.database import DatabaseRole
+from fastapi_core.repository import Repository
+from tests.unit.repository.hero_model import Hero, Villain
+from tests.unit.repository.test_repository import PostgresSessionMock, TestRepository
+
+
+class TestBulkUpsert(TestRepository):
+    async def test_bulk_upsert_insert_and_update_in_one_statement(self):
+        # Arrange
+        heroes = await self.create_heroes(n=2)
+        statements = []
+        engine = self.database._connections[DatabaseRole.MASTER].sync_engine
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        # Act
+        affected = await self.repo.bulk_upsert([{"id": 1, "name": "foo"}, Hero(id=3, name="bar")])
+
+        # Assert
+        self.assertEqual(2, affected)
+        self.assertEqual(1, len([statement for statement in statements if statement.startswith("INSERT")]))
+        self.assertIn("ON CONFLICT", statements[0])
+        self.assertEqual(
+            ["foo", heroes[1].name, "bar"], [hero.name for hero in await self.repo.find_all(order_by="id")]
+        )
+
+    async def test_bulk_upsert_do_not_bind_null_for_missing_columns(self):
+        # Arrange
+        session = PostgresSessionMock()
+        repo = Repository(async_session_manager=session.session_manager, model=Villain)
+
+        # Act
+        await repo.bulk_upsert([Villain(id=1, name="foo"), Villain(name="new")])
+
+        # Assert
+        self.assertEqual(2, len(session.statements))
+        self.assertIn("INSERT INTO villain (villain_id, villain_name) VALUES", str(session.statements[0]))
+        self.assertIn("INSERT INTO villain (villain_name) VALUES", str(session.statements[1]))
+        self.assertIn(
+            "ON CONFLICT (villain_id) DO UPDATE SET villain_name = excluded.villain_name", str(session.statements[1])
+        )
+        self.assertEqual({"villain_name": "new"}, session.statements[1].params)
+
+    async def test_bulk_upsert_do_not_update_created_at(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+
+        # Act
+        await self.repo.bulk_upsert([{"id": hero.id, "name": "foo"}])
+
+        # Assert
+        updated_hero = await self.repo.find_one(filters={"id": hero.id})
+        self.assertEqual("foo", updated_hero.name)
+        self.assertEqual(hero.created_at, updated_hero.created_at)
+
+    async def test_bulk_upsert_do_nothing_without_update_columns(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+
+        # Act
+        await self.repo.bulk_upsert([{"id": 1, "name": "foo"}, {"id": 2, "name": "bar"}], update_columns=[])
+
+        # Assert
+        heroes = await self.repo.find_all(order_by="id")
+        self.assertEqual([hero.name, "bar"], [h.name for h in heroes])
+
+    async def test_bulk_upsert_empty(self):
+        # Act and Assert
+        self.assertEqual(0, await self.repo.bulk_upsert([]))
@@ -0,0 +1,123 @@
+from sqlalchemy import event
+
+from fastapi_core.database.database import DatabaseRole
+from tests.unit.repository.hero_model import Hero
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestBulkWrite(TestRepository):
+    def listen_statements(self) -> list[str]:
+        statements = []
+        engine = self.database._connections[DatabaseRole.MASTER].sync_engine
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        return statements
+
+    async def test_bulk_update_only_changed_columns(self):
+        # Arrange
+        heroes = await self.create_heroes(3)
+        heroes[0].name = "foo"
+        heroes[1].name = "bar"
+        statements = self.listen_statements()
+
+        # Act
+        updated = await self.repo.bulk_update(heroes)
+
+        # Assert
+        self.assertEqual(3, len(updated))
+        self.assertEqual(1, len(statements))
+        self.assertIn("name=", statements[0])
+        self.assertNotIn("created_at", statements[0])
+        self.assertIsNotNone(heroes[0].updated_at)
+        self.assertIsNone(heroes[2].updated_at)
+        self.assertEqual("foo", (await self.repo.find_one(filters={"id": 1})).name)
+        self.assertEqual("bar", (await self.repo.find_one(filters={"id": 2})).name)
+
+    async def test_bulk_update_without_changes(self):
+        # Arrange
+        heroes = await self.create_heroes(2)
+        statements = self.listen_statements()
+
+        # Act
+        await self.repo.bulk_update(heroes)
+
+        # Assert
+        self.assertEqual([], statements)
+
+    async def test_update_by_filters(self):
+        # Arrange
+        heroes = await self.create_heroes(3)
+
+        # Act
+        updated = await self.repo.update_by_filters(filters={"name": heroes[0].name}, values={"name": "foo"})
+
+        # Assert
+        self.assertEqual(1, updated)
+        self.assertEqual(1, await self.repo.count(filters={"name": "foo"}))
+
+    async def test_update_by_filters_with_invalid_filters(self):
+        # Act and Assert
+        with self.assertRaises(ValueError):
+            await self.repo.update_by_filters(filters={"foo": 1}, values={"name": "foo"})
+
+    async def test_bulk_delete(self):
+        # Arrange
+        heroes = await self.create_heroes(5)
+
+        # Act
+        deleted = await self.repo.bulk_delete(heroes[:3], chunk_size=2)
+
+        # Assert
+        self.assertEqual(3, deleted)
+        self.assertEqual(2, await self.repo.count())
+
+    async def test_delete_by_filters(self):
+        # Arrange
+        heroes = await self.create_heroes(3)
+
+        # Act
+        deleted = await self.repo.delete_by_filters(filters={"id": heroes[1].id})
+
+        # Assert
+        self.assertEqual(1, deleted)
+        self.assertEqual(2, await self.repo.count())
+
+    async def test_bulk_delete_run_the_events_of_delete(self):
+        # Arrange
+        heroes = await self.create_heroes(3)
+        deleted_ids = []
+
+        def before_delete(mapper, connection, target):
+            deleted_ids.append(target.id)
+
+        event.listen(Hero, "before_delete", before_delete)
+        self.addCleanup(event.remove, Hero, "before_delete", before_delete)
+
+        # Act
+        deleted = await self.repo.bulk_delete(heroes[:2])
+        deleted_by_filters = await self.repo.delete_by_filters(filters={"id": heroes[2].id})
+
+        # Assert
+        self.assertEqual(2, deleted)
+        self.assertEqual(1, deleted_by_filters)
+        self.assertEqual([hero.id for hero in heroes], sorted(deleted_ids))
+        self.assertEqual(0, await self.repo.count())
+
+    async def test_delete_by_filters_with_empty_filters(self):
+        # Act and Assert
+        with self.assertRaises(ValueError):
+            await self.repo.delete_by_filters(filters={})
+
+    async def test_bulk_soft_delete(self):
+        # Arrange
+        heroes = await self.create_heroes(3)
+
+        # Act
+        deleted = await self.repo.bulk_soft_delete(heroes[:2])
+        deleted_again = await self.repo.bulk_soft_delete(heroes[:2])
+
+        # Assert
+        self.assertEqual(2, deleted)
+        self.assertEqual(0, deleted_again)
+        self.assertIsNotNone(heroes[0].deleted_at)
+        self.assertIsNone(heroes[2].deleted_at)
+        self.assertIsNotNone((await self.repo.find_one(filters={"id": heroes[1].id})).deleted_at)
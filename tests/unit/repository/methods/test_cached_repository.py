@@ -0,0 +1,180 @@
+import json
+from unittest.mock import patch
+
+from fastapi_pagination import Params
+from sqlalchemy import event
+from starlette_context import request_cycle_context
+
+from fastapi_core.cache_driver.cache_driver_abc import NO_TIME_BUDGET
+from fastapi_core.cache_driver.in_memory_driver import InMemoryCacheDriver
+from fastapi_core.database.database import DatabaseRole
+from fastapi_core.database.unit_of_work import UnitOfWork
+from fastapi_core.repository import CachedRepository
+from tests.unit.repository.hero_model import Hero
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestCachedRepository(TestRepository):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.cache_driver = InMemoryCacheDriver(namespace_prefix="test")
+        await self.cache_driver.flush_for_namespace()
+        self.repo = CachedRepository(
+            async_session_manager=self.database.factory_async_session_manager,
+            model=Hero,
+            cache_driver=self.cache_driver,
+        )
+        self.statements = []
+        engine = self.database._connections[DatabaseRole.MASTER].sync_engine
+        event.listen(engine, "before_cursor_execute", lambda *args: self.statements.append(args[2]))
+
+    async def test_find_one_by_pk_read_through_cache(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+        await self.repo.find_one(filters={"id": hero.id})
+        self.statements.clear()
+
+        # Act
+        cached_hero = await self.repo.find_one(filters={"id": hero.id})
+
+        # Assert
+        self.assertEqual([], self.statements)
+        self.assertEqual(hero.name, cached_hero.name)
+        self.assertEqual(hero.created_at, cached_hero.created_at)
+
+    async def test_cached_obj_can_be_updated(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+        await self.repo.find_one(filters={"id": hero.id})
+        cached_hero = await self.repo.find_one(filters={"id": hero.id})
+
+        # Act
+        await self.repo.update(cached_hero, {"name": "foo"})
+
+        # Assert
+        self.assertEqual("foo", (await self.repo.find_one(filters={"id": hero.id})).name)
+        self.assertEqual(1, await self.repo.count())
+
+    async def test_find_paginated_and_count_are_invalidated_by_create(self):
+        # Arrange
+        await self.create_heroes(n=2)
+        await self.repo.find_paginated(params=Params(page=1, size=10))
+        await self.repo.count()
+        self.statements.clear()
+
+        cached_page = await self.repo.find_paginated(params=Params(page=1, size=10))
+        cached_count = await self.repo.count()
+        cached_statements = list(self.statements)
+
+        # Act
+        await self.repo.create({"name": "foo"})
+
+        # Assert
+        self.assertEqual([], cached_statements)
+        self.assertEqual(2, cached_page.total)
+        self.assertEqual(2, cached_count)
+        self.assertEqual(3, (await self.repo.find_paginated(params=Params(page=1, size=10))).total)
+        self.assertEqual(3, await self.repo.count())
+
+    async def test_bulk_delete_invalidate_pk_keys(self):
+        # Arrange
+        heroes = await self.create_heroes(n=2)
+        await self.repo.find_one(filters={"id": heroes[0].id})
+
+        # Act
+        await self.repo.bulk_delete(heroes)
+
+        # Assert
+        self.assertIsNone(await self.repo.find_one(filters={"id": heroes[0].id}))
+
+    async def test_invalidation_do_not_use_time_budget(self):
+        # Arrange
+        heroes = await self.create_heroes(n=1)
+
+        with patch.object(self.cache_driver, "dump_prefix", wraps=self.cache_driver.dump_prefix) as dump_prefix:
+            # Act
+            await self.repo.bulk_delete(heroes)
+            await self.repo.invalidate()
+
+        # Assert
+        self.assertEqual(2, dump_prefix.await_count)
+        self.assertTrue(
+            all(call.kwargs["time_budget_seconds"] == NO_TIME_BUDGET for call in dump_prefix.await_args_list)
+        )
+
+    async def test_read_only_false_skip_cache(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+        await self.repo.find_one(filters={"id": hero.id})
+        self.statements.clear()
+
+        # Act
+        await self.repo.find_one(filters={"id": hero.id}, read_only=False)
+
+        # Assert
+        self.assertEqual(1, len(self.statements))
+
+    async def test_get_many_by_pks_only_select_missing(self):
+        # Arrange
+        heroes = await self.create_heroes(n=2)
+        await self.repo.find_one(filters={"id": heroes[0].id})
+        self.statements.clear()
+
+        # Act
+        found_heroes = await self.repo.get_many_by_pks(pks=[hero.id for hero in heroes])
+        cached_heroes = await self.repo.get_many_by_pks(pks=[hero.id for hero in heroes])
+
+        # Assert
+        self.assertEqual(1, len(self.statements))
+        self.assertEqual({hero.id: hero.name for hero in heroes}, {pk: hero.name for pk, hero in found_heroes.items()})
+        self.assertEqual(found_heroes.keys(), cached_heroes.keys())
+
+    async def test_invalidate_again_after_commit_of_unit_of_work(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+        old_name = hero.name
+
+        with request_cycle_context({}):
+            unit_of_work = UnitOfWork(database=self.database)
+            unit_of_work.begin_in_request()
+            await self.repo.update(hero, {"name": "foo"})
+            # A read of other request before the commit cache the old row
+            await self.cache_driver.set(
+                key=self.repo._pk_key(hero.id), value=json.dumps({"id": hero.id, "name": old_name})
+            )
+
+            # Act
+            await unit_of_work.commit()
+            await unit_of_work.close()
+
+        # Assert
+        self.assertIsNone(await self.cache_driver.get(key=self.repo._pk_key(hero.id)))
+        self.assertEqual("foo", (await self.repo.find_one(filters={"id": hero.id})).name)
+
+    async def test_replica_read_after_write_do_not_populate_cache(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+        await self.repo.update(hero, {"name": "foo"})
+
+        # Act
+        found_hero = await self.repo.find_one(filters={"id": hero.id})
+        await self.repo.count()
+
+        # Assert
+        self.assertEqual("foo", found_hero.name)
+        self.assertIsNone(await self.cache_driver.get(key=self.repo._pk_key(hero.id)))
+        self.assertEqual(
+            ["test:hero:written"], [key for key in self.cache_driver.keys() if key.startswith("test:hero:")]
+        )
+
+    async def test_replica_read_after_write_populate_cache_without_replica_lag(self):
+        # Arrange
+        self.repo.replica_lag_seconds = 0
+        hero = (await self.create_heroes(n=1))[0]
+        await self.repo.update(hero, {"name": "foo"})
+
+        # Act
+        await self.repo.find_one(filters={"id": hero.id})
+
+        # Assert
+        self.assertIsNotNone(await self.cache_driver.get(key=self.repo._pk_key(hero.id)))
@@ -0,0 +1,131 @@
+import asyncio
+from unittest.mock import patch
+
+from sqlalchemy.exc import IntegrityError
+from starlette_context import context, request_cycle_context
+
+from fastapi_core.database.routing import WROTE_IN_MASTER_CONTEXT_KEY
+from fastapi_core.database.unit_of_work import UnitOfWork
+from fastapi_core.repository import CreateCoalescer
+from tests.unit.repository.hero_model import Hero
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestCreateCoalescer(TestRepository):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.coalescer = CreateCoalescer(repository=self.repo, max_batch_size=10, max_wait_seconds=0.01)
+
+    async def test_concurrent_creates_in_one_batch(self):
+        with patch.object(self.repo, "bulk_create", wraps=self.repo.bulk_create) as bulk_create:
+            # Act
+            heroes = await asyncio.gather(*[self.coalescer.create({"name": f"hero {i}"}) for i in range(5)])
+
+        # Assert
+        self.assertEqual(1, bulk_create.call_count)
+        self.assertEqual([f"hero {i}" for i in range(5)], [hero.name for hero in heroes])
+        self.assertEqual(5, len({hero.id for hero in heroes}))
+        self.assertEqual(5, await self.repo.count())
+
+    async def test_batch_is_created_when_full(self):
+        # Arrange
+        coalescer = CreateCoalescer(repository=self.repo, max_batch_size=2, max_wait_seconds=10)
+
+        with patch.object(self.repo, "bulk_create", wraps=self.repo.bulk_create) as bulk_create:
+            # Act
+            heroes = await asyncio.wait_for(
+                asyncio.gather(*[coalescer.create(Hero(name=f"hero {i}")) for i in range(4)]), timeout=1
+            )
+
+        # Assert
+        self.assertEqual(2, bulk_create.call_count)
+        self.assertEqual(4, len(heroes))
+
+    async def test_each_caller_receive_its_error(self):
+        # Arrange
+        existing_hero = (await self.create_heroes(1))[0]
+
+        # Act
+        results = await asyncio.gather(
+            self.coalescer.create(Hero(name="foo")),
+            self.coalescer.create(Hero(id=existing_hero.id, name="duplicated")),
+            self.coalescer.create(Hero(name="bar")),
+            return_exceptions=True,
+        )
+
+        # Assert
+        self.assertEqual("foo", results[0].name)
+        self.assertIsInstance(results[1], IntegrityError)
+        self.assertEqual("bar", results[2].name)
+        self.assertEqual(3, await self.repo.count())
+
+    async def test_flush_create_pending_objects(self):
+        # Arrange
+        coalescer = CreateCoalescer(repository=self.repo, max_batch_size=10, max_wait_seconds=10)
+        task = asyncio.ensure_future(coalescer.create({"name": "foo"}))
+        await asyncio.sleep(0)
+
+        # Act
+        await coalescer.flush()
+
+        # Assert
+        self.assertEqual("foo", (await task).name)
+
+    async def test_mark_wrote_in_master_in_request_of_caller(self):
+        with request_cycle_context({}):
+            # Act
+            await self.coalescer.create({"name": "foo"})
+
+            # Assert
+            self.assertTrue(context.get(WROTE_IN_MASTER_CONTEXT_KEY))
+
+    async def test_create_in_unit_of_work_is_not_coalesced(self):
+        with request_cycle_context({}):
+            # Arrange
+            unit_of_work = UnitOfWork(database=self.database)
+            unit_of_work.begin_in_request()
+
+            with patch.object(self.repo, "bulk_create", wraps=self.repo.bulk_create) as bulk_create:
+                # Act
+                await self.coalescer.create({"name": "foo"})
+                await unit_of_work.rollback()
+                await unit_of_work.close()
+
+        # Assert
+        self.assertEqual(0, bulk_create.call_count)
+        self.assertEqual(0, await self.repo.count())
+
+    async def test_cancelled_batch_do_not_leave_callers_waiting(self):
+        # Arrange
+        async def cancelled_bulk_create(*args, **kwargs):
+            raise asyncio.CancelledError()
+
+        with patch.object(self.repo, "bulk_create", cancelled_bulk_create):
+            # Act
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *[self.coalescer.create({"name": f"hero {i}"}) for i in range(2)], return_exceptions=True
+                ),
+                timeout=1,
+            )
+
+        # Assert
+        self.assertTrue(all(isinstance(result, asyncio.CancelledError) for result in results))
+
+    async def test_callers_receive_error_when_batch_return_other_number_of_objects(self):
+        # Arrange
+        async def short_bulk_create(objs, **kwargs):
+            return [Hero(id=1, name="foo")]
+
+        with patch.object(self.repo, "bulk_create", short_bulk_create):
+            # Act
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *[self.coalescer.create({"name": f"hero {i}"}) for i in range(2)], return_exceptions=True
+                ),
+                timeout=1,
+            )
+
+        # Assert
+        self.assertEqual("foo", results[0].name)
+        self.assertIsInstance(results[1], ValueError)
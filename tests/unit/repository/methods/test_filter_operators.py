@@ -0,0 +1,153 @@
+from fastapi_pagination import Params
+from sqlalchemy import event
+
+from fastapi_core.database.database import DatabaseRole
+from tests.unit.repository.hero_model import Hero
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestFilterOperators(TestRepository):
+    async def create_named_heroes(self, names: list[str]) -> list[Hero]:
+        return await self.repo.bulk_create(objs=[{"name": name} for name in names])
+
+    async def test_in_filter(self):
+        # Arrange
+        heroes = await self.create_heroes(3)
+
+        # Act
+        found = await self.repo.find_all(filters={"id__in": [heroes[0].id, heroes[2].id]}, order_by="id")
+
+        # Assert
+        self.assertEqual([heroes[0].id, heroes[2].id], [hero.id for hero in found])
+
+    async def test_in_filter_with_other_size_reuse_statement(self):
+        # Arrange
+        heroes = await self.create_heroes(3)
+
+        # Act
+        await self.repo.find_all(filters={"id__in": [heroes[0].id]})
+        found = await self.repo.find_all(filters={"id__in": [hero.id for hero in heroes]})
+
+        # Assert
+        self.assertEqual(3, len(found))
+        stats = self.repo.get_statement_cache_stats()
+        self.assertEqual(1, stats.misses)
+        self.assertEqual(1, stats.hits)
+
+    async def test_range_filter(self):
+        # Arrange
+        await self.create_heroes(5)
+
+        # Act
+        found = await self.repo.find_all(filters={"id__gte": 2, "id__lt": 4}, order_by="id")
+
+        # Assert
+        self.assertEqual([2, 3], [hero.id for hero in found])
+
+    async def test_gt_lte_and_ne_filters(self):
+        # Arrange
+        await self.create_heroes(5)
+
+        # Act
+        found = await self.repo.find_all(filters={"id__gt": 1, "id__lte": 4, "id__ne": 3}, order_by="id")
+
+        # Assert
+        self.assertEqual([2, 4], [hero.id for hero in found])
+
+    async def test_startswith_filter(self):
+        # Arrange
+        await self.create_named_heroes(["Spider-Man", "Spider-Woman", "Superman"])
+
+        # Act
+        found = await self.repo.find_all(filters={"name__startswith": "Spider"}, order_by="id")
+
+        # Assert
+        self.assertEqual(["Spider-Man", "Spider-Woman"], [hero.name for hero in found])
+
+    async def test_startswith_escape_wildcards(self):
+        # Arrange
+        await self.create_named_heroes(["100% Hero", "1000 Hero", "a_b", "axb"])
+
+        # Act
+        percent = await self.repo.find_all(filters={"name__startswith": "100%"})
+        underscore = await self.repo.find_all(filters={"name__startswith": "a_"})
+
+        # Assert
+        self.assertEqual(["100% Hero"], [hero.name for hero in percent])
+        self.assertEqual(["a_b"], [hero.name for hero in underscore])
+
+    async def test_startswith_with_value_not_str(self):
+        # Assert
+        with self.assertRaises(ValueError):
+            await self.repo.find_all(filters={"name__startswith": 100})
+
+    async def test_startswith_use_like_prefix(self):
+        # Arrange
+        statements = []
+        engine = self.database._connections[DatabaseRole.MASTER].sync_engine
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        # Act
+        await self.repo.find_all(filters={"name__startswith": "Spider"})
+
+        # Assert
+        self.assertIn("LIKE", statements[-1])
+        self.assertNotIn("lower(", statements[-1])
+
+    async def test_isnull_filter(self):
+        # Arrange
+        heroes = await self.create_heroes(2)
+        await self.repo.soft_delete_by_pk(pk=heroes[0].id)
+
+        # Act
+        deleted = await self.repo.find_all(filters={"deleted_at__isnull": False})
+        not_deleted = await self.repo.find_all(filters={"deleted_at__isnull": True})
+
+        # Assert
+        self.assertEqual([heroes[0].id], [hero.id for hero in deleted])
+        self.assertEqual([heroes[1].id], [hero.id for hero in not_deleted])
+        self.assertEqual(2, self.repo.get_statement_cache_stats().misses)
+
+    async def test_invalid_operator_is_ignored(self):
+        # Arrange
+        await self.create_heroes(2)
+
+        # Act
+        found = await self.repo.find_all(filters={"id__foo": 1, "foo__gte": 1})
+
+        # Assert
+        self.assertEqual(2, len(found))
+
+    async def test_find_one_and_count_with_operators(self):
+        # Arrange
+        heroes = await self.create_heroes(4)
+
+        # Act
+        hero = await self.repo.find_one(filters={"id__gt": heroes[2].id})
+        count = await self.repo.count(filters={"id__in": [heroes[0].id, heroes[1].id]})
+
+        # Assert
+        self.assertEqual(heroes[3].id, hero.id)
+        self.assertEqual(2, count)
+
+    async def test_find_paginated_with_operators(self):
+        # Arrange
+        await self.create_heroes(5)
+
+        # Act
+        page = await self.repo.find_paginated(params=Params(page=1, size=2), filters={"id__gte": 2}, order_by="id")
+
+        # Assert
+        self.assertEqual([2, 3], [hero.id for hero in page.items])
+        self.assertEqual(4, page.total)
+
+    async def test_delete_by_filters_with_operator(self):
+        # Arrange
+        heroes = await self.create_heroes(3)
+
+        # Act
+        deleted = await self.repo.delete_by_filters(filters={"id__lt": heroes[2].id})
+
+        # Assert
+        self.assertEqual(2, deleted)
+        self.assertEqual([heroes[2].id], [hero.id for hero in await self.repo.find_all()])
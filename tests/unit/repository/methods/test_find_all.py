@@ -53,3 +53,15 @@ class TestFindAll(TestRepository):
         self.assertIsInstance(heroes[0], Hero)
         self.assertIsInstance(heroes, list)
         self.assertEqual(3, len(heroes))
+
+    async def test_find_all_ignore_invalid_filters_without_change_them(self):
+        # Arrange
+        await self.create_heroes(2)
+        filters = {"id": 1, "foo": "bar"}
+
+        # Act
+        heroes = await self.repo.find_all(filters=filters)
+
+        # Assert
+        self.assertEqual(1, len(heroes))
+        self.assertEqual({"id": 1, "foo": "bar"}, filters)
@@ -0,0 +1,59 @@
+from fastapi_core.repository import CursorParams
+from fastapi_core.utils.exceptions import InvalidCursorException
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestFindCursorPaginated(TestRepository):
+    async def test_find_cursor_paginated_should_walk_all_pages(self):
+        # Arrange
+        await self.create_heroes(7)
+
+        # Act
+        first_page = await self.repo.find_cursor_paginated(params=CursorParams(size=3))
+        second_page = await self.repo.find_cursor_paginated(params=CursorParams(size=3, cursor=first_page.next_cursor))
+        last_page = await self.repo.find_cursor_paginated(params=CursorParams(size=3, cursor=second_page.next_cursor))
+
+        # Assert
+        self.assertEqual([1, 2, 3], [hero.id for hero in first_page.items])
+        self.assertEqual([4, 5, 6], [hero.id for hero in second_page.items])
+        self.assertEqual([7], [hero.id for hero in last_page.items])
+        self.assertIsNone(last_page.next_cursor)
+        self.assertIsNone(first_page.total)
+
+    async def test_find_cursor_paginated_with_order_by_desc(self):
+        # Arrange
+        heroes = await self.create_heroes(4)
+        names = sorted([hero.name for hero in heroes], reverse=True)
+
+        # Act
+        first_page = await self.repo.find_cursor_paginated(params=CursorParams(size=2), order_by="name", desc=True)
+        second_page = await self.repo.find_cursor_paginated(
+            params=CursorParams(size=2, cursor=first_page.next_cursor), order_by="name", desc=True
+        )
+
+        # Assert
+        self.assertEqual(names, [hero.name for hero in first_page.items + second_page.items])
+
+    async def test_find_cursor_paginated_with_filters_and_total(self):
+        # Arrange
+        heroes = await self.create_heroes(3)
+
+        # Act
+        page = await self.repo.find_cursor_paginated(
+            params=CursorParams(size=2, include_total=True), filters={"name": heroes[1].name}
+        )
+
+        # Assert
+        self.assertEqual(1, page.total)
+        self.assertEqual(heroes[1].id, page.items[0].id)
+        self.assertIsNone(page.next_cursor)
+
+    async def test_find_cursor_paginated_with_invalid_cursor(self):
+        # Act and Assert
+        with self.assertRaises(InvalidCursorException):
+            await self.repo.find_cursor_paginated(params=CursorParams(cursor="foo"))
+
+    async def test_find_cursor_paginated_with_nullable_order_by(self):
+        # Act and Assert
+        with self.assertRaises(ValueError):
+            await self.repo.find_cursor_paginated(params=CursorParams(size=2), order_by="deleted_at")
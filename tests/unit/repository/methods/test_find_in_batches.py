@@ -0,0 +1,136 @@
+import asyncio
+
+from fastapi_core.cache_driver.in_memory_driver import InMemoryCacheDriver
+from fastapi_core.repository import CacheBatchCheckpoint
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestFindInBatches(TestRepository):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.cache_driver = InMemoryCacheDriver(namespace_prefix="test")
+        await self.cache_driver.flush_for_namespace()
+        self.checkpoint = CacheBatchCheckpoint(cache_driver=self.cache_driver, key="jobs:heroes")
+
+    async def test_find_in_batches(self):
+        # Arrange
+        heroes = await self.create_heroes(7)
+
+        # Act
+        batches = [batch async for batch in self.repo.find_in_batches(batch_size=3)]
+
+        # Assert
+        self.assertEqual([3, 3, 1], [len(batch) for batch in batches])
+        self.assertEqual([hero.id for hero in heroes], [hero.id for batch in batches for hero in batch])
+        self.assertEqual(2, self.repo.get_statement_cache_stats().size)
+
+    async def test_find_in_batches_with_filters_and_after_pk(self):
+        # Arrange
+        heroes = await self.create_heroes(6)
+
+        # Act
+        batches = [
+            batch
+            async for batch in self.repo.find_in_batches(
+                batch_size=2, filters={"id__ne": heroes[4].id}, after_pk=heroes[1].id
+            )
+        ]
+
+        # Assert
+        self.assertEqual(
+            [[heroes[2].id, heroes[3].id], [heroes[5].id]], [[hero.id for hero in batch] for batch in batches]
+        )
+
+    async def test_find_in_batches_exact_multiple(self):
+        # Arrange
+        await self.create_heroes(4)
+
+        # Act
+        batches = [batch async for batch in self.repo.find_in_batches(batch_size=2)]
+
+        # Assert
+        self.assertEqual([2, 2], [len(batch) for batch in batches])
+
+    async def test_process_in_batches_with_concurrency(self):
+        # Arrange
+        heroes = await self.create_heroes(10)
+        processed_ids, running, max_running = [], 0, 0
+
+        async def process(batch):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            processed_ids.extend(hero.id for hero in batch)
+            running -= 1
+
+        # Act
+        processed = await self.repo.process_in_batches(
+            process=process, batch_size=2, concurrency=3, checkpoint=self.checkpoint
+        )
+
+        # Assert
+        self.assertEqual(10, processed)
+        self.assertEqual(sorted(hero.id for hero in heroes), sorted(processed_ids))
+        self.assertLessEqual(max_running, 3)
+        self.assertGreater(max_running, 1)
+        self.assertIsNone(await self.checkpoint.load())
+
+    async def test_process_in_batches_resume_from_checkpoint(self):
+        # Arrange
+        heroes = await self.create_heroes(6)
+        processed_ids = []
+
+        async def failing_process(batch):
+            if heroes[4].id in [hero.id for hero in batch]:
+                raise RuntimeError("job stopped")
+            processed_ids.extend(hero.id for hero in batch)
+
+        async def process(batch):
+            processed_ids.extend(hero.id for hero in batch)
+
+        # Act
+        with self.assertRaises(RuntimeError):
+            await self.repo.process_in_batches(process=failing_process, batch_size=2, checkpoint=self.checkpoint)
+        saved_pk = await self.checkpoint.load()
+        processed = await self.repo.process_in_batches(process=process, batch_size=2, checkpoint=self.checkpoint)
+
+        # Assert
+        self.assertEqual(heroes[3].id, saved_pk)
+        self.assertEqual(2, processed)
+        self.assertEqual([hero.id for hero in heroes], processed_ids)
+        self.assertIsNone(await self.checkpoint.load())
+
+    async def test_process_in_batches_save_checkpoint_in_order(self):
+        # Arrange
+        heroes = await self.create_heroes(6)
+        first_batch_done, saved = False, []
+
+        async def process(batch):
+            nonlocal first_batch_done
+            if batch[0].id == heroes[0].id:
+                # The first batch is the slowest, the next batches can not be saved before it
+                await asyncio.sleep(0.05)
+                first_batch_done = True
+
+        original_save = self.checkpoint.save
+
+        async def save(last_pk):
+            saved.append((first_batch_done, last_pk))
+            await original_save(last_pk)
+
+        self.checkpoint.save = save
+
+        # Act
+        await self.repo.process_in_batches(process=process, batch_size=2, concurrency=3, checkpoint=self.checkpoint)
+
+        # Assert
+        self.assertTrue(all(done for done, _ in saved))
+        self.assertEqual(heroes[-1].id, saved[-1][1])
+
+    async def test_invalid_arguments(self):
+        # Assert
+        with self.assertRaises(ValueError):
+            await self.repo.process_in_batches(process=None, concurrency=0)
+        with self.assertRaises(ValueError):
+            [batch async for batch in self.repo.find_in_batches(batch_size=0)]
@@ -1,6 +1,16 @@
-from fastapi_pagination import Params
+import asyncio
+import json
 
-from tests.unit.repository.hero_model import Power
+from fastapi_pagination import Params
+from sqlalchemy import event
+from starlette_context import request_cycle_context
+
+from fastapi_core.database import Database
+from fastapi_core.database.database import DatabaseRole
+from fastapi_core.database.pool import PoolOptions
+from fastapi_core.database.unit_of_work import UnitOfWork
+from fastapi_core.repository import CountMode, Repository
+from tests.unit.repository.hero_model import Hero, Power
 from tests.unit.repository.test_repository import TestRepository
 
 
@@ -73,3 +83,167 @@ class TestFindPaginated(TestRepository):
         # Act and Assert
         with self.assertRaises(ValueError):
             await self.repo.find_paginated(params={"size": 3})
+
+    async def test_find_paginated_without_count(self):
+        # Arrange
+        await self.create_heroes(5)
+        statements = []
+        engine = self.database._connections[DatabaseRole.MASTER].sync_engine
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        # Act
+        first_page = await self.repo.find_paginated(params=Params(page=1, size=3), count_mode=CountMode.NONE)
+        last_page = await self.repo.find_paginated(params=Params(page=2, size=3), count_mode=CountMode.NONE)
+
+        # Assert
+        self.assertIsNone(first_page.total)
+        self.assertEqual(CountMode.NONE, first_page.total_kind)
+        self.assertTrue(first_page.has_next)
+        self.assertEqual(3, len(first_page.items))
+        self.assertFalse(last_page.has_next)
+        self.assertEqual(2, len(last_page.items))
+        self.assertFalse(any("count" in statement for statement in statements))
+
+    async def test_find_paginated_with_cached_count(self):
+        # Arrange
+        await self.create_heroes(3)
+        first_page = await self.repo.find_paginated(params=Params(page=1, size=2), count_mode=CountMode.CACHED)
+        await self.create_heroes(1)
+
+        # Act
+        cached_page = await self.repo.find_paginated(params=Params(page=1, size=2), count_mode=CountMode.CACHED)
+        exact_page = await self.repo.find_paginated(params=Params(page=1, size=2))
+
+        # Assert
+        self.assertEqual(3, first_page.total)
+        self.assertEqual(3, cached_page.total)
+        self.assertEqual(CountMode.CACHED, cached_page.total_kind)
+        self.assertEqual(4, exact_page.total)
+        self.assertEqual(CountMode.EXACT, exact_page.total_kind)
+
+    async def test_cached_count_is_forgotten_by_write(self):
+        # Arrange
+        await self.create_heroes(3)
+        await self.repo.find_paginated(params=Params(page=1, size=2), count_mode=CountMode.CACHED)
+
+        # Act
+        await self.repo.create({"name": "foo"})
+        page = await self.repo.find_paginated(params=Params(page=1, size=2), count_mode=CountMode.CACHED)
+
+        # Assert
+        self.assertEqual(4, page.total)
+
+    async def test_cached_count_is_bounded_and_expire(self):
+        # Arrange
+        repo = Repository(
+            async_session_manager=self.database.factory_async_session_manager,
+            model=Hero,
+            count_cache_seconds=0.05,
+            count_cache_size=2,
+        )
+        heroes = await self.create_heroes(3)
+
+        # Act
+        for hero in heroes:
+            await repo.find_paginated(params=Params(), filters={"id": hero.id}, count_mode=CountMode.CACHED)
+        size_after_pages = len(repo._count_cache)
+        await asyncio.sleep(0.06)
+        expired_total = repo._count_cache.get(json.dumps({"id": heroes[2].id}))
+
+        # Assert
+        self.assertEqual(2, size_after_pages)
+        self.assertIsNone(expired_total)
+        self.assertEqual(1, len(repo._count_cache))
+
+    async def test_find_paginated_estimated_count_fall_back_to_exact(self):
+        # Arrange
+        await self.create_heroes(3)
+
+        # Act
+        pagination_result = await self.repo.find_paginated(
+            params=Params(page=1, size=2), count_mode=CountMode.ESTIMATED
+        )
+
+        # Assert
+        self.assertEqual(3, pagination_result.total)
+        self.assertEqual(CountMode.EXACT, pagination_result.total_kind)
+
+    def listen_connections_of_statements(self) -> list[tuple[str, int]]:
+        statements = []
+        engine = self.database._connections[DatabaseRole.MASTER].sync_engine
+        event.listen(
+            engine, "before_cursor_execute", lambda conn, *args: statements.append((args[1], id(conn.connection)))
+        )
+        return statements
+
+    async def test_find_paginated_count_in_other_connection(self):
+        # Arrange
+        await self.create_heroes(5)
+        statements = self.listen_connections_of_statements()
+
+        # Act
+        pagination_result = await self.repo.find_paginated(params=Params(page=1, size=2))
+
+        # Assert
+        self.assertEqual(5, pagination_result.total)
+        self.assertEqual(2, len(statements))
+        self.assertNotEqual(statements[0][1], statements[1][1])
+
+    async def test_find_paginated_count_in_same_connection_inside_unit_of_work(self):
+        # Arrange
+        await self.create_heroes(5)
+        statements = self.listen_connections_of_statements()
+
+        # Act
+        with request_cycle_context({}):
+            unit_of_work = UnitOfWork(database=self.database)
+            unit_of_work.begin_in_request()
+            pagination_result = await self.repo.find_paginated(params=Params(page=1, size=2))
+            await unit_of_work.close()
+
+        # Assert
+        self.assertEqual(5, pagination_result.total)
+        self.assertEqual(2, len(statements))
+        self.assertEqual(statements[0][1], statements[1][1])
+
+    async def test_find_paginated_reserve_two_free_connections_of_pool(self):
+        # Arrange
+        database = Database(
+            db_url="sqlite+aiosqlite:///./test.db", pool_options=PoolOptions(pool_size=2, max_overflow=0)
+        )
+        small_database = Database(
+            db_url="sqlite+aiosqlite:///./test.db", pool_options=PoolOptions(pool_size=1, max_overflow=0)
+        )
+
+        async with database.factory_async_session_manager() as session:
+            async with small_database.factory_async_session_manager() as small_session:
+                # Act
+                pool = self.repo._reserve_concurrent_connections(session)
+                pool_without_free_connections = self.repo._reserve_concurrent_connections(session)
+                self.repo._release_concurrent_connections(pool)
+                pool_released = self.repo._reserve_concurrent_connections(session)
+                self.repo._release_concurrent_connections(pool_released)
+                small_pool = self.repo._reserve_concurrent_connections(small_session)
+
+        # Assert
+        self.assertIs(database._connections[DatabaseRole.MASTER].sync_engine.pool, pool)
+        self.assertIsNone(pool_without_free_connections)
+        self.assertIs(pool, pool_released)
+        self.assertIsNone(small_pool)
+
+    async def test_find_paginated_count_in_same_connection_with_small_pool(self):
+        # Arrange
+        await self.create_heroes(5)
+        self.database = Database(
+            db_url="sqlite+aiosqlite:///./test.db", pool_options=PoolOptions(pool_size=1, max_overflow=0)
+        )
+        repo = Repository(async_session_manager=self.database.factory_async_session_manager, model=Hero)
+        statements = self.listen_connections_of_statements()
+
+        # Act
+        pagination_result = await repo.find_paginated(params=Params(page=1, size=2))
+
+        # Assert
+        self.assertEqual(5, pagination_result.total)
+        self.assertEqual(2, len(statements))
+        self.assertEqual(statements[0][1], statements[1][1])
@@ -0,0 +1,40 @@
+from tests.unit.repository.hero_model import Hero, Power
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestFindStream(TestRepository):
+    async def test_find_stream_in_batches(self):
+        # Arrange
+        await self.create_heroes(5)
+
+        # Act
+        heroes = [hero async for hero in self.repo.find_stream(order_by="id", desc=True, batch_size=2)]
+
+        # Assert
+        self.assertEqual([5, 4, 3, 2, 1], [hero.id for hero in heroes])
+        self.assertIsInstance(heroes[0], Hero)
+
+    async def test_find_stream_with_filters_and_relationship_to_load(self):
+        # Arrange
+        await self.create_heroes(2)
+        hero_with_powers = await self.create_hero_with_powers(n_powers=2)
+
+        # Act
+        heroes = [
+            hero
+            async for hero in self.repo.find_stream(
+                filters={"id": hero_with_powers.id}, relationship_to_load=["powers"]
+            )
+        ]
+
+        # Assert
+        self.assertEqual(1, len(heroes))
+        self.assertEqual(2, len(heroes[0].powers))
+        self.assertIsInstance(heroes[0].powers[0], Power)
+
+    async def test_find_stream_reject_joined_and_subquery_load(self):
+        for strategy in ("joined", "subquery"):
+            with self.subTest(strategy=strategy):
+                # Assert
+                with self.assertRaises(ValueError):
+                    [hero async for hero in self.repo.find_stream(relationship_to_load={"powers": strategy})]
@@ -0,0 +1,71 @@
+from fastapi_pagination import Params
+from sqlalchemy import event
+
+from fastapi_core.database.database import DatabaseRole
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestProjection(TestRepository):
+    async def test_find_all_raw_return_dicts_of_columns(self):
+        # Arrange
+        heroes = await self.create_heroes(n=2)
+        statements = []
+        engine = self.database._connections[DatabaseRole.MASTER].sync_engine
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        # Act
+        rows = await self.repo.find_all(columns=["id", "name"], raw=True, order_by="id")
+
+        # Assert
+        self.assertEqual([{"id": hero.id, "name": hero.name} for hero in heroes], rows)
+        self.assertNotIn("created_at", statements[0])
+
+    async def test_find_all_columns_load_only(self):
+        # Arrange
+        await self.create_heroes(n=2)
+        statements = []
+        engine = self.database._connections[DatabaseRole.MASTER].sync_engine
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        # Act
+        heroes = await self.repo.find_all(columns=["name"])
+
+        # Assert
+        self.assertEqual(2, len(heroes))
+        self.assertTrue(all(hero.id and hero.name for hero in heroes))
+        self.assertNotIn("created_at", statements[0])
+
+    async def test_find_one_raw(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+
+        # Act
+        row = await self.repo.find_one(filters={"id": hero.id}, columns=["name"], raw=True)
+        not_found = await self.repo.find_one(filters={"id": 99}, raw=True)
+
+        # Assert
+        self.assertEqual({"name": hero.name}, row)
+        self.assertIsNone(not_found)
+
+    async def test_find_paginated_raw(self):
+        # Arrange
+        heroes = await self.create_heroes(n=3)
+
+        # Act
+        page = await self.repo.find_paginated(
+            params=Params(page=2, size=2), columns=["id"], raw=True, order_by="id", filters={"deleted_at": None}
+        )
+
+        # Assert
+        self.assertEqual(3, page.total)
+        self.assertEqual([{"id": heroes[2].id}], page.items)
+
+    async def test_invalid_column(self):
+        # Act and Assert
+        with self.assertRaises(ValueError):
+            await self.repo.find_all(columns=["foo"], raw=True)
+
+    async def test_raw_with_relationship_to_load(self):
+        # Act and Assert
+        with self.assertRaises(ValueError):
+            await self.repo.find_all(raw=True, relationship_to_load=["powers"])
@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+from starlette_context import request_cycle_context
+
+from tests.unit.repository.hero_model import Hero
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestReadRouting(TestRepository):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.factory_async_session_manager = self.database.factory_async_session_manager
+
+    async def test_read_use_read_only_by_default(self):
+        with patch.object(self.repo, "async_session_manager", wraps=self.factory_async_session_manager) as manager:
+            # Act
+            await self.repo.find_all()
+            await self.repo.count()
+
+            # Assert
+            for call in manager.call_args_list:
+                self.assertEqual({"read_only": True}, call.kwargs)
+
+    async def test_read_use_master_after_write_in_same_request(self):
+        with patch.object(self.repo, "async_session_manager", wraps=self.factory_async_session_manager) as manager:
+            with request_cycle_context({}):
+                # Act
+                await self.repo.find_one(filters={"id": 1})
+                await self.repo.create(Hero(name="foo"))
+                hero = await self.repo.find_one(filters={"id": 1})
+
+            # Assert
+            self.assertEqual("foo", hero.name)
+            self.assertEqual({"read_only": True}, manager.call_args_list[0].kwargs)
+            self.assertEqual({"read_only": False}, manager.call_args_list[2].kwargs)
+
+    async def test_read_with_override(self):
+        with patch.object(self.repo, "async_session_manager", wraps=self.factory_async_session_manager) as manager:
+            # Act
+            await self.repo.find_all(read_only=False)
+
+            # Assert
+            self.assertEqual({"read_only": False}, manager.call_args.kwargs)
+
+    async def test_read_with_read_from_replica_disabled(self):
+        # Arrange
+        self.repo.read_from_replica = False
+
+        with patch.object(self.repo, "async_session_manager", wraps=self.factory_async_session_manager) as manager:
+            # Act
+            await self.repo.find_all()
+
+            # Assert
+            self.assertEqual({"read_only": False}, manager.call_args.kwargs)
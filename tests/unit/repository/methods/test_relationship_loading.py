@@ -0,0 +1,109 @@
+from fastapi_pagination import Params
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+
+from fastapi_core.database.database import DatabaseRole
+from fastapi_core.repository import LoadStrategy
+from fastapi_core.repository.loading import build_load_plan
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestRelationshipLoading(TestRepository):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.statements = []
+        engine = self.database._connections[DatabaseRole.MASTER].sync_engine
+        event.listen(engine, "before_cursor_execute", lambda *args: self.statements.append(args[2]))
+
+    async def test_default_strategy_is_selectin(self):
+        # Arrange
+        hero = await self.create_hero_with_powers(n_powers=3)
+        self.statements.clear()
+
+        # Act
+        heroes = await self.repo.find_all(relationship_to_load=["powers"])
+
+        # Assert
+        self.assertEqual([hero.id], [item.id for item in heroes])
+        self.assertEqual(3, len(heroes[0].powers))
+        self.assertEqual(2, len(self.statements))
+        self.assertNotIn("JOIN", self.statements[0])
+        self.assertIn("IN", self.statements[1])
+
+    async def test_joined_strategy(self):
+        # Arrange
+        await self.create_hero_with_powers(n_powers=2)
+        self.statements.clear()
+
+        # Act
+        heroes = await self.repo.find_all(relationship_to_load={"powers": LoadStrategy.JOINED})
+
+        # Assert
+        self.assertEqual(2, len(heroes[0].powers))
+        self.assertEqual(1, len(self.statements))
+        self.assertIn("JOIN", self.statements[0])
+
+    async def test_find_paginated_with_collection_limit_heroes(self):
+        # Arrange
+        for _ in range(3):
+            await self.create_hero_with_powers(n_powers=3)
+
+        # Act
+        page = await self.repo.find_paginated(params=Params(page=1, size=2), relationship_to_load=["powers"])
+
+        # Assert
+        self.assertEqual(2, len(page.items))
+        self.assertTrue(page.has_next)
+        self.assertEqual([3, 3], [len(hero.powers) for hero in page.items])
+
+    async def test_nested_path(self):
+        # Arrange
+        hero = await self.create_hero_with_powers(n_powers=2)
+
+        # Act
+        found = await self.repo.find_one(filters={"id": hero.id}, relationship_to_load=["powers.hero"])
+
+        # Assert
+        self.assertEqual([hero.id, hero.id], [power.hero.id for power in found.powers])
+
+    async def test_raise_strategy(self):
+        # Arrange
+        hero = await self.create_hero_with_powers(n_powers=1)
+
+        # Act
+        found = await self.repo.find_one(filters={"id": hero.id}, relationship_to_load={"powers": "raise"})
+
+        # Assert
+        with self.assertRaises(InvalidRequestError):
+            _ = found.powers
+
+    async def test_invalid_relationship(self):
+        # Assert
+        with self.assertRaises(ValueError):
+            await self.repo.find_all(relationship_to_load=["foo"])
+        with self.assertRaises(ValueError):
+            await self.repo.find_all(relationship_to_load={"powers": "lazy"})
+
+    def test_load_plan_use_model_strategies(self):
+        # Act
+        plan = build_load_plan(
+            relationship_to_load=["powers", "items"],
+            default_strategy=LoadStrategy.SELECTIN,
+            model_strategies={"powers": "joined", "items": "raise", "owner": "raise", "tags": "subquery"},
+        )
+
+        # Assert
+        self.assertEqual(
+            {"powers": LoadStrategy.JOINED, "items": LoadStrategy.SELECTIN, "owner": LoadStrategy.RAISE}, plan
+        )
+
+    def test_load_plan_do_not_raise_parent_of_loaded_path(self):
+        # Act
+        plan = build_load_plan(
+            relationship_to_load={"powers.hero": "selectin"},
+            default_strategy=LoadStrategy.SELECTIN,
+            model_strategies={"powers": "raise"},
+        )
+
+        # Assert
+        self.assertEqual({"powers.hero": LoadStrategy.SELECTIN}, plan)
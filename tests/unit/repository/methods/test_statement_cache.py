@@ -0,0 +1,52 @@
+from fastapi_pagination import Params
+
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestStatementCache(TestRepository):
+    async def test_same_shape_reuse_statement(self):
+        # Arrange
+        heroes = await self.create_heroes(2)
+
+        # Act
+        first_hero = await self.repo.find_one(filters={"id": heroes[0].id})
+        second_hero = await self.repo.find_one(filters={"id": heroes[1].id})
+
+        # Assert
+        self.assertEqual(heroes[0].name, first_hero.name)
+        self.assertEqual(heroes[1].name, second_hero.name)
+        stats = self.repo.get_statement_cache_stats()
+        self.assertEqual(1, stats.misses)
+        self.assertEqual(1, stats.hits)
+        self.assertEqual(0.5, stats.hit_rate)
+
+    async def test_none_filter_is_other_shape(self):
+        # Arrange
+        heroes = await self.create_heroes(2)
+        deleted_hero = await self.repo.soft_delete_by_pk(pk=heroes[0].id)
+
+        # Act
+        not_deleted = await self.repo.find_all(filters={"deleted_at": None})
+        deleted = await self.repo.find_all(filters={"deleted_at": deleted_hero.deleted_at})
+
+        # Assert
+        self.assertEqual([heroes[1].id], [hero.id for hero in not_deleted])
+        self.assertEqual([heroes[0].id], [hero.id for hero in deleted])
+        self.assertEqual(2, self.repo.get_statement_cache_stats().misses)
+
+    async def test_find_paginated_pages_reuse_statement(self):
+        # Arrange
+        await self.create_heroes(5)
+
+        # Act
+        first_page = await self.repo.find_paginated(params=Params(page=1, size=2), order_by="id")
+        last_page = await self.repo.find_paginated(params=Params(page=3, size=2), order_by="id")
+
+        # Assert
+        self.assertEqual([1, 2], [hero.id for hero in first_page.items])
+        self.assertEqual([5], [hero.id for hero in last_page.items])
+        self.assertEqual(5, last_page.total)
+        stats = self.repo.get_statement_cache_stats()
+        self.assertEqual(2, stats.misses)
+        self.assertEqual(2, stats.hits)
+        self.assertEqual(2, stats.size)
@@ -1,6 +1,10 @@
 import unittest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 from faker import Faker
+from sqlalchemy.dialects import postgresql
 from sqlmodel import SQLModel
 
 from fastapi_core.database import Database
@@ -16,6 +20,31 @@ class HeroRepository(Repository):
         super().__init__(async_session_manager, model=Hero)
 
 
+class PostgresSessionMock:
+    def __init__(self, results: list[list[dict]] = None):
+        """
+        A session of Postgres without database, the statements executed are compiled with the dialect of Postgres
+        :param results: The rows returned by each execute, as dicts of column and value
+        """
+        self.bind = SimpleNamespace(dialect=postgresql.dialect())
+        self.info = {}
+        self.add = MagicMock()
+        self.statements = []
+        self.results = list(results or [])
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements.append(statement.compile(dialect=self.bind.dialect))
+        rows = self.results.pop(0) if self.results else []
+        return MagicMock(all=MagicMock(return_value=[SimpleNamespace(_mapping=row) for row in rows]), rowcount=1)
+
+    async def commit(self):
+        pass
+
+    @asynccontextmanager
+    async def session_manager(self, read_only: bool = False):
+        yield self
+
+
 class TestRepository(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self) -> None:
         self.database = Database(db_url="sqlite+aiosqlite:///./test.db")
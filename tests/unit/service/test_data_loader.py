@@ -0,0 +1,172 @@
+import asyncio
+from unittest.mock import patch
+
+from sqlalchemy import event
+from starlette_context import request_cycle_context
+
+from fastapi_core.database.database import DatabaseRole
+from fastapi_core.database.unit_of_work import UnitOfWork
+from fastapi_core.service import Service
+from fastapi_core.utils.exceptions import EntityNotFoundException
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestPkDataLoader(TestRepository):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.service = Service(repository=self.repo, pk_field="id")
+        self.statements = []
+        engine = self.database._connections[DatabaseRole.MASTER].sync_engine
+        event.listen(engine, "before_cursor_execute", lambda *args: self.statements.append(args[2]))
+
+    async def test_concurrent_get_by_pk_in_one_select(self):
+        # Arrange
+        heroes = await self.create_heroes(n=3)
+        self.statements.clear()
+
+        # Act
+        with request_cycle_context({}):
+            found_heroes = await asyncio.gather(*[self.service.get_by_pk(pk=hero.id) for hero in heroes])
+
+        # Assert
+        self.assertEqual([hero.name for hero in heroes], [hero.name for hero in found_heroes])
+        self.assertEqual(1, len(self.statements))
+        self.assertIn(" IN (", self.statements[0])
+
+    async def test_get_by_pk_is_memoized_in_request(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+        self.statements.clear()
+
+        # Act
+        with request_cycle_context({}):
+            first_hero = await self.service.get_by_pk(pk=hero.id)
+            second_hero = await self.service.get_by_pk(pk=hero.id)
+
+        # Assert
+        self.assertIs(first_hero, second_hero)
+        self.assertEqual(1, len(self.statements))
+
+    async def test_get_by_pk_not_found(self):
+        # Act and Assert
+        with request_cycle_context({}):
+            with self.assertRaises(EntityNotFoundException):
+                await self.service.get_by_pk(pk=1)
+
+    async def test_update_forget_memoized_pk(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+
+        # Act
+        with request_cycle_context({}):
+            await self.service.get_by_pk(pk=hero.id)
+            await self.service.update(pk=hero.id, obj_update={"name": "foo"})
+            updated_hero = await self.service.get_by_pk(pk=hero.id)
+
+        # Assert
+        self.assertEqual("foo", updated_hero.name)
+
+    async def test_get_many_by_pks_keep_order_and_ignore_not_found(self):
+        # Arrange
+        heroes = await self.create_heroes(n=3)
+        pks = [heroes[2].id, 99, heroes[0].id]
+
+        # Act
+        with request_cycle_context({}):
+            request_heroes = await self.service.get_many_by_pks(pks=pks)
+        found_heroes = await self.service.get_many_by_pks(pks=pks)
+
+        # Assert
+        self.assertEqual([heroes[2].id, heroes[0].id], [hero.id for hero in request_heroes])
+        self.assertEqual([heroes[2].id, heroes[0].id], [hero.id for hero in found_heroes])
+
+    async def test_get_by_pk_coerce_the_pk(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+
+        # Act
+        with request_cycle_context({}):
+            found_hero = await self.service.get_by_pk(pk=str(hero.id))
+            found_heroes = await self.service.get_many_by_pks(pks=[str(hero.id)])
+        heroes_outside_request = await self.service.get_many_by_pks(pks=[str(hero.id)])
+
+        # Assert
+        self.assertEqual(hero.id, found_hero.id)
+        self.assertEqual([hero.id], [hero.id for hero in found_heroes])
+        self.assertEqual([hero.id], [hero.id for hero in heroes_outside_request])
+
+    async def test_write_in_repository_forget_memoized_pks(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+
+        # Act
+        with request_cycle_context({}):
+            await self.service.get_by_pk(pk=hero.id)
+            await self.repo.update_by_filters(filters={"id": hero.id}, values={"name": "foo"})
+            updated_hero = await self.service.get_by_pk(pk=hero.id)
+
+        # Assert
+        self.assertEqual("foo", updated_hero.name)
+
+    async def test_batch_use_its_own_session_in_unit_of_work(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+
+        with request_cycle_context({}):
+            unit_of_work = UnitOfWork(database=self.database)
+            unit_of_work.begin_in_request()
+
+            # Act
+            found_hero = await self.service.get_by_pk(pk=hero.id)
+            session = unit_of_work._session
+            await unit_of_work.close()
+
+        # Assert
+        self.assertEqual(hero.id, found_hero.id)
+        self.assertIsNone(session)
+
+    async def test_get_by_pk_read_the_writes_of_unit_of_work(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+
+        with request_cycle_context({}):
+            unit_of_work = UnitOfWork(database=self.database)
+            unit_of_work.begin_in_request()
+
+            # Act
+            await self.service.get_by_pk(pk=hero.id)
+            await self.repo.update_by_filters(filters={"id": hero.id}, values={"name": "foo"})
+            updated_name = (await self.service.get_by_pk(pk=hero.id)).name
+            await unit_of_work.rollback()
+            await unit_of_work.close()
+
+        # Assert
+        self.assertEqual("foo", updated_name)
+
+    async def test_cancel_of_a_caller_do_not_cancel_the_others(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+
+        with request_cycle_context({}):
+            cancelled_task = asyncio.ensure_future(self.service.get_by_pk(pk=hero.id))
+            task = asyncio.ensure_future(self.service.get_by_pk(pk=hero.id))
+            await asyncio.sleep(0)
+
+            # Act
+            cancelled_task.cancel()
+            found_hero = await task
+
+        # Assert
+        self.assertEqual(hero.id, found_hero.id)
+        self.assertTrue(cancelled_task.cancelled())
+
+    async def test_cancelled_batch_do_not_leave_loads_waiting(self):
+        # Arrange
+        async def cancelled_get_many_by_pks(*args, **kwargs):
+            raise asyncio.CancelledError()
+
+        with request_cycle_context({}):
+            with patch.object(self.repo, "get_many_by_pks", cancelled_get_many_by_pks):
+                # Act and Assert
+                with self.assertRaises(asyncio.CancelledError):
+                    await asyncio.wait_for(self.service.get_by_pk(pk=1), timeout=1)
@@ -0,0 +1,141 @@
+import asyncio
+from unittest.mock import patch
+
+from sqlalchemy import event
+
+from fastapi_core.database.database import DatabaseRole
+from fastapi_core.repository import CreateCoalescer
+from fastapi_core.service import Service
+from fastapi_core.utils.exceptions import EntityNotFoundException
+from tests.unit.repository.hero_model import Hero, UpdateHero
+from tests.unit.repository.test_repository import TestRepository
+
+
+class TestServiceWrites(TestRepository):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.service = Service(repository=self.repo, pk_field="id", single_statement_writes=True)
+        self.statements = []
+        engine = self.database._connections[DatabaseRole.MASTER].sync_engine
+        event.listen(engine, "before_cursor_execute", lambda *args: self.statements.append(args[2]))
+
+    async def test_update_start_with_update_statement(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+        self.statements.clear()
+
+        # Act
+        updated_hero = await self.service.update(pk=hero.id, obj_update=UpdateHero(name="foo"))
+
+        # Assert
+        self.assertEqual("foo", updated_hero.name)
+        self.assertIsNotNone(updated_hero.updated_at)
+        self.assertTrue(self.statements[0].startswith("UPDATE hero SET"))
+        self.assertEqual("foo", (await self.repo.find_one(filters={"id": hero.id})).name)
+
+    async def test_update_not_found(self):
+        # Act and Assert
+        with self.assertRaises(EntityNotFoundException):
+            await self.service.update(pk=1, obj_update={"name": "foo"})
+
+    async def test_delete_in_one_statement(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+        self.statements.clear()
+
+        # Act
+        await self.service.delete(pk=hero.id)
+
+        # Assert
+        self.assertEqual(1, len(self.statements))
+        self.assertEqual(0, await self.repo.count())
+        with self.assertRaises(EntityNotFoundException):
+            await self.service.delete(pk=hero.id)
+
+    async def test_soft_delete_keep_first_deleted_at(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+
+        # Act
+        deleted_hero = await self.service.soft_delete(pk=hero.id)
+        deleted_again_hero = await self.service.soft_delete(pk=hero.id)
+
+        # Assert
+        self.assertIsNotNone(deleted_hero.deleted_at)
+        self.assertEqual(deleted_hero.deleted_at, deleted_again_hero.deleted_at)
+
+    async def test_undo_soft_delete(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+        await self.service.soft_delete(pk=hero.id)
+
+        # Act
+        restored_hero = await self.service.undo_soft_delete(pk=hero.id)
+
+        # Assert
+        self.assertIsNone(restored_hero.deleted_at)
+        with self.assertRaises(EntityNotFoundException):
+            await self.service.undo_soft_delete(pk=99)
+
+    async def test_update_and_delete_by_the_orm_by_default(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+        service = Service(repository=self.repo)
+
+        with patch.object(self.repo, "update", wraps=self.repo.update) as update, patch.object(
+            self.repo, "delete", wraps=self.repo.delete
+        ) as delete:
+            # Act
+            updated_hero = await service.update(pk=hero.id, obj_update={"name": "foo"})
+            deleted_hero = await service.soft_delete(pk=hero.id)
+            await service.delete(pk=hero.id)
+
+        # Assert
+        self.assertEqual("foo", updated_hero.name)
+        self.assertIsNotNone(deleted_hero.deleted_at)
+        self.assertEqual(2, update.call_count)
+        self.assertEqual(1, delete.call_count)
+        self.assertEqual(0, await self.repo.count())
+        with self.assertRaises(EntityNotFoundException):
+            await service.delete(pk=hero.id)
+
+    async def test_single_statement_writes_use_the_orm_with_events(self):
+        # Arrange
+        hero = (await self.create_heroes(n=1))[0]
+        updated_ids, deleted_ids = [], []
+
+        def before_update(mapper, connection, target):
+            updated_ids.append(target.id)
+
+        def before_delete(mapper, connection, target):
+            deleted_ids.append(target.id)
+
+        event.listen(Hero, "before_update", before_update)
+        event.listen(Hero, "before_delete", before_delete)
+        self.addCleanup(event.remove, Hero, "before_update", before_update)
+        self.addCleanup(event.remove, Hero, "before_delete", before_delete)
+
+        # Act
+        updated_hero = await self.service.update(pk=hero.id, obj_update={"name": "foo"})
+        deleted_hero = await self.service.soft_delete(pk=hero.id)
+        await self.service.delete(pk=hero.id)
+
+        # Assert
+        self.assertEqual("foo", updated_hero.name)
+        self.assertIsNotNone(deleted_hero.deleted_at)
+        self.assertEqual([hero.id, hero.id], updated_ids)
+        self.assertEqual([hero.id], deleted_ids)
+        with self.assertRaises(EntityNotFoundException):
+            await self.service.update(pk=hero.id, obj_update={"name": "bar"})
+
+    async def test_create_with_coalescer(self):
+        # Arrange
+        service = Service(repository=self.repo, create_coalescer=CreateCoalescer(repository=self.repo))
+
+        with patch.object(self.repo, "bulk_create", wraps=self.repo.bulk_create) as bulk_create:
+            # Act
+            heroes = await asyncio.gather(service.create(Hero(name="foo")), service.create(Hero(name="bar")))
+
+        # Assert
+        self.assertEqual(["foo", "bar"], [hero.name for hero in heroes])
+        self.assertEqual(1, bulk_create.call_count)
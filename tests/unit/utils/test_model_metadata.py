@@ -0,0 +1,51 @@
+import unittest
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from fastapi_core.utils.model_metadata import get_model_metadata
+from tests.unit.repository.hero_model import Hero, Villain
+
+
+class HeroSchema(BaseModel):
+    id: int
+    name: str = Field(title="Hero name")
+
+
+class TestModelMetadata(unittest.TestCase):
+    def test_table_model_metadata(self):
+        # Act
+        metadata = get_model_metadata(Hero)
+
+        # Assert
+        self.assertIs(metadata, get_model_metadata(Hero))
+        self.assertEqual("id", metadata.primary_key.key)
+        self.assertIn("name", metadata.column_names)
+        self.assertIn("id", metadata.indexed_columns)
+        self.assertEqual(frozenset({"powers"}), metadata.relationships)
+        self.assertTrue(metadata.is_filterable("powers"))
+        self.assertFalse(metadata.is_filterable("soft_delete"))
+        self.assertEqual(1, metadata.coerce("id", "1"))
+        self.assertEqual(datetime(2023, 1, 1), metadata.coerce("created_at", "2023-01-01T00:00:00"))
+
+    def test_metadata_keyed_by_attribute_name(self):
+        # Act
+        metadata = get_model_metadata(Villain)
+
+        # Assert
+        self.assertEqual(frozenset({"id", "name"}), metadata.column_names)
+        self.assertEqual("villain_name", metadata.columns["name"].name)
+        self.assertEqual("id", metadata.attribute_name(metadata.primary_key))
+        self.assertIn("name", metadata.indexed_columns)
+        self.assertTrue(metadata.is_filterable("name"))
+        self.assertFalse(metadata.is_filterable("villain_name"))
+
+    def test_schema_metadata(self):
+        # Act
+        metadata = get_model_metadata(HeroSchema)
+
+        # Assert
+        self.assertEqual(("id", "Hero name"), metadata.csv_headers)
+        self.assertEqual(frozenset(), metadata.column_names)
+        with self.assertRaises(ValueError):
+            _ = metadata.primary_key